@@ -0,0 +1,205 @@
+// Clientside node selection for apps/week3_attack_target_graph_dash.py.
+//
+// Mirrors `selection_overlay` in the app: the server sends the figure plus a
+// `selection-context` (local CSR adjacency of the visible subgraph and the base
+// status line, plus a uniform grid of node positions for near-miss clicks), and
+// clicks are resolved and highlighted here without a request.
+// Trace order follows `build_figure`: dim edges, highlighted edges, edge hover
+// points, sponsors, targets. Sponsors are local nodes [0, n_sponsors), then targets.
+// Clicks also set `evidence-focus` (a node, or an edge clicked away from any
+// node) for the server-side evidence drill-down panel.
+// Picking an `entity-search` result selects that node the same way.
+(function () {
+  var EDGE_DIM = 0, EDGE_HI = 1, SPONSORS = 3, TARGETS = 4;
+  var HI_OPACITY = 0.98, DIM_OPACITY = 0.14;
+  // Per-context derived arrays; a new context object arrives with every rebuilt figure.
+  var derived = new WeakMap();
+
+  function nodeTraces(figure) {
+    if (!figure || !figure.data || figure.data.length <= TARGETS) return null;
+    return [figure.data[SPONSORS], figure.data[TARGETS]];
+  }
+
+  function resolveClickedNode(clickData, figure, context) {
+    if (!clickData || !clickData.points || !clickData.points.length) return null;
+    var point = clickData.points[0];
+    var cd = point.customdata;
+    if (cd && cd.length === 2) return {name: String(cd[0]), type: String(cd[1])};
+
+    // Fallback: edge hover point may capture click near a large node.
+    // Resolve to the nearest visible node within the click radius using the server-built
+    // grid, whose cell side equals that radius, so only the 3x3 cells around the click can match.
+    var traces = nodeTraces(figure);
+    if (!traces || !context || point.x == null || point.y == null) return null;
+    var g = contextArrays(context, traces), grid = context.click_grid;
+    var ci = Math.floor((point.x - grid.origin[0]) / grid.cell);
+    var cj = Math.floor((point.y - grid.origin[1]) / grid.cell);
+    var best = -1, bestD2 = grid.cell * grid.cell;
+    for (var j = Math.max(cj - 1, 0); j <= Math.min(cj + 1, grid.shape[1] - 1); j++) {
+      for (var i = Math.max(ci - 1, 0); i <= Math.min(ci + 1, grid.shape[0] - 1); i++) {
+        var k = j * grid.shape[0] + i;
+        for (var p = grid.ptr[k]; p < grid.ptr[k + 1]; p++) {
+          var node = grid.points[p];
+          var dx = g.x[node] - point.x, dy = g.y[node] - point.y, d2 = dx * dx + dy * dy;
+          // Ties go to the lower local id (trace order), as in a linear scan.
+          if (d2 < bestD2 || (d2 === bestD2 && (best < 0 || node < best))) { bestD2 = d2; best = node; }
+        }
+      }
+    }
+    if (best < 0) return null;
+    var nodeCd = best < context.n_sponsors ? traces[0].customdata[best] : traces[1].customdata[best - context.n_sponsors];
+    return {name: String(nodeCd[0]), type: String(nodeCd[1])};
+  }
+
+  // Edge hover points carry [sponsor, target, "edge"].
+  function clickedEdge(clickData) {
+    var cd = clickData && clickData.points && clickData.points.length ? clickData.points[0].customdata : null;
+    if (!cd || cd.length !== 3 || cd[2] !== "edge") return null;
+    return {sponsor: String(cd[0]), target: String(cd[1])};
+  }
+
+  // Evidence for the clicked node while it is selected, else for the most recent remaining seed.
+  function nodeFocus(selected, clicked) {
+    var kept = selected.filter(function (seed) { return seed.name === clicked.name && seed.type === clicked.type; });
+    if (kept.length) return {name: kept[0].name, type: kept[0].type};
+    var last = selected[selected.length - 1];
+    return last ? {name: last.name, type: last.type} : null;
+  }
+
+  function nextSeeds(seeds, clicked, interactionMode) {
+    seeds = (seeds || []).slice();
+    var same = function (seed) { return seed.name === clicked.name && seed.type === clicked.type; };
+    if (interactionMode === "accumulate") {
+      if (seeds.some(same)) return seeds.filter(function (seed) { return !same(seed); });
+      seeds.push(clicked);
+      return seeds;
+    }
+    // Single-select mode (Neighbor Highlight)
+    if (seeds.length && same(seeds[0])) return [];
+    return [clicked];
+  }
+
+  function contextArrays(context, traces) {
+    var cached = derived.get(context);
+    if (cached) return cached;
+    var nNodes = context.out_ptr.length - 1, nEdges = context.out_edges.length;
+    var src = new Int32Array(nEdges), dst = new Int32Array(nEdges), i, k;
+    for (i = 0; i < nNodes; i++) {
+      for (k = context.out_ptr[i]; k < context.out_ptr[i + 1]; k++) src[context.out_edges[k]] = i;
+      for (k = context.in_ptr[i]; k < context.in_ptr[i + 1]; k++) dst[context.in_edges[k]] = i;
+    }
+    var x = [].concat(traces[0].x, traces[1].x), y = [].concat(traces[0].y, traces[1].y);
+    var local = new Map();
+    [].concat(traces[0].customdata, traces[1].customdata).forEach(function (cd, j) { local.set(String(cd[0]), j); });
+    cached = {nNodes: nNodes, nEdges: nEdges, src: src, dst: dst, x: x, y: y, local: local};
+    derived.set(context, cached);
+    return cached;
+  }
+
+  function lineCoords(g, keep) {
+    var xs = [], ys = [];
+    for (var e = 0; e < g.nEdges; e++) {
+      if (!keep(e)) continue;
+      xs.push(g.x[g.src[e]], g.x[g.dst[e]], null);
+      ys.push(g.y[g.src[e]], g.y[g.dst[e]], null);
+    }
+    return [xs, ys];
+  }
+
+  // Figure and status line for `seeds`; the figure is copied only where it changes.
+  function applySelection(figure, context, seeds, interactionMode) {
+    var noUpdate = window.dash_clientside.no_update;
+    var traces = nodeTraces(figure);
+    if (!traces || !context) return [noUpdate, noUpdate];
+    var g = contextArrays(context, traces);
+
+    var active = (seeds || []).slice();
+    if (interactionMode === "highlight" && active.length) active = active.slice(0, 1);
+    var hiNodes = new Uint8Array(g.nNodes), hiEdges = new Uint8Array(g.nEdges), visibleSeeds = 0;
+    if (interactionMode === "highlight" || interactionMode === "accumulate") {
+      active.forEach(function (seed) {
+        var node = g.local.get(seed.name);
+        if (node === undefined) return;
+        visibleSeeds += 1;
+        var ptr, edges, other;
+        // Sponsor seeds reach their targets through out-edges, target seeds their sponsors through in-edges.
+        if (seed.type === "sponsor") { ptr = context.out_ptr; edges = context.out_edges; other = g.dst; }
+        else if (seed.type === "target") { ptr = context.in_ptr; edges = context.in_edges; other = g.src; }
+        else return;
+        hiNodes[node] = 1;
+        for (var k = ptr[node]; k < ptr[node + 1]; k++) { hiEdges[edges[k]] = 1; hiNodes[other[edges[k]]] = 1; }
+      });
+    }
+    var hasSelection = visibleSeeds > 0;
+
+    var dim = hasSelection ? lineCoords(g, function (e) { return !hiEdges[e]; }) : [[], []];
+    var hi = lineCoords(g, function (e) { return !hasSelection || hiEdges[e]; });
+    var opacity = function (offset, n) {
+      var out = new Array(n);
+      for (var i = 0; i < n; i++) out[i] = !hasSelection || hiNodes[offset + i] ? HI_OPACITY : DIM_OPACITY;
+      return out;
+    };
+    var nSponsors = context.n_sponsors;
+    var data = figure.data.slice();
+    data[EDGE_DIM] = Object.assign({}, data[EDGE_DIM], {x: dim[0], y: dim[1]});
+    data[EDGE_HI] = Object.assign({}, data[EDGE_HI], {x: hi[0], y: hi[1]});
+    data[SPONSORS] = Object.assign({}, data[SPONSORS], {
+      marker: Object.assign({}, data[SPONSORS].marker, {opacity: opacity(0, nSponsors)})
+    });
+    data[TARGETS] = Object.assign({}, data[TARGETS], {
+      marker: Object.assign({}, data[TARGETS].marker, {opacity: opacity(nSponsors, g.nNodes - nSponsors)})
+    });
+
+    var status = context.status;
+    if (hasSelection) {
+      if (interactionMode === "accumulate") status += " | Active seed nodes: " + visibleSeeds;
+      else status += " | Highlight selection: " + active[0].name + " (" + active[0].type + ")";
+    }
+    return [Object.assign({}, figure, {data: data}), status];
+  }
+
+  window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    week3: {
+      selectClickedNode: function (clickData, figure, context, seeds, interactionMode) {
+        var noUpdate = window.dash_clientside.no_update;
+        var clicked = resolveClickedNode(clickData, figure, context);
+        if (clicked === null) {
+          var edge = clickedEdge(clickData);
+          return [noUpdate, noUpdate, noUpdate, null, edge === null ? noUpdate : edge];
+        }
+        var selected = nextSeeds(seeds, clicked, interactionMode);
+        return [selected].concat(applySelection(figure, context, selected, interactionMode), [null, nodeFocus(selected, clicked)]);
+      },
+      // `viewport` store for level-of-detail mode: {x: [x0, x1] | null, y: ...}, null when not zoomed.
+      // Relayout events without axis ranges (autosize, dragmode) leave it unchanged.
+      viewportFromRelayout: function (relayoutData, current) {
+        if (!relayoutData) return window.dash_clientside.no_update;
+        var next = Object.assign({x: null, y: null}, current), changed = false;
+        ["x", "y"].forEach(function (axis) {
+          var key = axis + "axis";
+          if (relayoutData[key + ".autorange"]) { next[axis] = null; changed = true; }
+          var range = relayoutData[key + ".range"];
+          if (!range && (key + ".range[0]") in relayoutData && (key + ".range[1]") in relayoutData) {
+            range = [relayoutData[key + ".range[0]"], relayoutData[key + ".range[1]"]];
+          }
+          if (range) { next[axis] = [range[0], range[1]]; changed = true; }
+        });
+        if (!changed) return window.dash_clientside.no_update;
+        return next.x === null && next.y === null ? null : next;
+      },
+      // `entity-search` values are "<type>:<name>"; an already selected node stays selected.
+      selectSearchResult: function (value, figure, context, seeds, interactionMode) {
+        var noUpdate = window.dash_clientside.no_update;
+        if (!value) return [noUpdate, noUpdate, noUpdate, noUpdate, noUpdate];
+        var split = value.indexOf(":");
+        var picked = {name: value.slice(split + 1), type: value.slice(0, split)};
+        var isPicked = function (seed) { return seed.name === picked.name && seed.type === picked.type; };
+        var selected = (seeds || []).some(isPicked) ? seeds.slice() : nextSeeds(seeds, picked, interactionMode);
+        return [selected].concat(applySelection(figure, context, selected, interactionMode), [picked, null]);
+      },
+      clearSelection: function (nClicks, figure, context, interactionMode) {
+        return [[]].concat(applySelection(figure, context, [], interactionMode), [null, null]);
+      }
+    }
+  });
+})();
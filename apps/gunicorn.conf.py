@@ -0,0 +1,43 @@
+"""Gunicorn settings for the Week 3 Dash app.
+
+    gunicorn -c apps/gunicorn.conf.py
+
+The app module is imported once in the master (`preload_app`), so runtime
+loading (bundle or CSVs, layout, graph arrays) happens a single time and
+workers share those pages copy-on-write. Collection is disabled while loading
+and the loaded objects are frozen before forking, so workers' garbage
+collection does not write to (and thereby copy) the shared heap.
+"""
+
+import gc
+import os
+import sys
+
+wsgi_app = "week3_attack_target_graph_dash:server"
+chdir = os.path.dirname(os.path.abspath(__file__))
+preload_app = True
+workers = int(os.getenv("DELTA_WORKERS", "4"))
+threads = int(os.getenv("DELTA_THREADS", "1"))
+bind = f"{os.getenv('DELTA_HOST', '127.0.0.1')}:{os.getenv('DELTA_PORT', '8050')}"
+
+# Tells the app module not to start its reload watcher in the master; each worker starts one.
+os.environ["DELTA_PRELOAD"] = "1"
+
+# Avoid freed "holes" in pages the workers will share.
+gc.disable()
+
+
+def pre_fork(server, worker):
+    app_module = sys.modules.get("week3_attack_target_graph_dash")
+    prewarm = getattr(app_module, "PREWARM_THREAD", None)
+    if prewarm is not None:
+        # Workers then inherit (and share) a fully warmed figure cache.
+        prewarm.join()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
+    # Threads do not survive fork. Each worker's watcher reloads on input or reload-marker changes;
+    # the first to reload rebuilds a stale bundle and the others map it.
+    sys.modules["week3_attack_target_graph_dash"].start_runtime_watcher()
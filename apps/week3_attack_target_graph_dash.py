@@ -3,17 +3,74 @@
 
 from __future__ import annotations
 
+import hmac
 import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
 
 import dash
-from dash import Input, Output, State, dcc, html
-import networkx as nx
+import flask
+from dash import ClientsideFunction, Input, Output, State, dash_table, dcc, html
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
+import plotly.io as pio
 
 try:
+    from .week3_callback_metrics import MetricsRegistry, add_stage, record, stage
+    from .week3_evidence import EVIDENCE_PAGE_SIZE, open_evidence_store
+    from .week3_entity_search import EntitySearch
+    from .week3_figure_cache import FigureCache, figure_cache_key
+    from .week3_graph_arrays import (
+        GraphArrays,
+        build_graph_arrays,
+        edge_weights,
+        filter_edges,
+        grid_cell_range,
+        hidden_node_clusters,
+        local_csr,
+        neighborhood,
+        point_grid,
+        points_in_cells,
+        visible_subgraph,
+    )
+    from .week3_profiling import Profiler
+    from .week3_runtime_bundle import (
+        load_runtime_bundle,
+        refresh_runtime_bundle,
+        runtime_bundle_problem,
+        source_signature,
+    )
+    from .week3_runtime_data import build_runtime_from_sources
     from .week3_runtime_paths import RuntimePaths, resolve_runtime_paths
 except ImportError:
+    from week3_callback_metrics import MetricsRegistry, add_stage, record, stage
+    from week3_evidence import EVIDENCE_PAGE_SIZE, open_evidence_store
+    from week3_entity_search import EntitySearch
+    from week3_figure_cache import FigureCache, figure_cache_key
+    from week3_graph_arrays import (
+        GraphArrays,
+        build_graph_arrays,
+        edge_weights,
+        filter_edges,
+        grid_cell_range,
+        hidden_node_clusters,
+        local_csr,
+        neighborhood,
+        point_grid,
+        points_in_cells,
+        visible_subgraph,
+    )
+    from week3_profiling import Profiler
+    from week3_runtime_bundle import (
+        load_runtime_bundle,
+        refresh_runtime_bundle,
+        runtime_bundle_problem,
+        source_signature,
+    )
+    from week3_runtime_data import build_runtime_from_sources
     from week3_runtime_paths import RuntimePaths, resolve_runtime_paths
 
 PARTY_COLORS = {
@@ -34,6 +91,23 @@ TARGET_PARTY_COLORS = {
     "UNKNOWN": "#9e9e9e",
 }
 
+# Resolved once; figures are built as plain dicts (see `build_figure`).
+PLOT_TEMPLATE = pio.templates["plotly_white"].to_plotly_json()
+
+# Near-miss click radius as a fraction of the visible layout span.
+NEAR_NODE_FRACTION = 0.06
+
+# Level-of-detail mode: hidden nodes are aggregated on a grid of this many cells per view side.
+LOD_CLUSTER_CELLS = 24
+
+# Seconds between checks of the pipeline inputs for hot reload (0 disables the watcher).
+RELOAD_INTERVAL = float(os.getenv("DELTA_RELOAD_INTERVAL", "0"))
+# Enables `POST <base path>_reload` when set; requests must send it as `X-Reload-Token`.
+RELOAD_TOKEN = os.getenv("DELTA_RELOAD_TOKEN", "").strip()
+
+# Filter states whose figure base is kept in memory (0 disables the cache).
+FIGURE_CACHE_SIZE = int(os.getenv("DELTA_FIGURE_CACHE_SIZE", "32"))
+
 LABEL_COLORS = {
     "PERSON": "#1f77b4",
     "ORG": "#d62728",
@@ -43,371 +117,175 @@ LABEL_COLORS = {
 }
 
 
-def resolve_clicked_node(
-    click_data: dict | None,
-    figure: dict | None,
-) -> tuple[str, str] | None:
-    if not click_data or "points" not in click_data or not click_data["points"]:
-        return None
-
-    point = click_data["points"][0]
-    customdata = point.get("customdata")
-    if customdata and len(customdata) == 2:
-        return str(customdata[0]), str(customdata[1])
-
-    # Fallback: edge hover point may capture click near a large node.
-    # Resolve to nearest visible node if within a small layout-distance threshold.
-    if not figure:
-        return None
-    px = point.get("x")
-    py = point.get("y")
-    if px is None or py is None:
-        return None
-
-    node_points: list[tuple[float, float, str, str]] = []
-    for trace in figure.get("data", []):
-        if trace.get("name") not in {"Sponsors", "Targets"}:
-            continue
-        xs = trace.get("x", [])
-        ys = trace.get("y", [])
-        cds = trace.get("customdata", [])
-        for x, y, cd in zip(xs, ys, cds):
-            if not cd or len(cd) != 2:
-                continue
-            node_points.append((float(x), float(y), str(cd[0]), str(cd[1])))
-
-    if not node_points:
-        return None
-
-    x_vals = [x for x, _, _, _ in node_points]
-    y_vals = [y for _, y, _, _ in node_points]
-    span = max(max(x_vals) - min(x_vals), max(y_vals) - min(y_vals), 1e-9)
-    threshold = 0.06 * span
-    threshold_sq = threshold * threshold
-
-    best = None
-    best_dist_sq = float("inf")
-    for x, y, name, ntype in node_points:
-        d2 = (x - float(px)) ** 2 + (y - float(py)) ** 2
-        if d2 < best_dist_sq:
-            best_dist_sq = d2
-            best = (name, ntype)
-
-    if best is None or best_dist_sq > threshold_sq:
-        return None
-    return best
+def reload_marker_path(paths: RuntimePaths) -> Path:
+    # Rewritten by `POST <base path>_reload`; every worker's watcher sees it change.
+    return paths.edges_path.parent / ".week3_dash_reload"
 
 
-def mode(series: pd.Series, default: str = "UNKNOWN") -> str:
-    s = series.dropna().astype(str)
-    if s.empty:
-        return default
-    m = s.mode()
-    if m.empty:
-        return default
-    return str(m.iloc[0]).strip() or default
+def watched_signature(paths: RuntimePaths) -> dict[str, dict[str, object]]:
+    """Pipeline input signature plus the reload marker's, as compared by the reload watcher."""
+    signature = source_signature(paths)
+    marker = reload_marker_path(paths)
+    if marker.exists():
+        stat = marker.stat()
+        signature["reload_marker"] = {"path": str(marker), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return signature
 
 
-def infer_target_party(edges: pd.DataFrame) -> pd.Series:
-    grouped = (
-        edges.groupby(["canonical_entity_v1_1", "sponsor_party"], as_index=False)["mention_count"]
-        .sum()
-        .sort_values(["canonical_entity_v1_1", "mention_count"], ascending=[True, False])
+def load_runtime_data(paths: RuntimePaths) -> dict[str, object]:
+    # Taken first, so inputs rewritten while loading still count as changed for the reload watcher.
+    signature = watched_signature(paths)
+    # A current bundle (scripts/week3_build_runtime_bundle_v1_1.py) is memory-mapped;
+    # otherwise fall back to rebuilding everything from the pipeline CSVs.
+    runtime = None
+    if paths.runtime_bundle_dir is not None:
+        problem = runtime_bundle_problem(paths.runtime_bundle_dir, paths)
+        if problem is None:
+            runtime = load_runtime_bundle(paths.runtime_bundle_dir)
+        else:
+            print(f"runtime bundle skipped: {problem}; loading from CSV inputs", file=sys.stderr)
+    if runtime is None:
+        runtime = build_runtime_from_sources(paths)
+    # Callback hot path: integer-indexed edge/node arrays instead of per-request frames and graphs.
+    runtime["arrays"] = build_graph_arrays(
+        runtime["edges"], runtime["node_table"], runtime["positions"], runtime["edge_days"]  # type: ignore[arg-type]
     )
-    out: dict[str, str] = {}
-    for target, g in grouped.groupby("canonical_entity_v1_1"):
-        top_count = g["mention_count"].max()
-        winners = g[g["mention_count"] == top_count]["sponsor_party"].tolist()
-        out[target] = winners[0] if len(winners) == 1 else "UNKNOWN"
-    return pd.Series(out, name="target_party_inferred")
+    runtime["search"] = EntitySearch(runtime["search_index"])  # type: ignore[arg-type]
+    runtime["figure_cache"] = FigureCache(FIGURE_CACHE_SIZE)
+    runtime["source_signature"] = signature
+    # Optional: without it the drill-down panel asks for a cleaning-script rerun.
+    try:
+        runtime["evidence"] = open_evidence_store(paths.evidence_path, paths.evidence_index_path)
+    except (OSError, ValueError) as exc:
+        print(f"evidence store skipped: {exc}", file=sys.stderr)
+        runtime["evidence"] = None
+    return runtime
 
 
-def scale_series(values: pd.Series, lo: float = 8, hi: float = 42) -> pd.Series:
-    if values.empty:
+def scale_array(values: np.ndarray, lo: float = 8, hi: float = 42) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
         return values
     vmin = float(values.min())
     vmax = float(values.max())
     if vmax == vmin:
-        return pd.Series([(lo + hi) / 2.0] * len(values), index=values.index)
+        return np.full(values.shape, (lo + hi) / 2.0)
     return lo + (values - vmin) * (hi - lo) / (vmax - vmin)
 
 
-def load_runtime_data(paths: RuntimePaths) -> dict[str, object]:
-    edges = pd.read_csv(paths.edges_path).copy()
-    nodes = pd.read_csv(paths.nodes_path).copy()
-    mentions = pd.read_csv(paths.mentions_path, compression="gzip").copy()
-    harmonized = pd.read_csv(
-        paths.harmonized_path,
-        compression="gzip",
-        usecols=["platform", "ad_id", "spend_proxy"],
-    ).copy()
-
-    sponsor_party = (
-        mentions.groupby("sponsor_name", as_index=False)
-        .agg(sponsor_party=("party_std", lambda s: mode(s, default="UNKNOWN")))
-    )
-    sponsor_party["sponsor_party"] = sponsor_party["sponsor_party"].replace("", "UNKNOWN")
-    edges = edges.merge(sponsor_party, on="sponsor_name", how="left")
-    edges["sponsor_party"] = edges["sponsor_party"].fillna("UNKNOWN")
-
-    target_party = infer_target_party(edges)
-    edges["target_party_inferred"] = edges["canonical_entity_v1_1"].map(target_party).fillna("UNKNOWN")
-
-    target_mentions = mentions[mentions["is_target_v1_1"]].copy()
-    target_mentions = target_mentions[
-        ["platform", "ad_id", "sponsor_name", "canonical_entity_v1_1", "party_std"]
-    ].drop_duplicates()
-
-    spend_ads = harmonized[["platform", "ad_id", "spend_proxy"]].copy()
-    spend_ads["spend_proxy"] = pd.to_numeric(spend_ads["spend_proxy"], errors="coerce").fillna(0.0)
-    target_mentions = target_mentions.merge(spend_ads, on=["platform", "ad_id"], how="left")
-    target_mentions["spend_proxy"] = target_mentions["spend_proxy"].fillna(0.0)
-
-    sponsor_attack_spend = (
-        target_mentions.drop_duplicates(subset=["sponsor_name", "platform", "ad_id"])
-        .groupby("sponsor_name")["spend_proxy"]
-        .sum()
-    )
-
-    target_received_spend = (
-        target_mentions.drop_duplicates(subset=["canonical_entity_v1_1", "platform", "ad_id"])
-        .groupby("canonical_entity_v1_1")["spend_proxy"]
-        .sum()
-    )
-
-    edge_attack_spend = (
-        target_mentions.drop_duplicates(subset=["sponsor_name", "canonical_entity_v1_1", "platform", "ad_id"])
-        .groupby(["sponsor_name", "canonical_entity_v1_1"])["spend_proxy"]
-        .sum()
-        .rename("edge_attack_spend")
-        .reset_index()
-    )
-    edges = edges.merge(edge_attack_spend, on=["sponsor_name", "canonical_entity_v1_1"], how="left")
-    edges["edge_attack_spend"] = edges["edge_attack_spend"].fillna(0.0)
-
-    target_node_meta = (
-        nodes.groupby("canonical_entity_v1_1", as_index=False)
-        .agg(
-            target_label=("label_mode", lambda s: mode(s, default="UNKNOWN")),
-            target_mentions=("mention_count", "max"),
-            target_ads=("ad_count", "max"),
-            target_sponsors=("sponsor_count", "max"),
-            target_platforms=("platform_count", "max"),
-        )
-        .set_index("canonical_entity_v1_1")
-    )
-
-    full_graph = nx.DiGraph()
-    for row in edges.itertuples(index=False):
-        full_graph.add_edge(
-            row.sponsor_name,
-            row.canonical_entity_v1_1,
-            mention_count=int(row.mention_count),
-            ad_count=int(row.ad_count),
-            party_mode=str(row.party_mode),
-            tone_mode=str(row.tone_mode),
-            sponsor_party=str(row.sponsor_party),
-            target_party_inferred=str(row.target_party_inferred),
-            edge_attack_spend=float(row.edge_attack_spend),
-        )
-
-    for node in list(full_graph.nodes()):
-        if node in target_node_meta.index:
-            meta = target_node_meta.loc[node]
-            full_graph.nodes[node]["node_type"] = "target"
-            full_graph.nodes[node]["label_mode"] = str(meta["target_label"])
-            full_graph.nodes[node]["party"] = str(target_party.get(node, "UNKNOWN"))
-            full_graph.nodes[node]["mention_count"] = int(meta["target_mentions"])
-            full_graph.nodes[node]["ad_count"] = int(meta["target_ads"])
-            full_graph.nodes[node]["sponsor_count"] = int(meta["target_sponsors"])
-            full_graph.nodes[node]["platform_count"] = int(meta["target_platforms"])
-            full_graph.nodes[node]["target_received_spend"] = float(target_received_spend.get(node, 0.0))
-            full_graph.nodes[node]["sponsor_attack_spend"] = 0.0
-        else:
-            full_graph.nodes[node]["node_type"] = "sponsor"
-            full_graph.nodes[node]["label_mode"] = "SPONSOR"
-            full_graph.nodes[node]["party"] = str(sponsor_party.set_index("sponsor_name").get("sponsor_party", pd.Series()).get(node, "UNKNOWN"))
-            full_graph.nodes[node]["mention_count"] = 0
-            full_graph.nodes[node]["ad_count"] = 0
-            full_graph.nodes[node]["sponsor_count"] = 0
-            full_graph.nodes[node]["platform_count"] = 0
-            full_graph.nodes[node]["target_received_spend"] = 0.0
-            full_graph.nodes[node]["sponsor_attack_spend"] = float(sponsor_attack_spend.get(node, 0.0))
-
-    try:
-        positions = nx.spring_layout(full_graph, seed=42, k=0.42)
-    except ModuleNotFoundError as exc:
-        if exc.name != "scipy":
-            raise
-        positions = nx.random_layout(full_graph, seed=42)
-
-    return {
-        "edges": edges,
-        "graph": full_graph,
-        "positions": positions,
-        "sponsor_parties": sorted(edges["sponsor_party"].dropna().unique().tolist()),
-        "target_parties": sorted(edges["target_party_inferred"].dropna().unique().tolist()),
-    }
-
-
-def build_figure(
+def edge_line_coords(pos: np.ndarray, src: np.ndarray, dst: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """`x0, x1, NaN` per edge so one line trace draws every edge."""
+    seg = np.full((len(src), 3, 2), np.nan)
+    seg[:, 0] = pos[src]
+    seg[:, 1] = pos[dst]
+    return seg[:, :, 0].ravel(), seg[:, :, 1].ravel()
+
+
+@dataclass(frozen=True)
+class FigureBase:
+    """Selection-independent figure parts for one filter state (cached, read-only)."""
+
+    node_ids: np.ndarray
+    edge_ids: np.ndarray
+    is_sponsor: np.ndarray
+    edge_x: np.ndarray
+    edge_y: np.ndarray
+    edge_hover_trace: dict
+    sponsor_trace: dict
+    target_trace: dict
+    layout: dict
+    status: str
+    # Level-of-detail mode only: aggregated markers for filtered nodes left out of the view.
+    cluster_trace: dict | None
+    # Local CSR and click grid over the visible subgraph for the clientside selection
+    # callbacks: sponsors are local nodes [0, n_sponsors) in trace order, then targets.
+    adjacency: dict
+
+
+def build_figure_base(
     runtime: dict[str, object],
     sponsor_party_filter: list[str],
     target_party_filter: list[str],
     node_type_visible: list[str],
     color_mode: str,
     size_mode: str,
-    interaction_mode: str,
     min_edge_mentions: int,
     top_n_edges: int,
-    selected_nodes: list[dict[str, str]] | None,
-) -> tuple[go.Figure, str]:
-    edges: pd.DataFrame = runtime["edges"]  # type: ignore[assignment]
-    base_graph: nx.DiGraph = runtime["graph"]  # type: ignore[assignment]
-    pos: dict[str, tuple[float, float]] = runtime["positions"]  # type: ignore[assignment]
-
-    ef = edges.copy()
-    ef = ef[ef["mention_count"] >= int(min_edge_mentions)]
-    if sponsor_party_filter:
-        ef = ef[ef["sponsor_party"].isin(sponsor_party_filter)]
-    if target_party_filter:
-        ef = ef[ef["target_party_inferred"].isin(target_party_filter)]
-    ef = ef.sort_values("mention_count", ascending=False)
-    ef = ef.head(int(top_n_edges))
+    level_of_detail: bool = False,
+    viewport: tuple[int, int, int, int] | None = None,
+    date_window: tuple[int, int] | None = None,
+) -> FigureBase | None:
+    """Filtered subgraph, hover text, colors and sizes; None when no node is visible.
+
+    In level-of-detail mode the Top N budget goes to edges touching nodes inside
+    `viewport` (cell bounds on `arrays.view_grid`, None for the whole layout),
+    and the remaining filtered nodes in view are drawn as grid-cell clusters.
+    With `date_window` (cube day offsets), edge thresholds, order and hover
+    values use the mentions, ads and spend inside the window.
+    """
+    arrays: GraphArrays = runtime["arrays"]  # type: ignore[assignment]
 
     sponsors_visible = "sponsor" in node_type_visible
     targets_visible = "target" in node_type_visible
 
-    graph = nx.DiGraph()
-    for row in ef.itertuples(index=False):
-        graph.add_edge(
-            row.sponsor_name,
-            row.canonical_entity_v1_1,
-            mention_count=int(row.mention_count),
-            ad_count=int(row.ad_count),
-            edge_attack_spend=float(row.edge_attack_spend),
-            sponsor_party=str(row.sponsor_party),
-            target_party_inferred=str(row.target_party_inferred),
+    with stage("filter"):
+        view_mask = None
+        if level_of_detail and viewport is not None:
+            view_mask = np.zeros(arrays.n_nodes, dtype=bool)
+            view_mask[points_in_cells(arrays.view_grid, viewport)] = True
+        weights = edge_weights(arrays, date_window)
+        candidate_ids = filter_edges(
+            arrays, sponsor_party_filter, target_party_filter, min_edge_mentions, view_mask, weights
         )
-
-    if not sponsors_visible or not targets_visible:
-        to_drop: list[str] = []
-        for n in graph.nodes():
-            node_type = base_graph.nodes[n]["node_type"] if n in base_graph.nodes else "unknown"
-            if node_type == "sponsor" and not sponsors_visible:
-                to_drop.append(n)
-            if node_type == "target" and not targets_visible:
-                to_drop.append(n)
-        if to_drop:
-            graph.remove_nodes_from(to_drop)
-
-    if graph.number_of_nodes() == 0:
-        fig = go.Figure()
-        fig.update_layout(
-            template="plotly_white",
-            title="No nodes match current filters",
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False),
+        node_ids, edge_ids = visible_subgraph(
+            arrays, candidate_ids[: max(int(top_n_edges), 0)], sponsors_visible, targets_visible
         )
-        return fig, "No visible nodes. Relax filters."
+    if len(node_ids) == 0:
+        return None
 
-    highlight_nodes: set[str] = set(graph.nodes())
-    highlight_edges: set[tuple[str, str]] = set(graph.edges())
-    active_seeds: list[dict[str, str]] = list(selected_nodes or [])
-    if interaction_mode == "highlight" and active_seeds:
-        active_seeds = active_seeds[:1]
+    with stage("graph"):
+        src = arrays.src[edge_ids]
+        dst = arrays.dst[edge_ids]
+        out_degree = np.bincount(src, minlength=arrays.n_nodes)
+        in_degree = np.bincount(dst, minlength=arrays.n_nodes)
 
-    has_active_selection = False
-    visible_seed_count = 0
-    if interaction_mode in {"highlight", "accumulate"} and active_seeds:
-        selected_nodes_union: set[str] = set()
-        selected_edges_union: set[tuple[str, str]] = set()
-        for seed in active_seeds:
-            selected_name = seed.get("name")
-            selected_type = seed.get("type")
-            if not selected_name or selected_name not in graph.nodes():
-                continue
-            has_active_selection = True
-            visible_seed_count += 1
-            if selected_type == "sponsor":
-                neighbors = set(graph.successors(selected_name))
-                selected_nodes_union |= {selected_name} | neighbors
-                selected_edges_union |= {(selected_name, n) for n in neighbors if graph.has_edge(selected_name, n)}
-            elif selected_type == "target":
-                neighbors = set(graph.predecessors(selected_name))
-                selected_nodes_union |= {selected_name} | neighbors
-                selected_edges_union |= {(n, selected_name) for n in neighbors if graph.has_edge(n, selected_name)}
-        if has_active_selection:
-            highlight_nodes = selected_nodes_union
-            highlight_edges = selected_edges_union
-
-    sponsor_out_degree = pd.Series({n: graph.out_degree(n) for n in graph.nodes()})
-    target_in_degree = pd.Series({n: graph.in_degree(n) for n in graph.nodes()})
-
-    size_raw: dict[str, float] = {}
-    for n in graph.nodes():
-        meta = base_graph.nodes[n]
-        ntype = meta["node_type"]
+        is_sponsor = arrays.is_sponsor[node_ids]
         if size_mode == "topology":
-            if ntype == "sponsor":
-                size_raw[n] = float(sponsor_out_degree.get(n, 0))
-            else:
-                size_raw[n] = float(target_in_degree.get(n, 0))
-        else:
-            if ntype == "sponsor":
-                size_raw[n] = float(meta.get("sponsor_attack_spend", 0.0))
-            else:
-                size_raw[n] = float(meta.get("target_received_spend", 0.0))
-
-    size_series = pd.Series(size_raw)
-    size_scaled = scale_series(size_series, lo=10, hi=46).to_dict()
-
-    edge_x_dim, edge_y_dim, edge_x_hi, edge_y_hi = [], [], [], []
-    edge_hover_x, edge_hover_y, edge_hover_text = [], [], []
-    for u, v in graph.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_meta = graph.edges[u, v]
-        is_hi = (u, v) in highlight_edges
-        if interaction_mode in {"highlight", "accumulate"} and has_active_selection and not is_hi:
-            edge_x_dim.extend([x0, x1, None])
-            edge_y_dim.extend([y0, y1, None])
+            size_raw = np.where(is_sponsor, out_degree[node_ids], in_degree[node_ids])
         else:
-            edge_x_hi.extend([x0, x1, None])
-            edge_y_hi.extend([y0, y1, None])
+            size_raw = np.where(is_sponsor, arrays.sponsor_spend[node_ids], arrays.target_spend[node_ids])
+        node_size = scale_array(size_raw, lo=10, hi=46)
+
+        edge_x, edge_y = edge_line_coords(arrays.pos, src, dst)
 
         # Hover anchor at edge midpoint so edge details are discoverable.
-        edge_hover_x.append((x0 + x1) / 2.0)
-        edge_hover_y.append((y0 + y1) / 2.0)
-        edge_hover_text.append(
-            f"{u} -> {v}<br>"
-            f"attacks (mention_count)={int(edge_meta.get('mention_count', 0)):,}<br>"
-            f"ads={int(edge_meta.get('ad_count', 0)):,}<br>"
-            f"attack_spend=${float(edge_meta.get('edge_attack_spend', 0.0)):,.2f}"
+        edge_mid = (arrays.pos[src] + arrays.pos[dst]) / 2.0
+
+    # Everything below (hover text, trace dicts, clusters, selection context) counts as "traces".
+    traces_started = time.perf_counter()
+    names = arrays.node_names
+    edge_hover_text = [
+        f"{u} -> {v}<br>"
+        f"attacks (mention_count)={m:,}<br>"
+        f"ads={a:,}<br>"
+        f"attack_spend=${s:,.2f}"
+        for u, v, m, a, s in zip(
+            names[src],
+            names[dst],
+            weights.mention_count[edge_ids].tolist(),
+            weights.ad_count[edge_ids].tolist(),
+            weights.attack_spend[edge_ids].tolist(),
         )
-
-    edge_dim_trace = go.Scatter(
-        x=edge_x_dim,
-        y=edge_y_dim,
-        mode="lines",
-        hoverinfo="none",
-        line=dict(width=0.6, color="rgba(120,120,120,0.08)"),
-        showlegend=False,
-    )
-    edge_hi_trace = go.Scatter(
-        x=edge_x_hi,
-        y=edge_y_hi,
-        mode="lines",
-        hoverinfo="none",
-        line=dict(width=0.9, color="rgba(120,120,120,0.42)"),
-        showlegend=False,
-    )
-    edge_hover_trace = go.Scatter(
-        x=edge_hover_x,
-        y=edge_hover_y,
+    ]
+    edge_hover_trace = dict(
+        type="scatter",
+        x=edge_mid[:, 0],
+        y=edge_mid[:, 1],
         mode="markers",
         hoverinfo="text",
         text=edge_hover_text,
+        # Read by the clientside click handler to focus the evidence panel on an edge.
+        customdata=[[u, v, "edge"] for u, v in zip(names[src], names[dst])],
         showlegend=False,
         marker=dict(
             size=5,
@@ -416,86 +294,87 @@ def build_figure(
         ),
     )
 
-    sponsor_x, sponsor_y, sponsor_size, sponsor_color, sponsor_text, sponsor_cd, sponsor_opacity = ([] for _ in range(7))
-    target_x, target_y, target_size, target_color, target_text, target_cd, target_opacity = ([] for _ in range(7))
-
-    for n in graph.nodes():
-        meta = base_graph.nodes[n]
-        ntype = meta["node_type"]
-        x, y = pos[n]
-        is_hi_node = n in highlight_nodes
-        opacity = 0.98 if (interaction_mode not in {"highlight", "accumulate"} or not has_active_selection or is_hi_node) else 0.14
-
-        if color_mode == "party":
-            party = str(meta.get("party", "UNKNOWN"))
-            if ntype == "sponsor":
-                color = PARTY_COLORS.get(party, PARTY_COLORS["UNKNOWN"])
-            else:
-                color = TARGET_PARTY_COLORS.get(party, TARGET_PARTY_COLORS["UNKNOWN"])
-        else:
-            color = LABEL_COLORS.get(str(meta.get("label_mode", "UNKNOWN")), LABEL_COLORS["UNKNOWN"])
-
-        if ntype == "sponsor":
-            sponsor_x.append(x)
-            sponsor_y.append(y)
-            sponsor_size.append(float(size_scaled.get(n, 12)))
-            sponsor_color.append(color)
-            sponsor_opacity.append(opacity)
-            sponsor_cd.append([n, "sponsor"])
-            sponsor_text.append(
-                f"sponsor={n}<br>"
-                f"party={meta.get('party','UNKNOWN')}<br>"
-                f"outgoing_edges={int(sponsor_out_degree.get(n, 0)):,}<br>"
-                f"attack_spend_total=${float(meta.get('sponsor_attack_spend', 0.0)):,.2f}"
-            )
-        else:
-            target_x.append(x)
-            target_y.append(y)
-            target_size.append(float(size_scaled.get(n, 12)))
-            target_color.append(color)
-            target_opacity.append(opacity)
-            target_cd.append([n, "target"])
-            target_text.append(
-                f"target={n}<br>"
-                f"label={meta.get('label_mode','UNKNOWN')}<br>"
-                f"inferred_party={meta.get('party','UNKNOWN')}<br>"
-                f"incoming_edges={int(target_in_degree.get(n, 0)):,}<br>"
-                f"received_attack_spend=${float(meta.get('target_received_spend', 0.0)):,.2f}"
-            )
+    party = arrays.node_party[node_ids]
+    label = arrays.node_label[node_ids]
+    if color_mode == "party":
+        node_color = np.array(
+            [
+                PARTY_COLORS.get(p, PARTY_COLORS["UNKNOWN"]) if sponsor else TARGET_PARTY_COLORS.get(p, TARGET_PARTY_COLORS["UNKNOWN"])
+                for p, sponsor in zip(party, is_sponsor)
+            ],
+            dtype=object,
+        )
+    else:
+        node_color = np.array([LABEL_COLORS.get(lbl, LABEL_COLORS["UNKNOWN"]) for lbl in label], dtype=object)
+
+    sponsor_ids = node_ids[is_sponsor]
+    target_ids = node_ids[~is_sponsor]
+    sponsor_text = [
+        f"sponsor={n}<br>"
+        f"party={p}<br>"
+        f"outgoing_edges={d:,}<br>"
+        f"attack_spend_total=${s:,.2f}"
+        for n, p, d, s in zip(
+            names[sponsor_ids],
+            arrays.node_party[sponsor_ids],
+            out_degree[sponsor_ids].tolist(),
+            arrays.sponsor_spend[sponsor_ids].tolist(),
+        )
+    ]
+    target_text = [
+        f"target={n}<br>"
+        f"label={lbl}<br>"
+        f"inferred_party={p}<br>"
+        f"incoming_edges={d:,}<br>"
+        f"received_attack_spend=${s:,.2f}"
+        for n, lbl, p, d, s in zip(
+            names[target_ids],
+            arrays.node_label[target_ids],
+            arrays.node_party[target_ids],
+            in_degree[target_ids].tolist(),
+            arrays.target_spend[target_ids].tolist(),
+        )
+    ]
 
-    sponsor_trace = go.Scatter(
-        x=sponsor_x,
-        y=sponsor_y,
+    # Strong role cue independent of color:
+    # sponsors are square markers, targets are circles.
+    sponsor_trace = dict(
+        type="scatter",
+        x=arrays.pos[sponsor_ids, 0],
+        y=arrays.pos[sponsor_ids, 1],
         mode="markers",
         name="Sponsors",
-        customdata=sponsor_cd,
+        customdata=[[n, "sponsor"] for n in names[sponsor_ids]],
         hoverinfo="text",
         text=sponsor_text,
-        marker=dict(size=sponsor_size, color=sponsor_color, line=dict(width=0.8, color="white"), opacity=sponsor_opacity),
+        marker=dict(
+            size=node_size[is_sponsor],
+            color=node_color[is_sponsor].tolist(),
+            symbol="square",
+            line=dict(width=1.6, color="#111111"),
+        ),
     )
 
-    target_trace = go.Scatter(
-        x=target_x,
-        y=target_y,
+    target_trace = dict(
+        type="scatter",
+        x=arrays.pos[target_ids, 0],
+        y=arrays.pos[target_ids, 1],
         mode="markers",
         name="Targets",
-        customdata=target_cd,
+        customdata=[[n, "target"] for n in names[target_ids]],
         hoverinfo="text",
         text=target_text,
-        marker=dict(size=target_size, color=target_color, line=dict(width=0.8, color="white"), opacity=target_opacity),
+        marker=dict(
+            size=node_size[~is_sponsor],
+            color=node_color[~is_sponsor].tolist(),
+            symbol="circle",
+            line=dict(width=0.9, color="#ffffff"),
+        ),
     )
 
-    # Strong role cue independent of color:
-    # sponsors are square markers, targets are circles.
-    sponsor_trace.marker.symbol = "square"
-    sponsor_trace.marker.line = dict(width=1.6, color="#111111")
-    target_trace.marker.symbol = "circle"
-    target_trace.marker.line = dict(width=0.9, color="#ffffff")
-
-    fig = go.Figure(data=[edge_dim_trace, edge_hi_trace, edge_hover_trace, sponsor_trace, target_trace])
-    fig.update_layout(
-        template="plotly_white",
-        title=f"Week 3 Attack-Target Interactive Graph ({graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges)",
+    layout = dict(
+        template=PLOT_TEMPLATE,
+        title=dict(text=f"Week 3 Attack-Target Interactive Graph ({len(node_ids):,} nodes, {len(edge_ids):,} edges)"),
         hovermode="closest",
         clickmode="event",
         margin=dict(l=20, r=20, t=56, b=20),
@@ -503,22 +382,356 @@ def build_figure(
         xaxis=dict(showgrid=False, zeroline=False, visible=False),
         yaxis=dict(showgrid=False, zeroline=False, visible=False),
     )
+    status = f"Visible: {len(node_ids):,} nodes, {len(edge_ids):,} edges"
+    if weights.window is not None:
+        status += f" | Window: {window_label(arrays, weights.window)}"
+
+    cluster_trace = None
+    if level_of_detail:
+        # Zoomed views keep the user's axis ranges across rebuilds.
+        layout["uirevision"] = "level-of-detail"
+        grid = arrays.view_grid
+        i0, i1, j0, j1 = viewport or (0, int(grid["shape"][0]) - 1, 0, int(grid["shape"][1]) - 1)  # type: ignore[index]
+        origin = grid["origin"] + np.array([i0, j0]) * grid["cell"]  # type: ignore[operator]
+        cluster_cell = max(i1 - i0 + 1, j1 - j0 + 1) * grid["cell"] / LOD_CLUSTER_CELLS  # type: ignore[operator]
+        node_allowed = np.where(arrays.is_sponsor, sponsors_visible, targets_visible)
+        if view_mask is not None:
+            node_allowed &= view_mask
+        centroids, hidden_nodes, hidden_edges = hidden_node_clusters(
+            arrays, candidate_ids, node_ids, edge_ids, node_allowed, origin, cluster_cell
+        )
+        cluster_trace = dict(
+            type="scatter",
+            x=centroids[:, 0],
+            y=centroids[:, 1],
+            mode="markers",
+            name="Hidden (zoom in)",
+            hoverinfo="text",
+            text=[
+                f"{n:,} more nodes<br>{e:,} more edges<br>zoom in for detail"
+                for n, e in zip(hidden_nodes.tolist(), hidden_edges.tolist())
+            ],
+            marker=dict(
+                size=scale_array(np.log1p(hidden_nodes), lo=8, hi=30),
+                color="rgba(99,99,99,0.22)",
+                line=dict(width=1, color="rgba(99,99,99,0.6)"),
+            ),
+        )
+        status += (
+            f" | Detail: {'zoomed' if viewport else 'overview'}, "
+            f"{int(hidden_nodes.sum()):,} nodes / {int(hidden_edges.sum()):,} edges clustered"
+        )
+
+    local_order = np.concatenate([sponsor_ids, target_ids])
+    local_xy = arrays.pos[local_order]
+    # Clicks that miss every marker snap to the nearest node within this radius.
+    click_radius = NEAR_NODE_FRACTION * max(float(np.ptp(local_xy, axis=0).max()), 1e-9)
+    adjacency = {
+        "n_sponsors": len(sponsor_ids),
+        **local_csr(arrays, local_order, edge_ids),
+        "click_grid": point_grid(local_xy, click_radius),
+    }
+    add_stage("traces", time.perf_counter() - traces_started)
+    return FigureBase(
+        node_ids=node_ids,
+        edge_ids=edge_ids,
+        is_sponsor=is_sponsor,
+        edge_x=edge_x,
+        edge_y=edge_y,
+        edge_hover_trace=edge_hover_trace,
+        sponsor_trace=sponsor_trace,
+        target_trace=target_trace,
+        layout=layout,
+        status=status,
+        cluster_trace=cluster_trace,
+        adjacency=adjacency,
+    )
 
-    status = (
-        f"Visible: {graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges | "
-        f"Mode: color={color_mode}, size={size_mode}, interaction={interaction_mode}"
+
+def cached_figure_base(
+    runtime: dict[str, object],
+    sponsor_party_filter: list[str],
+    target_party_filter: list[str],
+    node_type_visible: list[str],
+    color_mode: str,
+    size_mode: str,
+    min_edge_mentions: int,
+    top_n_edges: int,
+    level_of_detail: bool = False,
+    viewport: tuple[int, int, int, int] | None = None,
+    date_window: tuple[int, int] | None = None,
+) -> FigureBase | None:
+    filters = (
+        sponsor_party_filter,
+        target_party_filter,
+        node_type_visible,
+        color_mode,
+        size_mode,
+        min_edge_mentions,
+        top_n_edges,
+        level_of_detail,
+        viewport,
+        date_window,
     )
+    cache: FigureCache = runtime["figure_cache"]  # type: ignore[assignment]
+    return cache.get_or_build(figure_cache_key(*filters), lambda: build_figure_base(runtime, *filters))
+
+
+def prewarm_figure_cache(runtime: dict[str, object], min_edge_mentions_stops: list[int]) -> int:
+    """Build figure bases for the default filters at each slider stop and visual mode.
+
+    Runs in a background thread at startup; stops once the cache is full so it
+    never evicts states users have already requested. Returns states built.
+    """
+    cache: FigureCache = runtime["figure_cache"]  # type: ignore[assignment]
+    modes = [("party", "topology"), ("party", "money"), ("entity_label", "topology"), ("entity_label", "money")]
+    built = 0
+    for color_mode, size_mode in modes:
+        for min_edge_mentions in min_edge_mentions_stops:
+            if built >= cache.maxsize:
+                return built
+            cached_figure_base(
+                runtime,
+                list(runtime["sponsor_parties"]),  # type: ignore[call-overload]
+                list(runtime["target_parties"]),  # type: ignore[call-overload]
+                ["sponsor", "target"],
+                color_mode,
+                size_mode,
+                min_edge_mentions,
+                900,
+            )
+            built += 1
+    return built
+
+
+def window_label(arrays: GraphArrays, window: tuple[int, int]) -> str:
+    first = np.datetime64(arrays.days.first_day + window[0], "D")
+    last = np.datetime64(arrays.days.first_day + window[1], "D")
+    return f"{first} to {last}"
+
+
+def date_window(arrays: GraphArrays, value: list | None) -> tuple[int, int] | None:
+    """Cube day offsets from the `date-window` slider; None when it spans every day (whole-cycle weights)."""
+    n_days = arrays.days.n_days
+    if not value or n_days == 0:
+        return None
+    first, last = sorted(min(max(int(v), 0), n_days - 1) for v in value[:2])
+    if first == 0 and last == n_days - 1:
+        return None
+    return first, last
+
+
+def finite_range(value: object) -> tuple[float, float] | None:
+    """`(lo, hi)` from a client-supplied axis range, or None unless it is two finite numbers."""
+    try:
+        lo, hi = (float(v) for v in value)  # type: ignore[union-attr]
+    except (TypeError, ValueError):
+        return None
+    return (lo, hi) if np.isfinite([lo, hi]).all() else None
+
+
+def viewport_cells(arrays: GraphArrays, viewport: dict | None) -> tuple[int, int, int, int] | None:
+    """Snap a `viewport` store value (`{"x": [x0, x1] | None, "y": ...}`) to view-grid cell bounds.
+
+    Returns None (the whole layout) when neither axis has a usable zoom range; an axis whose
+    range is missing or not finite spans the whole layout.
+    """
+    x_range = finite_range(viewport.get("x")) if viewport else None
+    y_range = finite_range(viewport.get("y")) if viewport else None
+    if x_range is None and y_range is None:
+        return None
+    grid = arrays.view_grid
+    origin: np.ndarray = grid["origin"]  # type: ignore[assignment]
+    shape: np.ndarray = grid["shape"]  # type: ignore[assignment]
+    cell: float = grid["cell"]  # type: ignore[assignment]
+    full_x = (origin[0], origin[0] + shape[0] * cell)
+    full_y = (origin[1], origin[1] + shape[1] * cell)
+    x0, x1 = x_range or full_x
+    y0, y1 = y_range or full_y
+    return grid_cell_range(grid, float(x0), float(x1), float(y0), float(y1))
+
+
+def mode_status(base: FigureBase, color_mode: str, size_mode: str, interaction_mode: str) -> str:
+    return f"{base.status} | Mode: color={color_mode}, size={size_mode}, interaction={interaction_mode}"
+
+
+@dataclass(frozen=True)
+class SelectionOverlay:
+    """Per-selection values layered onto a cached `FigureBase`."""
+
+    edge_x_dim: np.ndarray
+    edge_y_dim: np.ndarray
+    edge_x_hi: np.ndarray
+    edge_y_hi: np.ndarray
+    sponsor_opacity: np.ndarray
+    target_opacity: np.ndarray
+    status: str
+
+
+def selection_overlay(
+    arrays: GraphArrays,
+    base: FigureBase,
+    color_mode: str,
+    size_mode: str,
+    interaction_mode: str,
+    selected_nodes: list[dict[str, str]] | None,
+) -> SelectionOverlay:
+    node_ids = base.node_ids
+    edge_ids = base.edge_ids
+    is_sponsor = base.is_sponsor
+
+    active_seeds: list[dict[str, str]] = list(selected_nodes or [])
+    if interaction_mode == "highlight" and active_seeds:
+        active_seeds = active_seeds[:1]
+
+    has_active_selection = False
+    visible_seed_count = 0
+    hi_nodes = hi_edges = None
+    if interaction_mode in {"highlight", "accumulate"} and active_seeds:
+        hi_nodes, hi_edges, visible_seed_count = neighborhood(arrays, node_ids, edge_ids, active_seeds)
+        has_active_selection = visible_seed_count > 0
+
+    if has_active_selection:
+        edge_hi = hi_edges[edge_ids]  # type: ignore[index]
+        node_opacity = np.where(hi_nodes[node_ids], 0.98, 0.14)  # type: ignore[index]
+        src = arrays.src[edge_ids]
+        dst = arrays.dst[edge_ids]
+        edge_x_dim, edge_y_dim = edge_line_coords(arrays.pos, src[~edge_hi], dst[~edge_hi])
+        edge_x_hi, edge_y_hi = edge_line_coords(arrays.pos, src[edge_hi], dst[edge_hi])
+    else:
+        node_opacity = np.full(len(node_ids), 0.98)
+        edge_x_dim = edge_y_dim = np.zeros(0)
+        edge_x_hi, edge_y_hi = base.edge_x, base.edge_y
+
+    status = mode_status(base, color_mode, size_mode, interaction_mode)
     if interaction_mode in {"highlight", "accumulate"} and has_active_selection:
         if interaction_mode == "accumulate":
             status += f" | Active seed nodes: {visible_seed_count}"
         else:
             seed = active_seeds[0]
             status += f" | Highlight selection: {seed.get('name')} ({seed.get('type')})"
-    return fig, status
+
+    return SelectionOverlay(
+        edge_x_dim=edge_x_dim,
+        edge_y_dim=edge_y_dim,
+        edge_x_hi=edge_x_hi,
+        edge_y_hi=edge_y_hi,
+        sponsor_opacity=node_opacity[is_sponsor],
+        target_opacity=node_opacity[~is_sponsor],
+        status=status,
+    )
+
+
+def build_figure(
+    runtime: dict[str, object],
+    sponsor_party_filter: list[str],
+    target_party_filter: list[str],
+    node_type_visible: list[str],
+    color_mode: str,
+    size_mode: str,
+    interaction_mode: str,
+    min_edge_mentions: int,
+    top_n_edges: int,
+    selected_nodes: list[dict[str, str]] | None,
+    level_of_detail: bool = False,
+    viewport: tuple[int, int, int, int] | None = None,
+    date_window: tuple[int, int] | None = None,
+) -> tuple[dict, str, dict | None]:
+    """Figure dict, status line and clientside selection context for the controls.
+
+    Figures are plain dicts: every value is generated here, and building a
+    `go.Figure` would validate and deep-copy each per-node list on every callback.
+    The filter-dependent part comes from the runtime's figure cache; only the
+    selection overlay (opacities, dim/highlight edge split) is computed per call.
+    Later selection changes are applied in the browser from the returned
+    context (see `assets/week3_graph_selection.js`); it is None for an empty figure.
+    """
+    base = cached_figure_base(
+        runtime,
+        sponsor_party_filter,
+        target_party_filter,
+        node_type_visible,
+        color_mode,
+        size_mode,
+        min_edge_mentions,
+        top_n_edges,
+        level_of_detail,
+        viewport,
+        date_window,
+    )
+
+    if base is None:
+        fig = dict(
+            data=[],
+            layout=dict(
+                template=PLOT_TEMPLATE,
+                title=dict(text="No nodes match current filters"),
+                xaxis=dict(visible=False),
+                yaxis=dict(visible=False),
+            ),
+        )
+        if level_of_detail:
+            # An empty zoomed-in box keeps its ranges so double-click still resets to the overview.
+            fig["layout"]["uirevision"] = "level-of-detail"
+        return fig, "No visible nodes. Relax filters.", None
+
+    record("visible_nodes", len(base.node_ids))
+    record("visible_edges", len(base.edge_ids))
+    with stage("traces"):
+        return assemble_figure(runtime, base, color_mode, size_mode, interaction_mode, selected_nodes)
+
+
+def assemble_figure(
+    runtime: dict[str, object],
+    base: FigureBase,
+    color_mode: str,
+    size_mode: str,
+    interaction_mode: str,
+    selected_nodes: list[dict[str, str]] | None,
+) -> tuple[dict, str, dict]:
+    overlay = selection_overlay(runtime["arrays"], base, color_mode, size_mode, interaction_mode, selected_nodes)  # type: ignore[arg-type]
+
+    edge_dim_trace = dict(
+        type="scatter",
+        x=overlay.edge_x_dim,
+        y=overlay.edge_y_dim,
+        mode="lines",
+        hoverinfo="none",
+        line=dict(width=0.6, color="rgba(120,120,120,0.08)"),
+        showlegend=False,
+    )
+    edge_hi_trace = dict(
+        type="scatter",
+        x=overlay.edge_x_hi,
+        y=overlay.edge_y_hi,
+        mode="lines",
+        hoverinfo="none",
+        line=dict(width=0.9, color="rgba(120,120,120,0.42)"),
+        showlegend=False,
+    )
+    # Cached traces are shared between requests: copy the dicts that gain per-selection values.
+    sponsor_trace = {
+        **base.sponsor_trace,
+        "marker": {**base.sponsor_trace["marker"], "opacity": overlay.sponsor_opacity},
+    }
+    target_trace = {
+        **base.target_trace,
+        "marker": {**base.target_trace["marker"], "opacity": overlay.target_opacity},
+    }
+
+    # Trace order is relied on by the clientside selection callbacks.
+    data = [edge_dim_trace, edge_hi_trace, base.edge_hover_trace, sponsor_trace, target_trace]
+    if base.cluster_trace is not None:
+        data.append(base.cluster_trace)
+    fig = dict(data=data, layout=base.layout)
+    selection_context = {**base.adjacency, "status": mode_status(base, color_mode, size_mode, interaction_mode)}
+    return fig, overlay.status, selection_context
 
 
 PATHS = resolve_runtime_paths()
-RUNTIME = load_runtime_data(PATHS)
+# Opt-in cProfile dumps of runtime loading and callbacks (`DELTA_PROFILE`, `DELTA_PROFILE_DIR`).
+PROFILER = Profiler.from_env(PATHS.edges_path.parent / "profiles")
+RUNTIME = PROFILER.call("load_runtime_data", load_runtime_data, PATHS)
 BASE_PATH = PATHS.base_path
 
 app = dash.Dash(
@@ -528,200 +741,244 @@ app = dash.Dash(
 )
 app.title = "Week 3 Attack-Target Graph"
 server = app.server
-EDGE_Q95 = int(pd.Series(RUNTIME["edges"]["mention_count"]).quantile(0.95))  # type: ignore[index]
-SLIDER_MAX = max(2, EDGE_Q95)
-SLIDER_STEP = 5 if SLIDER_MAX >= 20 else 1
-SLIDER_MARKS = {v: str(v) for v in range(2, SLIDER_MAX + 1, SLIDER_STEP)}
-if SLIDER_MAX not in SLIDER_MARKS:
-    SLIDER_MARKS[SLIDER_MAX] = str(SLIDER_MAX)
-
-app.layout = html.Div(
-    [
-        html.H3("Week 3 Attack-Target Graph (Interactive)", style={"margin": "0 0 12px 0"}),
-        html.Div(
-            [
-                html.Div(
-                    [
-                        html.Label("Sponsor Party Filter"),
-                        dcc.Dropdown(
-                            id="sponsor-party-filter",
-                            options=[{"label": p, "value": p} for p in RUNTIME["sponsor_parties"]],
-                            value=RUNTIME["sponsor_parties"],
-                            multi=True,
-                        ),
-                    ],
-                    style={"width": "24%", "display": "inline-block", "paddingRight": "1%"},
-                ),
-                html.Div(
-                    [
-                        html.Label("Target Party Filter (Inferred)"),
-                        dcc.Dropdown(
-                            id="target-party-filter",
-                            options=[{"label": p, "value": p} for p in RUNTIME["target_parties"]],
-                            value=RUNTIME["target_parties"],
-                            multi=True,
-                        ),
-                    ],
-                    style={"width": "24%", "display": "inline-block", "paddingRight": "1%"},
-                ),
-                html.Div(
-                    [
-                        html.Label("Show Node Types"),
-                        dcc.Checklist(
-                            id="node-type-visible",
-                            options=[
-                                {"label": " Sponsors", "value": "sponsor"},
-                                {"label": " Targets", "value": "target"},
-                            ],
-                            value=["sponsor", "target"],
-                            inline=True,
-                        ),
-                    ],
-                    style={"width": "24%", "display": "inline-block", "paddingRight": "1%"},
-                ),
-                html.Div(
-                    [
-                        html.Label("Min Edge Mentions"),
-                        dcc.Slider(
-                            id="min-edge-mentions",
-                            min=2,
-                            max=SLIDER_MAX,
-                            step=1,
-                            value=2,
-                            marks=SLIDER_MARKS,
-                            tooltip={"placement": "bottom", "always_visible": False},
-                        ),
-                    ],
-                    style={"width": "24%", "display": "inline-block"},
-                ),
-            ],
-            style={"marginBottom": "10px"},
-        ),
-        html.Div(
-            [
-                html.Div(
-                    [
-                        html.Label("Color Mode"),
-                        dcc.RadioItems(
-                            id="color-mode",
-                            options=[
-                                {"label": " Party Colors", "value": "party"},
-                                {"label": " Entity Label Colors", "value": "entity_label"},
-                            ],
-                            value="party",
-                            inline=True,
-                        ),
-                    ],
-                    style={"width": "30%", "display": "inline-block"},
-                ),
-                html.Div(
-                    [
-                        html.Label("Size Mode"),
-                        dcc.RadioItems(
-                            id="size-mode",
-                            options=[
-                                {"label": " Topology", "value": "topology"},
-                                {"label": " Money", "value": "money"},
-                            ],
-                            value="topology",
-                            inline=True,
-                        ),
-                    ],
-                    style={"width": "22%", "display": "inline-block"},
-                ),
-                html.Div(
-                    [
-                        html.Label("Interaction Mode"),
-                        dcc.RadioItems(
-                            id="interaction-mode",
-                            options=[
-                                {"label": " Accumulate Highlight", "value": "accumulate"},
-                                {"label": " Neighbor Highlight", "value": "highlight"},
-                            ],
-                            value="highlight",
-                            inline=True,
-                        ),
-                    ],
-                    style={"width": "30%", "display": "inline-block"},
-                ),
-                html.Div(
-                    [
-                        html.Label("Top N Edges"),
-                        dcc.Input(id="top-n-edges", type="number", min=50, max=5000, step=50, value=900),
-                        html.Button("Clear Selection", id="clear-selection", n_clicks=0, style={"marginLeft": "8px"}),
-                    ],
-                    style={"width": "18%", "display": "inline-block"},
-                ),
-            ],
-            style={"marginBottom": "10px"},
-        ),
-        dcc.Store(id="selected-seeds", data=[]),
-        html.Div(id="status-text", style={"marginBottom": "8px", "fontWeight": "600"}),
-        dcc.Graph(id="attack-target-graph", style={"height": "80vh"}, config={"displaylogo": False}),
-        html.Div(
-            "Accumulate mode: each click adds that node's neighborhood to the highlighted network (click again to remove). "
-            "Neighbor Highlight mode: one selected node at a time. Visual cue: sponsors are squares, targets are circles.",
-            style={"color": "#555", "fontSize": "0.9rem", "marginTop": "6px"},
-        ),
-    ],
-    style={"padding": "12px 16px"},
-)
-
-
-@app.callback(
-    Output("selected-seeds", "data"),
-    Input("attack-target-graph", "clickData"),
-    State("interaction-mode", "value"),
-    State("selected-seeds", "data"),
-    State("attack-target-graph", "figure"),
-)
-def update_selected_seeds(click_data, interaction_mode, selected_seeds, figure):
-    clicked = resolve_clicked_node(click_data, figure)
-    if clicked is None:
-        return selected_seeds or []
-    node_name, node_type = clicked
-    selected_seeds = list(selected_seeds or [])
-
-    if interaction_mode == "accumulate":
-        exists = any(seed.get("name") == node_name and seed.get("type") == node_type for seed in selected_seeds)
-        if exists:
-            return [
-                seed
-                for seed in selected_seeds
-                if not (seed.get("name") == node_name and seed.get("type") == node_type)
-            ]
-        selected_seeds.append({"name": node_name, "type": node_type})
-        return selected_seeds
-
-    # Single-select mode (Neighbor Highlight)
-    if selected_seeds and selected_seeds[0].get("name") == node_name and selected_seeds[0].get("type") == node_type:
-        return []
-    return [{"name": node_name, "type": node_type}]
 
-
-@app.callback(
-    Output("attack-target-graph", "clickData", allow_duplicate=True),
-    Input("selected-seeds", "data"),
-    prevent_initial_call=True,
-)
-def reset_click_data_after_selection(_selected_seeds):
-    # Force the next click (even on the same node) to produce a fresh event.
-    return None
+# Callback timing/size histograms, per worker process (`GET <base path>metrics`).
+METRICS = MetricsRegistry()
+METRICS.install(server, slow_ms=float(os.getenv("DELTA_SLOW_CALLBACK_MS", "0")))
+
+
+def slider_marks(runtime: dict[str, object]) -> tuple[int, dict[int, str]]:
+    edge_q95 = int(pd.Series(runtime["edges"]["mention_count"]).quantile(0.95))  # type: ignore[index]
+    slider_max = max(2, edge_q95)
+    slider_step = 5 if slider_max >= 20 else 1
+    marks = {v: str(v) for v in range(2, slider_max + 1, slider_step)}
+    if slider_max not in marks:
+        marks[slider_max] = str(slider_max)
+    return slider_max, marks
+
+
+def date_marks(runtime: dict[str, object]) -> tuple[int, dict[int, str]]:
+    """Last day offset of the edge cube and month-start marks (at most 12) for the date-window slider."""
+    cube = runtime["arrays"].days  # type: ignore[attr-defined]
+    if cube.n_days == 0:
+        return 0, {}
+    days = np.datetime64(cube.first_day, "D") + np.arange(cube.n_days)
+    month_starts = np.flatnonzero(days.astype("datetime64[M]").astype("datetime64[D]") == days)
+    step = -(-len(month_starts) // 12) or 1
+    marks = {int(i): pd.Timestamp(days[i]).strftime("%b %Y") for i in month_starts[::step]}
+    return cube.n_days - 1, marks
+
+
+EVIDENCE_TABLE_COLUMNS = [
+    ("sponsor_name", "Sponsor"),
+    ("canonical_entity_v1_1", "Target"),
+    ("ad_id", "Ad ID"),
+    ("platform", "Platform"),
+    ("date", "Date"),
+    ("tone_std", "Tone"),
+    ("spend", "Ad Spend"),
+    ("context_window", "Context"),
+]
+
+
+def serve_layout() -> html.Div:
+    # Built per page load so party options and the slider range follow a reloaded runtime.
+    runtime = RUNTIME
+    slider_max, marks = slider_marks(runtime)
+    last_day, day_marks = date_marks(runtime)
+    return html.Div(
+        [
+            html.H3("Week 3 Attack-Target Graph (Interactive)", style={"margin": "0 0 12px 0"}),
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.Label("Sponsor Party Filter"),
+                            dcc.Dropdown(
+                                id="sponsor-party-filter",
+                                options=[{"label": p, "value": p} for p in runtime["sponsor_parties"]],
+                                value=runtime["sponsor_parties"],
+                                multi=True,
+                            ),
+                        ],
+                        style={"width": "24%", "display": "inline-block", "paddingRight": "1%"},
+                    ),
+                    html.Div(
+                        [
+                            html.Label("Target Party Filter (Inferred)"),
+                            dcc.Dropdown(
+                                id="target-party-filter",
+                                options=[{"label": p, "value": p} for p in runtime["target_parties"]],
+                                value=runtime["target_parties"],
+                                multi=True,
+                            ),
+                        ],
+                        style={"width": "24%", "display": "inline-block", "paddingRight": "1%"},
+                    ),
+                    html.Div(
+                        [
+                            html.Label("Show Node Types"),
+                            dcc.Checklist(
+                                id="node-type-visible",
+                                options=[
+                                    {"label": " Sponsors", "value": "sponsor"},
+                                    {"label": " Targets", "value": "target"},
+                                ],
+                                value=["sponsor", "target"],
+                                inline=True,
+                            ),
+                        ],
+                        style={"width": "24%", "display": "inline-block", "paddingRight": "1%"},
+                    ),
+                    html.Div(
+                        [
+                            html.Label("Min Edge Mentions"),
+                            dcc.Slider(
+                                id="min-edge-mentions",
+                                min=2,
+                                max=slider_max,
+                                step=1,
+                                value=2,
+                                marks=marks,
+                                tooltip={"placement": "bottom", "always_visible": False},
+                            ),
+                        ],
+                        style={"width": "24%", "display": "inline-block"},
+                    ),
+                ],
+                style={"marginBottom": "10px"},
+            ),
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.Label("Color Mode"),
+                            dcc.RadioItems(
+                                id="color-mode",
+                                options=[
+                                    {"label": " Party Colors", "value": "party"},
+                                    {"label": " Entity Label Colors", "value": "entity_label"},
+                                ],
+                                value="party",
+                                inline=True,
+                            ),
+                        ],
+                        style={"width": "30%", "display": "inline-block"},
+                    ),
+                    html.Div(
+                        [
+                            html.Label("Size Mode"),
+                            dcc.RadioItems(
+                                id="size-mode",
+                                options=[
+                                    {"label": " Topology", "value": "topology"},
+                                    {"label": " Money", "value": "money"},
+                                ],
+                                value="topology",
+                                inline=True,
+                            ),
+                        ],
+                        style={"width": "22%", "display": "inline-block"},
+                    ),
+                    html.Div(
+                        [
+                            html.Label("Interaction Mode"),
+                            dcc.RadioItems(
+                                id="interaction-mode",
+                                options=[
+                                    {"label": " Accumulate Highlight", "value": "accumulate"},
+                                    {"label": " Neighbor Highlight", "value": "highlight"},
+                                ],
+                                value="highlight",
+                                inline=True,
+                            ),
+                        ],
+                        style={"width": "30%", "display": "inline-block"},
+                    ),
+                    html.Div(
+                        [
+                            html.Label("Top N Edges"),
+                            dcc.Input(id="top-n-edges", type="number", min=50, max=5000, step=50, value=900),
+                            html.Button("Clear Selection", id="clear-selection", n_clicks=0, style={"marginLeft": "8px"}),
+                            dcc.Checklist(
+                                id="level-of-detail",
+                                options=[{"label": " Zoom Detail", "value": "on"}],
+                                value=[],
+                                inline=True,
+                            ),
+                        ],
+                        style={"width": "18%", "display": "inline-block"},
+                    ),
+                ],
+                style={"marginBottom": "10px"},
+            ),
+            html.Div(
+                [
+                    html.Label("Date Window"),
+                    dcc.RangeSlider(
+                        id="date-window",
+                        min=0,
+                        max=last_day,
+                        step=1,
+                        value=[0, last_day],
+                        marks=day_marks,
+                        allowCross=False,
+                        disabled=last_day == 0,
+                    ),
+                ],
+                style={"marginBottom": "10px"},
+            ),
+            html.Div(
+                [
+                    html.Label("Find Sponsor or Target"),
+                    # Options come from the server's search index as the user types (`search_entities`).
+                    dcc.Dropdown(
+                        id="entity-search",
+                        options=[],
+                        value=None,
+                        placeholder="Type part of a sponsor or target name...",
+                        clearable=True,
+                    ),
+                ],
+                style={"width": "50%", "marginBottom": "10px"},
+            ),
+            dcc.Store(id="selected-seeds", data=[]),
+            dcc.Store(id="selection-context", data=None),
+            dcc.Store(id="viewport", data=None),
+            dcc.Store(id="evidence-focus", data=None),
+            html.Div(id="status-text", style={"marginBottom": "8px", "fontWeight": "600"}),
+            dcc.Graph(id="attack-target-graph", style={"height": "80vh"}, config={"displaylogo": False}),
+            html.Div(
+                "Accumulate mode: each click adds that node's neighborhood to the highlighted network (click again to remove). "
+                "Neighbor Highlight mode: one selected node at a time. Visual cue: sponsors are squares, targets are circles.",
+                style={"color": "#555", "fontSize": "0.9rem", "marginTop": "6px"},
+            ),
+            html.H4("Ad Evidence", style={"margin": "16px 0 6px 0"}),
+            html.Div(id="evidence-summary", style={"marginBottom": "6px"}),
+            dash_table.DataTable(
+                id="evidence-table",
+                columns=[{"name": label, "id": column} for column, label in EVIDENCE_TABLE_COLUMNS],
+                data=[],
+                page_action="custom",
+                page_current=0,
+                page_size=EVIDENCE_PAGE_SIZE,
+                page_count=1,
+                style_cell={"textAlign": "left", "fontSize": "0.85rem", "padding": "4px 6px"},
+                style_data={"whiteSpace": "normal", "height": "auto"},
+                style_cell_conditional=[{"if": {"column_id": "context_window"}, "minWidth": "360px"}],
+            ),
+        ],
+        style={"padding": "12px 16px"},
+    )
 
 
-@app.callback(
-    Output("selected-seeds", "data", allow_duplicate=True),
-    Output("attack-target-graph", "clickData"),
-    Input("clear-selection", "n_clicks"),
-    prevent_initial_call=True,
-)
-def clear_selection(_n_clicks):
-    return [], None
+app.layout = serve_layout
 
 
 @app.callback(
     Output("attack-target-graph", "figure"),
     Output("status-text", "children"),
+    Output("selection-context", "data"),
     Input("sponsor-party-filter", "value"),
     Input("target-party-filter", "value"),
     Input("node-type-visible", "value"),
@@ -730,8 +987,13 @@ def clear_selection(_n_clicks):
     Input("interaction-mode", "value"),
     Input("min-edge-mentions", "value"),
     Input("top-n-edges", "value"),
-    Input("selected-seeds", "data"),
+    Input("level-of-detail", "value"),
+    Input("viewport", "data"),
+    Input("date-window", "value"),
+    State("selected-seeds", "data"),
 )
+@METRICS.instrument("update_graph")
+@PROFILER.profile("update_graph")
 def update_graph(
     sponsor_party_filter,
     target_party_filter,
@@ -741,10 +1003,20 @@ def update_graph(
     interaction_mode,
     min_edge_mentions,
     top_n_edges,
+    level_of_detail,
+    viewport,
+    date_window_value,
     selected_seeds,
 ):
-    fig, status = build_figure(
-        runtime=RUNTIME,
+    level_of_detail = "on" in (level_of_detail or [])
+    if dash.ctx.triggered_id == "viewport" and not level_of_detail:
+        # Zooming only changes the figure in level-of-detail mode.
+        raise dash.exceptions.PreventUpdate
+    # Read once: a hot reload may swap RUNTIME while this request runs.
+    runtime = RUNTIME
+    # Filter and mode changes rebuild the figure; clicks are handled in the browser (below).
+    return build_figure(
+        runtime=runtime,
         sponsor_party_filter=sponsor_party_filter or [],
         target_party_filter=target_party_filter or [],
         node_type_visible=node_type_visible or [],
@@ -754,8 +1026,255 @@ def update_graph(
         min_edge_mentions=int(min_edge_mentions or 2),
         top_n_edges=int(top_n_edges or 900),
         selected_nodes=selected_seeds or [],
+        level_of_detail=level_of_detail,
+        viewport=viewport_cells(runtime["arrays"], viewport) if level_of_detail else None,  # type: ignore[arg-type]
+        date_window=date_window(runtime["arrays"], date_window_value),  # type: ignore[arg-type]
+    )
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="week3", function_name="viewportFromRelayout"),
+    Output("viewport", "data"),
+    Input("attack-target-graph", "relayoutData"),
+    State("viewport", "data"),
+    prevent_initial_call=True,
+)
+
+
+# Selection runs in the browser against the `selection-context` CSR, so clicks cost no server round trip.
+app.clientside_callback(
+    ClientsideFunction(namespace="week3", function_name="selectClickedNode"),
+    Output("selected-seeds", "data"),
+    Output("attack-target-graph", "figure", allow_duplicate=True),
+    Output("status-text", "children", allow_duplicate=True),
+    # Cleared so the next click (even on the same node) produces a fresh event.
+    Output("attack-target-graph", "clickData", allow_duplicate=True),
+    Output("evidence-focus", "data"),
+    Input("attack-target-graph", "clickData"),
+    State("attack-target-graph", "figure"),
+    State("selection-context", "data"),
+    State("selected-seeds", "data"),
+    State("interaction-mode", "value"),
+    prevent_initial_call=True,
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="week3", function_name="clearSelection"),
+    Output("selected-seeds", "data", allow_duplicate=True),
+    Output("attack-target-graph", "figure", allow_duplicate=True),
+    Output("status-text", "children", allow_duplicate=True),
+    Output("attack-target-graph", "clickData", allow_duplicate=True),
+    Output("evidence-focus", "data", allow_duplicate=True),
+    Input("clear-selection", "n_clicks"),
+    State("attack-target-graph", "figure"),
+    State("selection-context", "data"),
+    State("interaction-mode", "value"),
+    prevent_initial_call=True,
+)
+
+
+# Picking a search result selects the node in the browser, like clicking it (except that it never deselects).
+app.clientside_callback(
+    ClientsideFunction(namespace="week3", function_name="selectSearchResult"),
+    Output("selected-seeds", "data", allow_duplicate=True),
+    Output("attack-target-graph", "figure", allow_duplicate=True),
+    Output("status-text", "children", allow_duplicate=True),
+    Output("evidence-focus", "data", allow_duplicate=True),
+    # Cleared so picking the same result again selects it again.
+    Output("entity-search", "value"),
+    Input("entity-search", "value"),
+    State("attack-target-graph", "figure"),
+    State("selection-context", "data"),
+    State("selected-seeds", "data"),
+    State("interaction-mode", "value"),
+    prevent_initial_call=True,
+)
+
+
+def search_options(runtime: dict[str, object], query: str) -> list[dict[str, str]]:
+    """Dropdown options for the best matches; option values are `"<type>:<name>"`."""
+    search: EntitySearch = runtime["search"]  # type: ignore[assignment]
+    arrays: GraphArrays = runtime["arrays"]  # type: ignore[assignment]
+    options = []
+    for node in search.search(query):
+        name, node_type = str(arrays.node_names[node]), "sponsor" if arrays.is_sponsor[node] else "target"
+        options.append(
+            {
+                "label": f"{name} ({node_type}, {search.weight[node]:,.0f} mentions)",
+                "value": f"{node_type}:{name}",
+                # The dropdown also filters options in the browser; matching the query keeps fuzzy matches listed.
+                "search": query,
+            }
+        )
+    return options
+
+
+@app.callback(
+    Output("entity-search", "options"),
+    Input("entity-search", "search_value"),
+    prevent_initial_call=True,
+)
+@METRICS.instrument("search_entities")
+@PROFILER.profile("search_entities")
+def search_entities(search_value):
+    if not search_value:
+        # Keep the listed options while the dropdown clears its text after a pick.
+        raise dash.exceptions.PreventUpdate
+    return search_options(RUNTIME, search_value)
+
+
+def evidence_page(runtime: dict[str, object], focus: dict | None, page: int) -> tuple[list[dict], int, int, str]:
+    """Table rows, page count, clamped page and summary line for the evidence panel."""
+    evidence = runtime.get("evidence")
+    if not focus:
+        return [], 1, 0, "Click a node, or an edge midpoint away from nodes, to list the ads behind it."
+    if evidence is None:
+        return [], 1, 0, "Evidence index not built; rerun scripts/week3_clean_attack_target_v1_1.py."
+    if "sponsor" in focus:
+        title = f"{focus['sponsor']} -> {focus['target']}"
+        ranges = evidence.edge_ranges(str(focus["sponsor"]), str(focus["target"]))  # type: ignore[attr-defined]
+    else:
+        title = f"{focus['name']} ({focus['type']})"
+        ranges = evidence.node_ranges(str(focus["name"]), str(focus["type"]))  # type: ignore[attr-defined]
+    total = evidence.row_count(ranges)  # type: ignore[attr-defined]
+    page_count = max(1, -(-total // EVIDENCE_PAGE_SIZE))
+    page = min(max(int(page or 0), 0), page_count - 1)
+    rows = evidence.page(ranges, page)  # type: ignore[attr-defined]
+    rows["spend"] = rows["spend_proxy"].map(lambda v: f"${v:,.2f}")
+    columns = [column for column, _ in EVIDENCE_TABLE_COLUMNS]
+    return rows[columns].to_dict("records"), page_count, page, f"{title}: {total:,} target mentions"
+
+
+@app.callback(
+    Output("evidence-table", "data"),
+    Output("evidence-table", "page_count"),
+    Output("evidence-table", "page_current"),
+    Output("evidence-summary", "children"),
+    Input("evidence-focus", "data"),
+    Input("evidence-table", "page_current"),
+)
+@METRICS.instrument("update_evidence")
+@PROFILER.profile("update_evidence")
+def update_evidence(focus, page_current):
+    # A new focus starts at its first page.
+    page = 0 if dash.ctx.triggered_id == "evidence-focus" else page_current
+    return evidence_page(RUNTIME, focus, page)
+
+
+@server.route(f"{BASE_PATH}_figure_cache")
+def figure_cache_stats():
+    return flask.jsonify(RUNTIME["figure_cache"].stats())  # type: ignore[attr-defined]
+
+
+@server.route(f"{BASE_PATH}metrics")
+def callback_metrics():
+    return flask.Response(METRICS.render(), mimetype="text/plain; version=0.0.4")
+
+
+RELOAD_LOCK = threading.Lock()
+
+
+def reload_runtime(reason: str) -> bool:
+    """Load a fresh runtime and swap it in; False if another reload is running.
+
+    An existing runtime bundle that went stale is rebuilt first (once across
+    worker processes, see `refresh_runtime_bundle`), so every worker maps the
+    same new bundle instead of each rebuilding from the CSVs. Requests keep being served from the old
+    runtime (and its figure cache) until the swap, a single reference
+    assignment. The new runtime starts with its own empty figure cache, so
+    cached figures never outlive their data. A failed load keeps the old runtime.
+    """
+    global RUNTIME
+    if not RELOAD_LOCK.acquire(blocking=False):
+        return False
+    try:
+        started = time.perf_counter()
+        if PATHS.runtime_bundle_dir is not None:
+            try:
+                if refresh_runtime_bundle(PATHS.runtime_bundle_dir, PATHS):
+                    print(f"runtime bundle rebuilt in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+            except OSError as exc:
+                # e.g. a read-only bundle directory: this worker loads from the CSVs instead.
+                print(f"runtime bundle refresh failed: {exc!r}", file=sys.stderr)
+        runtime = PROFILER.call("load_runtime_data", load_runtime_data, PATHS)
+        if os.getenv("DELTA_FIGURE_CACHE_PREWARM", "0").strip() == "1":
+            prewarm_figure_cache(runtime, sorted(slider_marks(runtime)[1]))
+        RUNTIME = runtime
+        print(f"runtime reloaded ({reason}) in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    except Exception as exc:  # noqa: BLE001 - any load failure must leave the app serving
+        print(f"runtime reload failed ({reason}), keeping current data: {exc!r}", file=sys.stderr)
+    finally:
+        RELOAD_LOCK.release()
+    return True
+
+
+def watch_runtime_sources(interval: float) -> None:
+    """Reload when the pipeline inputs or the reload marker change, once stable for one interval."""
+    pending = attempted = None
+    while True:
+        time.sleep(interval)
+        try:
+            current = watched_signature(PATHS)
+        except OSError:
+            # An output is being replaced; look again next interval.
+            continue
+        if current == RUNTIME["source_signature"] or current == attempted:
+            pending = None
+            continue
+        if current != pending:
+            pending = current
+            continue
+        reload_runtime("pipeline inputs or reload marker changed")
+        attempted, pending = current, None
+
+
+def start_runtime_watcher() -> None:
+    if RELOAD_INTERVAL > 0:
+        threading.Thread(
+            target=watch_runtime_sources,
+            args=(RELOAD_INTERVAL,),
+            name="runtime-reload-watcher",
+            daemon=True,
+        ).start()
+
+
+if RELOAD_TOKEN:
+
+    @server.route(f"{BASE_PATH}_reload", methods=["POST"])
+    def reload_endpoint():
+        if not hmac.compare_digest(flask.request.headers.get("X-Reload-Token", ""), RELOAD_TOKEN):
+            return flask.jsonify(status="forbidden"), 403
+        if RELOAD_INTERVAL > 0:
+            # Every process's watcher (all gunicorn workers, not just this one) reloads on the marker change.
+            try:
+                reload_marker_path(PATHS).write_text(str(time.time_ns()), encoding="utf-8")
+            except OSError as exc:
+                return flask.jsonify(status=f"cannot write reload marker: {exc}"), 500
+            return flask.jsonify(status="reload requested"), 202
+        if os.getenv("DELTA_PRELOAD", "0") == "1":
+            # Without watchers only the worker handling this request could reload.
+            return flask.jsonify(status="set DELTA_RELOAD_INTERVAL to reload all workers"), 503
+        if RELOAD_LOCK.locked():
+            return flask.jsonify(status="already reloading"), 409
+        threading.Thread(target=reload_runtime, args=("reload endpoint",), name="runtime-reload", daemon=True).start()
+        return flask.jsonify(status="reloading"), 202
+
+
+# Preforking servers start the watcher per worker after fork instead (see `gunicorn.conf.py`).
+if os.getenv("DELTA_PRELOAD", "0") != "1":
+    start_runtime_watcher()
+
+
+# Kept so a preloading server can wait for it before forking (see `gunicorn.conf.py`).
+PREWARM_THREAD: threading.Thread | None = None
+if os.getenv("DELTA_FIGURE_CACHE_PREWARM", "0").strip() == "1":
+    PREWARM_THREAD = threading.Thread(
+        target=prewarm_figure_cache,
+        args=(RUNTIME, sorted(slider_marks(RUNTIME)[1])),
+        name="figure-cache-prewarm",
+        daemon=True,
     )
-    return fig, status
+    PREWARM_THREAD.start()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+"""Per-callback timing and size histograms for the Week 3 Dash app.
+
+Callbacks wrapped with `MetricsRegistry.instrument` collect stage timings
+(`stage`, `add_stage`) and values (`record`) for the current request; the response hook
+from `MetricsRegistry.install` adds serialization time and payload size once
+Dash has encoded the result. `MetricsRegistry.render` writes the Prometheus
+text format.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+import flask
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = tuple(float(1024 * 4**k) for k in range(10))  # 1 KiB .. 256 MiB
+COUNT_BUCKETS = (10.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0, 25000.0, 50000.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics, `+Inf` implied)."""
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.n = 0
+
+    def observe(self, value: float) -> None:
+        # `le` buckets: a value equal to a bound falls in that bound's bucket.
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.n += 1
+
+
+@dataclass
+class CallbackSample:
+    """Timings (seconds) and values gathered while one callback request runs."""
+
+    callback: str
+    stages: dict[str, float] = field(default_factory=dict)
+    values: dict[str, float] = field(default_factory=dict)
+    returned_at: float = 0.0
+
+
+def slow_request_record(sample: CallbackSample, total_ms: float, status: int) -> dict[str, object]:
+    body = flask.request.get_json(silent=True) or {}
+    inputs = {
+        f"{item.get('id')}.{item.get('property')}": item.get("value")
+        for item in body.get("inputs", [])
+        if isinstance(item, dict)
+    }
+    return {
+        "event": "slow_callback",
+        "callback": sample.callback,
+        "status": status,
+        "total_ms": round(total_ms, 1),
+        "stages_ms": {name: round(seconds * 1000, 1) for name, seconds in sample.stages.items()},
+        **{name: int(value) for name, value in sample.values.items()},
+        "triggered": body.get("changedPropIds", []),
+        "inputs": inputs,
+    }
+
+
+_current: ContextVar[CallbackSample | None] = ContextVar("week3_callback_sample", default=None)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Add the block's wall time to stage `name` of the running callback (no-op outside one)."""
+    if _current.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_stage(name, time.perf_counter() - started)
+
+
+def add_stage(name: str, seconds: float) -> None:
+    sample = _current.get()
+    if sample is not None:
+        sample.stages[name] = sample.stages.get(name, 0.0) + seconds
+
+
+def record(name: str, value: float) -> None:
+    sample = _current.get()
+    if sample is not None:
+        sample.values[name] = float(value)
+
+
+# Histogram family per recorded value: (metric name, help text, buckets).
+VALUE_METRICS = {
+    "payload_bytes": ("week3_callback_payload_bytes", "Serialized callback response size.", BYTES_BUCKETS),
+    "visible_nodes": ("week3_callback_visible_nodes", "Nodes in the returned figure.", COUNT_BUCKETS),
+    "visible_edges": ("week3_callback_visible_edges", "Edges in the returned figure.", COUNT_BUCKETS),
+}
+
+
+class MetricsRegistry:
+    """Thread-safe histograms keyed by callback and stage or value name."""
+
+    def __init__(self) -> None:
+        self._stages: dict[tuple[str, str], Histogram] = {}
+        self._values: dict[tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def instrument(self, name: str) -> Callable[[Callable], Callable]:
+        """Decorator collecting a `CallbackSample` while the callback runs.
+
+        The sample is completed and observed by the `install`ed response hook,
+        after Dash has serialized the callback's return value.
+        """
+
+        def decorate(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                sample = CallbackSample(name)
+                flask.g.week3_callback_sample = sample
+                token = _current.set(sample)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    sample.returned_at = time.perf_counter()
+                    sample.stages["callback"] = sample.returned_at - started
+                    _current.reset(token)
+
+            return wrapper
+
+        return decorate
+
+    def install(self, server: flask.Flask, slow_ms: float = 0) -> None:
+        """Observe instrumented callbacks after their responses are built.
+
+        Requests slower than `slow_ms` (0 disables) are logged to stderr as one
+        JSON object with stage timings, sizes and the callback inputs.
+        """
+
+        @server.before_request
+        def start_timer():
+            flask.g.week3_request_started = time.perf_counter()
+
+        @server.after_request
+        def observe(response: flask.Response) -> flask.Response:
+            sample: CallbackSample | None = flask.g.pop("week3_callback_sample", None)
+            if sample is None:
+                return response
+            now = time.perf_counter()
+            if response.status_code == 200:
+                # Dash validates and JSON-encodes the return value after the callback returns.
+                sample.stages["serialize"] = now - sample.returned_at
+                if response.content_length is not None:
+                    sample.values["payload_bytes"] = response.content_length
+            self.observe(sample)
+            total_ms = (now - flask.g.get("week3_request_started", sample.returned_at)) * 1000
+            if slow_ms > 0 and total_ms >= slow_ms:
+                print(json.dumps(slow_request_record(sample, total_ms, response.status_code)), file=sys.stderr)
+            return response
+
+    def observe(self, sample: CallbackSample) -> None:
+        with self._lock:
+            for name, seconds in sample.stages.items():
+                self._histogram(self._stages, (sample.callback, name), SECONDS_BUCKETS).observe(seconds)
+            for name, value in sample.values.items():
+                if name in VALUE_METRICS:
+                    self._histogram(self._values, (sample.callback, name), VALUE_METRICS[name][2]).observe(value)
+
+    @staticmethod
+    def _histogram(family: dict, key: tuple[str, str], bounds: tuple[float, ...]) -> Histogram:
+        if key not in family:
+            family[key] = Histogram(bounds)
+        return family[key]
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            lines += [
+                "# HELP week3_callback_stage_seconds Wall time per callback stage.",
+                "# TYPE week3_callback_stage_seconds histogram",
+            ]
+            for (callback, name), hist in sorted(self._stages.items()):
+                lines += _histogram_lines("week3_callback_stage_seconds", f'callback="{callback}",stage="{name}"', hist)
+            for value_name, (metric, help_text, _) in VALUE_METRICS.items():
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+                for (callback, name), hist in sorted(self._values.items()):
+                    if name == value_name:
+                        lines += _histogram_lines(metric, f'callback="{callback}"', hist)
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(metric: str, labels: str, hist: Histogram) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip((*hist.bounds, float("inf")), hist.counts):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+        lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {cumulative}')
+    lines.append(f"{metric}_sum{{{labels}}} {hist.total:.6g}")
+    lines.append(f"{metric}_count{{{labels}}} {hist.n}")
+    return lines
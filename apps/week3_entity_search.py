@@ -0,0 +1,140 @@
+"""Type-ahead search over sponsor and target names for the Week 3 Dash app.
+
+The index is a handful of flat arrays built with the runtime (and stored in the
+runtime bundle next to the node columns):
+
+- `key`: each node's normalized name (casefolded, accents and punctuation dropped).
+- `key_sorted`, `key_node`: the same keys sorted, so names starting with the
+  query are one `searchsorted` range.
+- `term`, `term_node`: every word of every name, sorted, so the names with a word
+  starting with a query word are one `searchsorted` range.
+- `gram`, `gram_ptr`, `gram_node`: trigram posting lists (CSR), for queries that
+  start inside a word or carry a typo.
+- `weight`: total edge mentions per node, the tie-breaker within a match tier.
+
+Node ids are `node_table` rows, the same ids as `GraphArrays`.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+import numpy as np
+
+SEARCH_LIMIT = 12
+# Share of the query's trigrams a name must contain to be a fuzzy match.
+FUZZY_MIN_SHARE = 0.5
+
+# Match tiers, best first.
+EXACT, NAME_PREFIX, WORD_PREFIX, FUZZY = range(4)
+
+_NON_WORD = re.compile(r"[\W_]+")
+# Sorts after any character a normalized term can contain.
+_TERM_END = "\U0010ffff"
+
+
+def normalize(text: str) -> str:
+    folded = unicodedata.normalize("NFKD", str(text).casefold())
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return _NON_WORD.sub(" ", folded).strip()
+
+
+def trigrams(key: str, closed: bool = True) -> set[str]:
+    """Trigrams of a padded key; queries pass `closed=False` since their last word may be incomplete."""
+    padded = f" {key} " if closed else f" {key}"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def build_search_index(node_names: np.ndarray, weight: np.ndarray) -> dict[str, np.ndarray]:
+    """Index arrays for `EntitySearch`; `weight[i]` ranks node i among equally good matches."""
+    keys = [normalize(name) for name in node_names]
+
+    term_pairs = sorted((word, node) for node, key in enumerate(keys) for word in set(key.split()))
+    gram_pairs = sorted((gram, node) for node, key in enumerate(keys) if key for gram in trigrams(key))
+    gram_keys = [gram for gram, _ in gram_pairs]
+    grams, gram_start = np.unique(np.array(gram_keys, dtype="<U3"), return_index=True)
+    gram_ptr = np.append(gram_start, len(gram_pairs)).astype(np.int64)
+
+    key_array = np.array(keys, dtype=str)
+    key_node = np.argsort(key_array, kind="stable").astype(np.int32)
+
+    return {
+        "key": key_array,
+        "key_sorted": key_array[key_node],
+        "key_node": key_node,
+        "term": np.array([term for term, _ in term_pairs], dtype=str),
+        "term_node": np.array([node for _, node in term_pairs], dtype=np.int32),
+        "gram": grams,
+        "gram_ptr": gram_ptr,
+        "gram_node": np.array([node for _, node in gram_pairs], dtype=np.int32),
+        "weight": np.asarray(weight, dtype=np.float64),
+    }
+
+
+class EntitySearch:
+    """Ranked name lookups over `build_search_index` arrays (memory-mapped when loaded from a bundle)."""
+
+    def __init__(self, index: dict[str, np.ndarray]) -> None:
+        self.key = index["key"]
+        self.key_sorted = index["key_sorted"]
+        self.key_node = index["key_node"]
+        self.term = index["term"]
+        self.term_node = index["term_node"]
+        self.gram = index["gram"]
+        self.gram_ptr = index["gram_ptr"]
+        self.gram_node = index["gram_node"]
+        self.weight = index["weight"]
+
+    @staticmethod
+    def _prefix_range(sorted_values: np.ndarray, prefix: str) -> slice:
+        lo = int(np.searchsorted(sorted_values, prefix, side="left"))
+        return slice(lo, int(np.searchsorted(sorted_values, prefix + _TERM_END, side="left")))
+
+    def _word_prefix_mask(self, words: list[str]) -> np.ndarray:
+        """Nodes with a word starting with each query word."""
+        found = np.ones(len(self.key), dtype=bool)
+        for word in words:
+            matched = np.zeros(len(self.key), dtype=bool)
+            matched[self.term_node[self._prefix_range(self.term, word)]] = True
+            found &= matched
+        return found
+
+    def _fuzzy_share(self, key: str) -> np.ndarray:
+        """Per node, the share of the query's trigrams its name contains."""
+        if len(self.gram) == 0:
+            return np.zeros(len(self.key))
+        query_grams = np.array(sorted(trigrams(key, closed=False)), dtype="<U3")
+        at = np.searchsorted(self.gram, query_grams)
+        at = at[(at < len(self.gram)) & (self.gram[np.minimum(at, len(self.gram) - 1)] == query_grams)]
+        postings = [self.gram_node[self.gram_ptr[i] : self.gram_ptr[i + 1]] for i in at]
+        hits = np.bincount(np.concatenate(postings), minlength=len(self.key)) if postings else np.zeros(len(self.key))
+        return hits / len(query_grams)
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list[int]:
+        """Up to `limit` node ids: exact name, name prefix, word prefixes, then fuzzy matches.
+
+        Within a tier, matches order by trigram share (when fuzzy matching ran), then weight and name.
+        """
+        key = normalize(query)
+        if not key:
+            return []
+        tier = np.where(self._word_prefix_mask(key.split()), WORD_PREFIX, FUZZY + 1)
+        named = self.key_node[self._prefix_range(self.key_sorted, key)]
+        tier[named] = np.where(self.key[named] == key, EXACT, NAME_PREFIX)
+        share = np.ones(len(self.key))
+        if np.count_nonzero(tier <= WORD_PREFIX) < limit and len(key) >= 3:
+            share = self._fuzzy_share(key)
+            fuzzy = (tier > WORD_PREFIX) & (share >= FUZZY_MIN_SHARE)
+            tier[fuzzy] = FUZZY
+        nodes = np.flatnonzero(tier <= FUZZY)
+        ranks = (-self.weight[nodes], -share[nodes], tier[nodes])
+        if len(nodes) > limit:
+            # Names only break ties, so they are compared among the best `limit` and whatever ties the last of them.
+            best = np.lexsort(ranks)
+            last = best[limit - 1]
+            ties = np.logical_and.reduce([rank == rank[last] for rank in ranks])
+            keep = np.union1d(best[:limit], np.flatnonzero(ties))
+            nodes, ranks = nodes[keep], tuple(rank[keep] for rank in ranks)
+        order = np.lexsort((self.key[nodes], *ranks))[:limit]
+        return nodes[order].tolist()
@@ -0,0 +1,84 @@
+"""Ad-level evidence behind attack edges for the Week 3 Dash drill-down panel.
+
+`scripts/week3_clean_attack_target_v1_1.py` writes the target mentions of every
+edge sorted by `(sponsor_name, canonical_entity_v1_1)` as an uncompressed Arrow
+IPC file, plus an index of each edge's `[row_start, row_stop)`. The file is
+memory-mapped, so a page is a slice of a few row ranges and never reads the
+rest of the table.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+EVIDENCE_PAGE_SIZE = 25
+
+
+class EvidenceStore:
+    """Row ranges per edge, sponsor and target over the memory-mapped evidence table."""
+
+    def __init__(self, table: pa.Table, index: pd.DataFrame) -> None:
+        if len(index) and int(index["row_stop"].iloc[-1]) != table.num_rows:
+            raise ValueError(
+                f"Evidence index covers {int(index['row_stop'].iloc[-1]):,} rows, table has {table.num_rows:,}; "
+                "rerun the cleaning script"
+            )
+        self.table = table
+        sponsors = index["sponsor_name"].tolist()
+        targets = index["canonical_entity_v1_1"].tolist()
+        ranges = list(zip(index["row_start"].tolist(), index["row_stop"].tolist()))
+        self._edges = dict(zip(zip(sponsors, targets), ranges))
+        # Rows are sorted by sponsor first: a sponsor's edges are one contiguous run.
+        self._sponsors: dict[str, tuple[int, int]] = {}
+        self._targets: dict[str, list[tuple[int, int]]] = {}
+        for sponsor, target, (start, stop) in zip(sponsors, targets, ranges):
+            first = self._sponsors.get(sponsor, (start, stop))[0]
+            self._sponsors[sponsor] = (first, stop)
+            self._targets.setdefault(target, []).append((start, stop))
+
+    @classmethod
+    def open(cls, table_path: Path, index_path: Path) -> "EvidenceStore":
+        with pa.memory_map(str(table_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        index = pd.read_csv(index_path, dtype={"sponsor_name": str, "canonical_entity_v1_1": str})
+        return cls(table, index)
+
+    def edge_ranges(self, sponsor: str, target: str) -> list[tuple[int, int]]:
+        found = self._edges.get((sponsor, target))
+        return [found] if found else []
+
+    def node_ranges(self, name: str, node_type: str) -> list[tuple[int, int]]:
+        if node_type == "sponsor":
+            found = self._sponsors.get(name)
+            return [found] if found else []
+        return self._targets.get(name, [])
+
+    @staticmethod
+    def row_count(ranges: list[tuple[int, int]]) -> int:
+        return sum(stop - start for start, stop in ranges)
+
+    def page(self, ranges: list[tuple[int, int]], page: int, page_size: int = EVIDENCE_PAGE_SIZE) -> pd.DataFrame:
+        """Rows `[page * page_size, (page + 1) * page_size)` of the concatenated ranges."""
+        lo = page * page_size
+        hi = min(lo + page_size, self.row_count(ranges))
+        pieces = []
+        offset = 0
+        for start, stop in ranges:
+            length = stop - start
+            if offset + length > lo and offset < hi:
+                first = max(lo - offset, 0)
+                pieces.append(self.table.slice(start + first, min(hi - offset, length) - first))
+            offset += length
+            if offset >= hi:
+                break
+        return pa.concat_tables(pieces).to_pandas() if pieces else self.table.slice(0, 0).to_pandas()
+
+
+def open_evidence_store(table_path: Path | None, index_path: Path | None) -> EvidenceStore | None:
+    """The evidence store, or None when disabled or not built yet (the panel says so)."""
+    if table_path is None or index_path is None or not table_path.exists() or not index_path.exists():
+        return None
+    return EvidenceStore.open(table_path, index_path)
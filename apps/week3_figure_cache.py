@@ -0,0 +1,110 @@
+"""Bounded LRU cache for per-filter-state figure work in the Week 3 Dash app."""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+
+V = TypeVar("V")
+
+# Caches whose lock is replaced in a forked child; weak, so a cache from a replaced runtime can still be freed.
+_LIVE_CACHES: weakref.WeakSet[FigureCache] = weakref.WeakSet()
+
+
+def _reset_locks_after_fork() -> None:
+    # A worker forked while another thread (e.g. prewarm) held a lock would inherit it locked.
+    for cache in list(_LIVE_CACHES):
+        cache._reset_lock()
+
+
+os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+def figure_cache_key(
+    sponsor_party_filter: list[str],
+    target_party_filter: list[str],
+    node_type_visible: list[str],
+    color_mode: str,
+    size_mode: str,
+    min_edge_mentions: int,
+    top_n_edges: int,
+    level_of_detail: bool = False,
+    viewport: tuple[int, int, int, int] | None = None,
+    date_window: tuple[int, int] | None = None,
+) -> tuple:
+    # Dropdowns and checklists report values in click order; order does not change the figure.
+    # `viewport` is already snapped to grid cells, so nearby zoom boxes share an entry.
+    return (
+        tuple(sorted(set(sponsor_party_filter))),
+        tuple(sorted(set(target_party_filter))),
+        tuple(sorted(set(node_type_visible))),
+        color_mode,
+        size_mode,
+        int(min_edge_mentions),
+        int(top_n_edges),
+        bool(level_of_detail),
+        tuple(viewport) if level_of_detail and viewport is not None else None,
+        tuple(date_window) if date_window is not None else None,
+    )
+
+
+class FigureCache:
+    """Thread-safe LRU mapping with hit/miss counters.
+
+    Values are shared between callers and must be treated as read-only.
+    `maxsize=0` disables caching (every lookup is a miss and nothing is stored).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = max(int(maxsize), 0)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        _LIVE_CACHES.add(self)
+
+    def _reset_lock(self) -> None:
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], V]) -> V:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]  # type: ignore[return-value]
+            self.misses += 1
+        # Build outside the lock; two threads missing the same key both build and the last one is kept.
+        value = build()
+        self.put(key, value)
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,375 @@
+"""Array-backed attack-target graph for the Dash callback hot path.
+
+Edges are held once, sorted by `mention_count` descending, with integer node
+ids and CSR adjacency in both directions. A callback then filters with
+boolean masks, cuts top-N as a prefix, counts degrees with `np.bincount` and
+walks neighborhoods through the CSR slices, without copying frames or
+building a NetworkX graph. A date window swaps in per-edge weights taken from
+prefix sums over the (edge, day) cube.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable
+
+import numpy as np
+import pandas as pd
+
+# Cells per side of the layout-wide node grid used for viewport lookups.
+VIEW_GRID_CELLS = 64
+
+
+@dataclass(frozen=True)
+class EdgeDayCube:
+    """Sparse (edge, day) counts as prefix sums, edges in `GraphArrays` order.
+
+    Entry k is edge `keys[k] // n_days` on day `first_day + keys[k] % n_days`
+    (days since 1970-01-01); `keys` is sorted, and `cum_*[k]` sums entries
+    before k. An edge's total over days [a, b] is `cum[hi] - cum[lo]` with lo, hi
+    the `searchsorted` positions of its keys for days a and b + 1.
+    """
+
+    first_day: int
+    n_days: int
+    keys: np.ndarray
+    cum_mentions: np.ndarray
+    cum_ads: np.ndarray
+    cum_spend: np.ndarray
+
+
+@dataclass(frozen=True)
+class EdgeWeights:
+    """Per-edge weights (GraphArrays edge order) for the whole cycle or one date window."""
+
+    mention_count: np.ndarray
+    ad_count: np.ndarray
+    attack_spend: np.ndarray
+    # Cube day offsets (first, last), inclusive; None for the whole cycle.
+    window: tuple[int, int] | None = None
+
+
+@dataclass(frozen=True)
+class GraphArrays:
+    node_names: np.ndarray
+    node_index: dict[Hashable, int]
+    is_sponsor: np.ndarray
+    node_party: np.ndarray
+    node_label: np.ndarray
+    sponsor_spend: np.ndarray
+    target_spend: np.ndarray
+    pos: np.ndarray
+    # Edges in descending mention_count order (stable), so thresholds and top-N are prefixes.
+    src: np.ndarray
+    dst: np.ndarray
+    mention_count: np.ndarray
+    ad_count: np.ndarray
+    attack_spend: np.ndarray
+    sponsor_party: np.ndarray
+    target_party: np.ndarray
+    party_categories: np.ndarray
+    # CSR adjacency: edge ids leaving / entering node i are out_edges[out_ptr[i]:out_ptr[i + 1]] etc.
+    out_ptr: np.ndarray
+    out_edges: np.ndarray
+    in_ptr: np.ndarray
+    in_edges: np.ndarray
+    # `point_grid` over all node positions; viewport boxes are snapped to its cells.
+    view_grid: dict[str, object]
+    days: EdgeDayCube
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_names)
+
+
+def _csr(keys: np.ndarray, n_nodes: int) -> tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(keys, kind="stable").astype(np.int64)
+    ptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n_nodes), out=ptr[1:])
+    return ptr, order
+
+
+def build_edge_day_cube(edge_days: pd.DataFrame, edge_rank: np.ndarray) -> EdgeDayCube:
+    """Prefix-sum cube from `edge_days` rows (`edge` = edge frame row, `edge_rank[row]` = sorted edge id)."""
+    day = edge_days["day"].to_numpy(dtype=np.int64)
+    first_day = int(day.min()) if len(day) else 0
+    n_days = int(day.max()) - first_day + 1 if len(day) else 0
+    keys = edge_rank[edge_days["edge"].to_numpy(dtype=np.int64)] * max(n_days, 1) + (day - first_day)
+    order = np.argsort(keys, kind="stable")
+
+    def cumulative(column: str, dtype: type) -> np.ndarray:
+        out = np.zeros(len(order) + 1, dtype=dtype)
+        np.cumsum(edge_days[column].to_numpy(dtype=dtype)[order], out=out[1:])
+        return out
+
+    return EdgeDayCube(
+        first_day=first_day,
+        n_days=n_days,
+        keys=keys[order],
+        cum_mentions=cumulative("mention_count", np.int64),
+        cum_ads=cumulative("ad_count", np.int64),
+        cum_spend=cumulative("edge_attack_spend", np.float64),
+    )
+
+
+def build_graph_arrays(
+    edges: pd.DataFrame,
+    node_table: pd.DataFrame,
+    positions: np.ndarray,
+    edge_days: pd.DataFrame,
+) -> GraphArrays:
+    """Index the annotated edge frame, node table, positions (rows = node ids) and (edge, day) cube from `load_runtime_data`."""
+    node_names = node_table["node_name"].to_numpy(dtype=object)
+    n_nodes = len(node_names)
+    names = pd.Index(node_names)
+
+    order = np.argsort(-edges["mention_count"].to_numpy(dtype=np.int64), kind="stable")
+    ordered = edges.iloc[order]
+    src = names.get_indexer(ordered["sponsor_name"]).astype(np.int64)
+    dst = names.get_indexer(ordered["canonical_entity_v1_1"]).astype(np.int64)
+
+    sponsor_party = ordered["sponsor_party"].astype(str).to_numpy()
+    target_party = ordered["target_party_inferred"].astype(str).to_numpy()
+    party_categories, party_codes = np.unique(np.concatenate([sponsor_party, target_party]), return_inverse=True)
+    out_ptr, out_edges = _csr(src, n_nodes)
+    in_ptr, in_edges = _csr(dst, n_nodes)
+    pos = np.array(positions, dtype=np.float64).reshape(-1, 2)
+    span = float(np.ptp(pos, axis=0).max()) if n_nodes else 0.0
+    edge_rank = np.empty(len(order), dtype=np.int64)
+    edge_rank[order] = np.arange(len(order))
+
+    return GraphArrays(
+        node_names=node_names,
+        node_index=dict(zip(node_names.tolist(), range(n_nodes))),
+        is_sponsor=(node_table["node_type"] == "sponsor").to_numpy(dtype=bool),
+        node_party=node_table["party"].astype(str).to_numpy(dtype=object),
+        node_label=node_table["label_mode"].astype(str).to_numpy(dtype=object),
+        sponsor_spend=node_table["sponsor_attack_spend"].to_numpy(dtype=np.float64),
+        target_spend=node_table["target_received_spend"].to_numpy(dtype=np.float64),
+        pos=pos,
+        src=src,
+        dst=dst,
+        mention_count=ordered["mention_count"].to_numpy(dtype=np.int64),
+        ad_count=ordered["ad_count"].to_numpy(dtype=np.int64),
+        attack_spend=ordered["edge_attack_spend"].to_numpy(dtype=np.float64),
+        sponsor_party=party_codes[: len(ordered)],
+        target_party=party_codes[len(ordered) :],
+        party_categories=party_categories,
+        out_ptr=out_ptr,
+        out_edges=out_edges,
+        in_ptr=in_ptr,
+        in_edges=in_edges,
+        view_grid=point_grid(pos, max(span, 1e-9) / VIEW_GRID_CELLS),
+        days=build_edge_day_cube(edge_days, edge_rank),
+    )
+
+
+def edge_weights(arrays: GraphArrays, window: tuple[int, int] | None = None) -> EdgeWeights:
+    """Edge weights over the whole cycle, or summed over cube days `window` = (first, last) offsets, inclusive."""
+    if window is None:
+        return EdgeWeights(arrays.mention_count, arrays.ad_count, arrays.attack_spend)
+    cube = arrays.days
+    first, last = max(int(window[0]), 0), min(int(window[1]), cube.n_days - 1)
+    base = np.arange(len(arrays.src), dtype=np.int64) * max(cube.n_days, 1)
+    lo = np.searchsorted(cube.keys, base + first)
+    hi = np.searchsorted(cube.keys, base + max(last + 1, first))
+    return EdgeWeights(
+        mention_count=cube.cum_mentions[hi] - cube.cum_mentions[lo],
+        ad_count=cube.cum_ads[hi] - cube.cum_ads[lo],
+        attack_spend=cube.cum_spend[hi] - cube.cum_spend[lo],
+        window=(first, last),
+    )
+
+
+def filter_edges(
+    arrays: GraphArrays,
+    sponsor_party_filter: list[str],
+    target_party_filter: list[str],
+    min_edge_mentions: int,
+    node_mask: np.ndarray | None = None,
+    weights: EdgeWeights | None = None,
+) -> np.ndarray:
+    """Edge ids passing the threshold and party filters, by mention_count descending.
+
+    With `node_mask`, only edges with at least one endpoint in the mask are kept.
+    With windowed `weights`, the threshold and order use their mention counts
+    (ties in whole-cycle order).
+    """
+    windowed = weights is not None and weights.window is not None
+    if windowed:
+        stop = len(arrays.src)
+        keep = weights.mention_count >= max(int(min_edge_mentions), 1)  # type: ignore[union-attr]
+    else:
+        # mention_count is sorted descending, so the threshold is a prefix.
+        stop = int(np.searchsorted(-arrays.mention_count, -int(min_edge_mentions), side="right"))
+        keep = np.ones(stop, dtype=bool)
+    if sponsor_party_filter:
+        keep &= np.isin(arrays.party_categories, sponsor_party_filter)[arrays.sponsor_party[:stop]]
+    if target_party_filter:
+        keep &= np.isin(arrays.party_categories, target_party_filter)[arrays.target_party[:stop]]
+    if node_mask is not None:
+        keep &= node_mask[arrays.src[:stop]] | node_mask[arrays.dst[:stop]]
+    edge_ids = np.flatnonzero(keep)
+    if windowed:
+        edge_ids = edge_ids[np.argsort(-weights.mention_count[edge_ids], kind="stable")]  # type: ignore[union-attr]
+    return edge_ids
+
+
+def visible_subgraph(
+    arrays: GraphArrays,
+    edge_ids: np.ndarray,
+    sponsors_visible: bool,
+    targets_visible: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Visible node ids and edge ids for the selected edges after node-type hiding.
+
+    Orders match iterating a `nx.DiGraph` built edge by edge from `edge_ids`:
+    nodes by first appearance, edges grouped by source in node order. Hiding a
+    node type drops its nodes and their edges but keeps the other endpoints.
+    """
+    if len(edge_ids) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    ends = np.column_stack([arrays.src[edge_ids], arrays.dst[edge_ids]]).ravel()
+    unique, first = np.unique(ends, return_index=True)
+    node_ids = unique[np.argsort(first, kind="stable")]
+
+    type_visible = np.where(arrays.is_sponsor, sponsors_visible, targets_visible)
+    node_ids = node_ids[type_visible[node_ids]]
+    edge_ids = edge_ids[type_visible[arrays.src[edge_ids]] & type_visible[arrays.dst[edge_ids]]]
+
+    rank = np.empty(arrays.n_nodes, dtype=np.int64)
+    rank[node_ids] = np.arange(len(node_ids))
+    edge_ids = edge_ids[np.argsort(rank[arrays.src[edge_ids]], kind="stable")]
+    return node_ids, edge_ids
+
+
+def neighborhood(
+    arrays: GraphArrays,
+    node_ids: np.ndarray,
+    edge_ids: np.ndarray,
+    seeds: list[dict[str, str]],
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Highlight masks `(nodes, edges)` over all ids for seeds visible in the subgraph.
+
+    Sponsor seeds reach their targets through out-edges, target seeds their
+    sponsors through in-edges. Returns the number of seeds that were visible.
+    """
+    node_visible = np.zeros(arrays.n_nodes, dtype=bool)
+    node_visible[node_ids] = True
+    edge_visible = np.zeros(len(arrays.src), dtype=bool)
+    edge_visible[edge_ids] = True
+
+    hi_nodes = np.zeros(arrays.n_nodes, dtype=bool)
+    hi_edges = np.zeros(len(arrays.src), dtype=bool)
+    visible_seeds = 0
+    for seed in seeds:
+        node = arrays.node_index.get(seed.get("name"))
+        if node is None or not node_visible[node]:
+            continue
+        visible_seeds += 1
+        if seed.get("type") == "sponsor":
+            incident = arrays.out_edges[arrays.out_ptr[node] : arrays.out_ptr[node + 1]]
+            incident = incident[edge_visible[incident]]
+            hi_nodes[arrays.dst[incident]] = True
+        elif seed.get("type") == "target":
+            incident = arrays.in_edges[arrays.in_ptr[node] : arrays.in_ptr[node + 1]]
+            incident = incident[edge_visible[incident]]
+            hi_nodes[arrays.src[incident]] = True
+        else:
+            continue
+        hi_nodes[node] = True
+        hi_edges[incident] = True
+    return hi_nodes, hi_edges, visible_seeds
+
+
+def local_csr(arrays: GraphArrays, node_order: np.ndarray, edge_ids: np.ndarray) -> dict[str, list[int]]:
+    """CSR adjacency of a visible subgraph renumbered for the browser.
+
+    Node `node_order[i]` becomes local node `i` and edge `edge_ids[j]` local edge
+    `j`; both endpoints of every edge must be in `node_order`.
+    """
+    local = np.full(arrays.n_nodes, -1, dtype=np.int64)
+    local[node_order] = np.arange(len(node_order))
+    out_ptr, out_edges = _csr(local[arrays.src[edge_ids]], len(node_order))
+    in_ptr, in_edges = _csr(local[arrays.dst[edge_ids]], len(node_order))
+    return {
+        "out_ptr": out_ptr.tolist(),
+        "out_edges": out_edges.tolist(),
+        "in_ptr": in_ptr.tolist(),
+        "in_edges": in_edges.tolist(),
+    }
+
+
+def point_grid(xy: np.ndarray, cell: float) -> dict[str, object]:
+    """Uniform grid over points `xy` with square cells of side `cell`, bucketed as CSR.
+
+    Points in cell `(i, j)` are `points[ptr[k]:ptr[k + 1]]` with `k = j * shape[0] + i`,
+    so a row of cells `i0..i1` is one contiguous slice. With `cell` equal to a
+    search radius, every point within the radius of a query lies in the 3x3
+    block of cells around it.
+    """
+    origin = xy.min(axis=0) if len(xy) else np.zeros(2)
+    cells = np.floor((xy - origin) / cell).astype(np.int64)
+    shape = cells.max(axis=0) + 1 if len(xy) else np.ones(2, dtype=np.int64)
+    ptr, points = _csr(cells[:, 1] * shape[0] + cells[:, 0], int(shape[0] * shape[1]))
+    return {"origin": origin, "cell": float(cell), "shape": shape, "ptr": ptr, "points": points}
+
+
+def grid_cell_range(grid: dict[str, object], x0: float, x1: float, y0: float, y1: float) -> tuple[int, int, int, int]:
+    """Inclusive cell bounds `(i0, i1, j0, j1)` overlapping a box, clipped to the grid (may be empty)."""
+    origin: np.ndarray = grid["origin"]  # type: ignore[assignment]
+    shape: np.ndarray = grid["shape"]  # type: ignore[assignment]
+    cell: float = grid["cell"]  # type: ignore[assignment]
+    i0, i1 = (int(np.floor((v - origin[0]) / cell)) for v in (min(x0, x1), max(x0, x1)))
+    j0, j1 = (int(np.floor((v - origin[1]) / cell)) for v in (min(y0, y1), max(y0, y1)))
+    return max(i0, 0), min(i1, int(shape[0]) - 1), max(j0, 0), min(j1, int(shape[1]) - 1)
+
+
+def points_in_cells(grid: dict[str, object], cells: tuple[int, int, int, int]) -> np.ndarray:
+    """Point ids in the inclusive cell range from `grid_cell_range`."""
+    ptr: np.ndarray = grid["ptr"]  # type: ignore[assignment]
+    points: np.ndarray = grid["points"]  # type: ignore[assignment]
+    n_x = int(grid["shape"][0])  # type: ignore[index]
+    i0, i1, j0, j1 = cells
+    if i0 > i1 or j0 > j1:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate([points[ptr[j * n_x + i0] : ptr[j * n_x + i1 + 1]] for j in range(j0, j1 + 1)])
+
+
+def hidden_node_clusters(
+    arrays: GraphArrays,
+    candidate_edges: np.ndarray,
+    shown_nodes: np.ndarray,
+    shown_edges: np.ndarray,
+    node_visible: np.ndarray,
+    origin: np.ndarray,
+    cell: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Aggregate filtered-in nodes that are not drawn into grid-cell clusters.
+
+    Hidden nodes are endpoints of `candidate_edges` outside `shown_nodes` (and
+    allowed by `node_visible`); hidden edges are candidates outside
+    `shown_edges`, counted at their first hidden endpoint. Returns per-cluster
+    centroid xy, hidden node counts and hidden edge counts.
+    """
+    shown = np.zeros(arrays.n_nodes, dtype=bool)
+    shown[shown_nodes] = True
+    ends = np.unique(np.concatenate([arrays.src[candidate_edges], arrays.dst[candidate_edges]]))
+    hidden = ends[~shown[ends] & node_visible[ends]]
+    if len(hidden) == 0:
+        return np.zeros((0, 2)), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    cells = np.floor((arrays.pos[hidden] - origin) / cell).astype(np.int64)
+    _, cluster = np.unique(cells, axis=0, return_inverse=True)
+    cluster = cluster.ravel()
+    node_counts = np.bincount(cluster)
+    centroids = np.column_stack(
+        [np.bincount(cluster, weights=arrays.pos[hidden, axis]) / node_counts for axis in (0, 1)]
+    )
+
+    cluster_of = np.full(arrays.n_nodes, -1, dtype=np.int64)
+    cluster_of[hidden] = cluster
+    edges = np.setdiff1d(candidate_edges, shown_edges, assume_unique=True)
+    edge_cluster = np.where(cluster_of[arrays.src[edges]] >= 0, cluster_of[arrays.src[edges]], cluster_of[arrays.dst[edges]])
+    edge_counts = np.bincount(edge_cluster[edge_cluster >= 0], minlength=len(node_counts))
+    return centroids, node_counts, edge_counts
@@ -0,0 +1,632 @@
+"""Scalable graph layouts for the attack-target static renderer and Dash app.
+
+`nx.spring_layout` is exact Fruchterman-Reingold: quadratic per iteration and
+dependent on scipy above ~500 nodes. This module keeps it for small graphs and
+adds vectorized NumPy engines that scale to full sponsor-target graphs:
+
+- `barnes_hut`: Fruchterman-Reingold with grid-based Barnes-Hut repulsion.
+  Far-field forces are computed between quadtree cells (center of mass),
+  near-field forces per node against neighboring cells, so each iteration is
+  roughly linear in nodes + edges. `LayoutParams.gravity` (off by default)
+  adds a pull toward the centroid.
+- `bipartite`: sponsors and targets on two rows, ordered by barycenter sweeps
+  to reduce edge crossings.
+- `spring`: `nx.spring_layout`, for small graphs and backward-compatible pictures.
+- `auto`: `spring` below `SPRING_NODE_LIMIT` nodes, otherwise `barnes_hut`.
+
+All engines are deterministic for a given seed and return positions within
+[-1, 1] (force layouts are rescaled like `nx.rescale_layout`).
+
+`cached_layout_graph` adds a persistent `.npz` cache keyed by a hash of the
+node/edge set and the layout parameters, so the static renderer and the Dash
+app reuse positions instead of recomputing them. When the graph changes
+slightly, the previous cached layout warm-starts the new one: new nodes are
+placed next to their neighbors and only new or changed nodes are refined.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Hashable
+
+import networkx as nx
+import numpy as np
+
+LAYOUT_ALGORITHMS = ("auto", "spring", "barnes_hut", "bipartite")
+SPRING_NODE_LIMIT = 500
+# Bump when engine changes would alter positions for the same inputs.
+LAYOUT_CACHE_VERSION = 1
+# Warm starts need most nodes to already have a position; otherwise lay out cold.
+WARM_START_MIN_OVERLAP = 0.5
+
+# Target number of nodes per finest-level quadtree cell.
+_LEAF_SIZE = 8
+_MAX_DEPTH = 10
+_MIN_DISTANCE_SQ = 1e-4
+
+
+@dataclass(frozen=True)
+class LayoutParams:
+    algorithm: str = "auto"
+    k: float | None = 0.42
+    seed: int = 42
+    iterations: int = 50
+    warm_iterations: int = 15
+    # Pull toward the centroid, so small disconnected components do not drift off and shrink the
+    # main component when the layout is rescaled. It also tightens clusters; 0 disables it.
+    # Only the vectorized engines apply it (`spring` ignores it).
+    gravity: float = 0.0
+
+
+def layout_params_dict(params: LayoutParams) -> dict[str, object]:
+    """`asdict(params)` for cache keys and manifests; gravity is left out while off,
+    so layouts cached before it existed stay valid."""
+    values = asdict(params)
+    if not values["gravity"]:
+        del values["gravity"]
+    return values
+
+
+@dataclass(frozen=True)
+class WarmStart:
+    """Previous layout used to seed an incremental one (keyed by node name)."""
+
+    positions: dict[str, np.ndarray]
+    degrees: dict[str, int] = field(default_factory=dict)
+
+
+def resolve_algorithm(algorithm: str, n_nodes: int) -> str:
+    if algorithm not in LAYOUT_ALGORITHMS:
+        raise ValueError(f"Unknown layout algorithm {algorithm!r}; expected one of {LAYOUT_ALGORITHMS}.")
+    if algorithm == "auto":
+        return "spring" if n_nodes < SPRING_NODE_LIMIT else "barnes_hut"
+    return algorithm
+
+
+def rescale(pos: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    if len(pos) == 0:
+        return pos
+    out = pos - pos.mean(axis=0)
+    lim = float(np.abs(out).max())
+    if lim > 0:
+        out *= scale / lim
+    return out
+
+
+def _attraction(
+    pos: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    k: float,
+    weights: np.ndarray | None,
+) -> np.ndarray:
+    n = len(pos)
+    delta = pos[src] - pos[dst]
+    dist = np.hypot(delta[:, 0], delta[:, 1])
+    scale = dist / k
+    if weights is not None:
+        scale = scale * weights
+    force = delta * scale[:, None]
+    disp = np.empty_like(pos)
+    for axis in range(2):
+        disp[:, axis] = np.bincount(dst, weights=force[:, axis], minlength=n) - np.bincount(
+            src, weights=force[:, axis], minlength=n
+        )
+    return disp
+
+
+def _coarsen(grid: np.ndarray) -> np.ndarray:
+    g = grid.shape[0] // 2
+    return grid.reshape(g, 2, g, 2).sum(axis=(1, 3))
+
+
+def _repulsion(pos: np.ndarray, k: float) -> np.ndarray:
+    """Approximate all-pairs repulsion `k^2 / d` with a uniform quadtree."""
+    n = len(pos)
+    lo = pos.min(axis=0)
+    extent = max(float((pos.max(axis=0) - lo).max()), 1e-12)
+    depth = min(_MAX_DEPTH, max(2, math.ceil(math.log(max(n / _LEAF_SIZE, 1.0), 4))))
+    g = 1 << depth
+    cell = np.minimum(((pos - lo) / extent * g).astype(np.int64), g - 1)
+    flat = cell[:, 0] * g + cell[:, 1]
+
+    mass = np.bincount(flat, minlength=g * g).astype(float).reshape(g, g)
+    sum_x = np.bincount(flat, weights=pos[:, 0], minlength=g * g).reshape(g, g)
+    sum_y = np.bincount(flat, weights=pos[:, 1], minlength=g * g).reshape(g, g)
+    pyramid = [(mass, sum_x, sum_y)]
+    for _ in range(depth - 2):
+        m, sx, sy = pyramid[-1]
+        pyramid.append((_coarsen(m), _coarsen(sx), _coarsen(sy)))
+    pyramid.reverse()  # pyramid[i] is level i + 2
+
+    k2 = k * k
+    far_x = np.zeros((4, 4))
+    far_y = np.zeros((4, 4))
+    for level_mass, level_sx, level_sy in pyramid:
+        gl = level_mass.shape[0]
+        if far_x.shape[0] != gl:
+            far_x = far_x.repeat(2, axis=0).repeat(2, axis=1)
+            far_y = far_y.repeat(2, axis=0).repeat(2, axis=1)
+        occupied = np.maximum(level_mass, 1.0)
+        com_x = level_sx / occupied
+        com_y = level_sy / occupied
+        flat_mass = level_mass.ravel()
+        flat_cx = com_x.ravel()
+        flat_cy = com_y.ravel()
+        ix = np.arange(gl)[:, None]
+        iy = np.arange(gl)[None, :]
+        base_x = (ix >> 1) * 2 - 2
+        base_y = (iy >> 1) * 2 - 2
+        # Interaction list: children of the parent's neighbors that are not our own neighbors.
+        for jx in range(6):
+            ox = base_x + jx
+            near_x = np.abs(ox - ix) <= 1
+            valid_x = (ox >= 0) & (ox < gl)
+            row = np.clip(ox, 0, gl - 1) * gl
+            for jy in range(6):
+                oy = base_y + jy
+                valid = valid_x & (oy >= 0) & (oy < gl) & ~(near_x & (np.abs(oy - iy) <= 1))
+                other = row + np.clip(oy, 0, gl - 1)
+                dx = com_x - flat_cx[other]
+                dy = com_y - flat_cy[other]
+                d2 = np.maximum(dx * dx + dy * dy, _MIN_DISTANCE_SQ)
+                scale = np.where(valid, flat_mass[other], 0.0) * k2 / d2
+                far_x += dx * scale
+                far_y += dy * scale
+
+    disp = np.column_stack([far_x.ravel()[flat], far_y.ravel()[flat]])
+
+    # Near field at the finest level: neighbor cells by center of mass, own cell excluding self.
+    for ddx in (-1, 0, 1):
+        nx_ = cell[:, 0] + ddx
+        valid_x = (nx_ >= 0) & (nx_ < g)
+        nxc = np.clip(nx_, 0, g - 1)
+        for ddy in (-1, 0, 1):
+            ny_ = cell[:, 1] + ddy
+            valid = valid_x & (ny_ >= 0) & (ny_ < g)
+            nyc = np.clip(ny_, 0, g - 1)
+            m = np.where(valid, mass[nxc, nyc], 0.0)
+            sx = sum_x[nxc, nyc]
+            sy = sum_y[nxc, nyc]
+            if ddx == 0 and ddy == 0:
+                m = m - 1.0
+                sx = sx - pos[:, 0]
+                sy = sy - pos[:, 1]
+            occupied = np.maximum(m, 1.0)
+            dx = pos[:, 0] - sx / occupied
+            dy = pos[:, 1] - sy / occupied
+            d2 = np.maximum(dx * dx + dy * dy, _MIN_DISTANCE_SQ)
+            scale = k2 * np.maximum(m, 0.0) / d2
+            disp[:, 0] += dx * scale
+            disp[:, 1] += dy * scale
+    return disp
+
+
+def _gravity(pos: np.ndarray, k: float, gravity: float) -> np.ndarray:
+    offset = pos - pos.mean(axis=0)
+    radius = max(float(np.abs(offset).max()), 1e-9)
+    return -offset * (gravity * len(pos) * k / radius)
+
+
+def _force_directed(
+    pos: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    k: float,
+    iterations: int,
+    temperature: float,
+    weights: np.ndarray | None = None,
+    movable: np.ndarray | None = None,
+    gravity: float = 0.0,
+) -> np.ndarray:
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        disp = _repulsion(pos, k) + _attraction(pos, src, dst, k, weights)
+        if gravity:
+            disp += _gravity(pos, k, gravity)
+        length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 1e-9)
+        step = disp * (np.minimum(length, temperature) / length)[:, None]
+        if movable is not None:
+            step[~movable] = 0.0
+        pos += step
+        temperature -= cooling
+    return pos
+
+
+def barnes_hut_layout(
+    src: np.ndarray,
+    dst: np.ndarray,
+    n_nodes: int,
+    k: float | None = None,
+    seed: int = 42,
+    iterations: int = 50,
+    weights: np.ndarray | None = None,
+    gravity: float = 0.0,
+) -> np.ndarray:
+    """Fruchterman-Reingold layout with grid Barnes-Hut repulsion."""
+    if n_nodes == 0:
+        return np.zeros((0, 2))
+    rng = np.random.default_rng(seed)
+    k = float(k) if k else 1.0 / math.sqrt(n_nodes)
+    # Start in a box sized for the target spacing so large graphs can unfold.
+    span = max(1.0, k * math.sqrt(n_nodes))
+    pos = rng.random((n_nodes, 2)) * span
+    if n_nodes == 1:
+        return rescale(pos)
+    return rescale(_force_directed(pos, src, dst, k, iterations, 0.1 * span, weights, gravity=gravity))
+
+
+def bipartite_layout(
+    src: np.ndarray,
+    dst: np.ndarray,
+    n_nodes: int,
+    is_source: np.ndarray,
+    seed: int = 42,
+    iterations: int = 50,
+    initial_x: np.ndarray | None = None,
+) -> np.ndarray:
+    """Two-row layout: sources on top, targets below, ordered by barycenter sweeps.
+
+    `initial_x` (values in [-1, 1]) replaces the random starting order; with
+    `iterations=0` the layout only re-spaces that order, which is how warm
+    starts keep rows stable.
+    """
+    if n_nodes == 0:
+        return np.zeros((0, 2))
+    rng = np.random.default_rng(seed)
+    x = rng.random(n_nodes) if initial_x is None else (np.asarray(initial_x, dtype=float) + 1.0) / 2.0
+    sides = [np.flatnonzero(~is_source), np.flatnonzero(is_source)]
+    deg_to = [np.bincount(dst, minlength=n_nodes), np.bincount(src, minlength=n_nodes)]
+    sweeps = min(iterations, 12)
+    for _ in range(sweeps):
+        for side, (members, from_idx, to_idx) in enumerate(
+            [(sides[0], src, dst), (sides[1], dst, src)]
+        ):
+            if len(members) == 0:
+                continue
+            deg = deg_to[side]
+            total = np.bincount(to_idx, weights=x[from_idx], minlength=n_nodes)
+            bary = np.where(deg > 0, total / np.maximum(deg, 1), x)
+            order = np.lexsort((x[members], bary[members]))
+            x[members[order]] = np.linspace(0.0, 1.0, len(members)) if len(members) > 1 else 0.5
+    if sweeps == 0:
+        for members in sides:
+            order = np.argsort(x[members], kind="stable")
+            x[members[order]] = np.linspace(0.0, 1.0, len(members)) if len(members) > 1 else 0.5
+    return np.column_stack([x * 2.0 - 1.0, np.where(is_source, 0.5, -0.5)])
+
+
+def seed_new_positions(
+    initial: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    seed: int = 42,
+    rounds: int = 3,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fill NaN rows of `initial` with the mean of already-placed neighbors.
+
+    Placement propagates for a few rounds so chains of new nodes land near the
+    existing graph; anything still unplaced goes to a random spot in the
+    bounding box. Returns the filled positions and the mask of new nodes.
+    """
+    rng = np.random.default_rng(seed)
+    pos = np.array(initial, dtype=float, copy=True)
+    n = len(pos)
+    new = np.isnan(pos).any(axis=1)
+    placed = ~new
+    if placed.any():
+        lo = pos[placed].min(axis=0)
+        hi = pos[placed].max(axis=0)
+    else:
+        lo, hi = np.full(2, -1.0), np.full(2, 1.0)
+    jitter = 0.01 * max(float((hi - lo).max()), 1e-6)
+
+    ends_a = np.concatenate([src, dst])
+    ends_b = np.concatenate([dst, src])
+    for _ in range(rounds):
+        if placed.all():
+            break
+        known = placed[ends_b]
+        count = np.bincount(ends_a[known], minlength=n)
+        fill = ~placed & (count > 0)
+        if not fill.any():
+            break
+        for axis in range(2):
+            total = np.bincount(ends_a[known], weights=pos[ends_b[known], axis], minlength=n)
+            pos[fill, axis] = total[fill] / count[fill] + rng.normal(0.0, jitter, int(fill.sum()))
+        placed |= fill
+
+    rest = ~placed
+    if rest.any():
+        pos[rest] = lo + rng.random((int(rest.sum()), 2)) * (hi - lo)
+    return pos, new
+
+
+def refine_layout(
+    initial: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    params: LayoutParams,
+    changed: np.ndarray | None = None,
+    weights: np.ndarray | None = None,
+) -> np.ndarray:
+    """Warm-start a force layout from previous positions (NaN rows = new nodes).
+
+    New nodes start near their neighbors. Only new or `changed` nodes move,
+    for `params.warm_iterations` low-temperature iterations, while still
+    feeling forces from the whole graph; every other node keeps its previous
+    position exactly.
+    """
+    n_nodes = len(initial)
+    pos, new = seed_new_positions(initial, src, dst, seed=params.seed)
+    movable = new if changed is None else (new | changed)
+    if n_nodes < 2 or not movable.any():
+        return pos
+
+    k = float(params.k) if params.k else 1.0 / math.sqrt(n_nodes)
+    # Previous positions are in [-1, 1]; work at the cold-start scale so `k` means the same spacing.
+    scale = max(1.0, k * math.sqrt(n_nodes)) / 2.0
+    refined = _force_directed(
+        pos * scale,
+        src,
+        dst,
+        k,
+        params.warm_iterations,
+        0.05 * scale,
+        weights,
+        movable=movable,
+        gravity=params.gravity,
+    )
+    return refined / scale
+
+
+def compute_layout(
+    src: np.ndarray,
+    dst: np.ndarray,
+    n_nodes: int,
+    params: LayoutParams,
+    weights: np.ndarray | None = None,
+    initial: np.ndarray | None = None,
+    changed: np.ndarray | None = None,
+) -> np.ndarray:
+    """Lay out integer edge arrays; returns an `(n_nodes, 2)` position array.
+
+    `initial` warm-starts from previous positions (NaN rows for new nodes);
+    `changed` flags known nodes whose edges changed. `spring` is not
+    available on integer arrays and resolves to `barnes_hut`.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    algorithm = resolve_algorithm(params.algorithm, n_nodes)
+    if algorithm == "bipartite":
+        is_source = np.bincount(src, minlength=n_nodes) > 0
+        initial_x = None
+        iterations = params.iterations
+        if initial is not None:
+            initial_x = seed_new_positions(initial, src, dst, seed=params.seed)[0][:, 0]
+            iterations = 0
+        return bipartite_layout(
+            src,
+            dst,
+            n_nodes,
+            is_source,
+            seed=params.seed,
+            iterations=iterations,
+            initial_x=initial_x,
+        )
+    if initial is not None:
+        return refine_layout(initial, src, dst, params, changed=changed, weights=weights)
+    return barnes_hut_layout(
+        src,
+        dst,
+        n_nodes,
+        k=params.k,
+        seed=params.seed,
+        iterations=params.iterations,
+        weights=weights,
+        gravity=params.gravity,
+    )
+
+
+def layout_graph(
+    graph: nx.Graph,
+    params: LayoutParams,
+    warm_start: WarmStart | None = None,
+) -> dict[Hashable, np.ndarray]:
+    """Lay out a NetworkX graph and return `{node: array([x, y])}` like `nx.spring_layout`."""
+    nodes = list(graph.nodes())
+    node_index = {node: i for i, node in enumerate(nodes)}
+    edge_list = list(graph.edges())
+    src = np.fromiter((node_index[u] for u, _ in edge_list), dtype=np.int64, count=len(edge_list))
+    dst = np.fromiter((node_index[v] for _, v in edge_list), dtype=np.int64, count=len(edge_list))
+
+    initial = None
+    changed = None
+    if warm_start is not None:
+        initial = np.full((len(nodes), 2), np.nan)
+        changed = np.zeros(len(nodes), dtype=bool)
+        for i, node in enumerate(nodes):
+            prev = warm_start.positions.get(str(node))
+            if prev is not None:
+                initial[i] = prev
+                prev_degree = warm_start.degrees.get(str(node))
+                changed[i] = prev_degree is not None and prev_degree != graph.degree(node)
+
+    algorithm = resolve_algorithm(params.algorithm, len(nodes))
+    if algorithm == "spring":
+        # Warm starts use the vectorized refinement, which can pin unchanged nodes exactly.
+        if initial is None:
+            try:
+                return nx.spring_layout(graph, k=params.k, seed=params.seed, iterations=params.iterations)
+            except ModuleNotFoundError as exc:
+                # Sparse spring_layout needs scipy; the vectorized engine does not.
+                if exc.name != "scipy":
+                    raise
+        algorithm = "barnes_hut"
+
+    pos = compute_layout(
+        src,
+        dst,
+        len(nodes),
+        replace(params, algorithm=algorithm),
+        initial=initial,
+        changed=changed,
+    )
+    return dict(zip(nodes, pos))
+
+
+def layout_cache_key(graph: nx.Graph, params: LayoutParams) -> str:
+    """Stable hash of the node set, edge set and layout parameters."""
+    return _layout_key(
+        graph.is_directed(),
+        np.array([str(n) for n in graph.nodes()], dtype=str),
+        np.array([f"{u}\x1f{v}" for u, v in graph.edges()], dtype=str),
+        params,
+    )
+
+
+def _layout_key(directed: bool, nodes: np.ndarray, edges: np.ndarray, params: LayoutParams) -> str:
+    digest = hashlib.sha256()
+    header = {"version": LAYOUT_CACHE_VERSION, "directed": directed, **layout_params_dict(params)}
+    digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+    nodes = np.sort(nodes)
+    edges = np.sort(edges)
+    digest.update("\x1e".join(nodes.tolist()).encode("utf-8"))
+    digest.update(b"\x1d")
+    digest.update("\x1e".join(edges.tolist()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def layout_cache_path(cache_dir: Path, key: str, params: LayoutParams) -> Path:
+    return cache_dir / f"layout_v{LAYOUT_CACHE_VERSION}_{params.algorithm}_{key[:20]}.npz"
+
+
+def load_cached_layout(path: Path, key: str) -> dict[str, np.ndarray] | None:
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != LAYOUT_CACHE_VERSION or meta.get("key") != key:
+                return None
+            names = data["names"]
+            positions = data["positions"]
+    except (OSError, ValueError, KeyError):
+        return None
+    return dict(zip(names.tolist(), positions))
+
+
+def load_warm_start(cache_dir: Path, params: LayoutParams) -> WarmStart | None:
+    """Most recent cached layout built with the same parameters, if any."""
+    if not cache_dir.exists():
+        return None
+    pattern = f"layout_v{LAYOUT_CACHE_VERSION}_{params.algorithm}_*.npz"
+    candidates = sorted(cache_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+    for path in candidates:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("params") != layout_params_dict(params):
+                    continue
+                names = data["names"].tolist()
+                positions = dict(zip(names, data["positions"]))
+                degrees = dict(zip(names, data["degrees"].tolist())) if "degrees" in data else {}
+        except (OSError, ValueError, KeyError):
+            continue
+        return WarmStart(positions=positions, degrees=degrees)
+    return None
+
+
+def save_cached_layout(
+    path: Path,
+    key: str,
+    params: LayoutParams,
+    positions: dict[Hashable, np.ndarray],
+    degrees: dict[Hashable, int] | None = None,
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    names = np.array([str(n) for n in positions], dtype=str)
+    coords = np.array([positions[n] for n in positions], dtype=float).reshape(-1, 2)
+    degree_values = np.array([(degrees or {}).get(n, -1) for n in positions], dtype=np.int64)
+    meta = json.dumps({"version": LAYOUT_CACHE_VERSION, "key": key, "params": layout_params_dict(params)})
+    # Write to a temp file and rename so concurrent readers never see a partial cache.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, names=names, positions=coords, degrees=degree_values, meta=np.array(meta))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def cached_layout_graph(
+    graph: nx.Graph,
+    params: LayoutParams,
+    cache_dir: Path | None,
+    warm_start: bool = True,
+) -> dict[Hashable, np.ndarray]:
+    """`layout_graph` backed by the on-disk layout cache (disabled when `cache_dir` is None).
+
+    On a cache miss with `warm_start`, the newest cached layout with the same
+    parameters seeds an incremental layout when it already covers at least
+    `WARM_START_MIN_OVERLAP` of the nodes, so positions stay stable across
+    small data changes. Cached positions are keyed by node name as a string,
+    so graph nodes are expected to be strings (as in the attack-target graphs).
+    """
+    if cache_dir is None:
+        return layout_graph(graph, params)
+
+    key = layout_cache_key(graph, params)
+    path = layout_cache_path(cache_dir, key, params)
+    cached = load_cached_layout(path, key)
+    if cached is not None and len(cached) == graph.number_of_nodes():
+        return {node: cached[str(node)] for node in graph.nodes()}
+
+    previous = load_warm_start(cache_dir, params) if warm_start else None
+    if previous is not None:
+        overlap = sum(1 for node in graph.nodes() if str(node) in previous.positions)
+        if overlap < WARM_START_MIN_OVERLAP * graph.number_of_nodes():
+            previous = None
+    positions = layout_graph(graph, params, warm_start=previous)
+    try:
+        save_cached_layout(path, key, params, positions, degrees=dict(graph.degree()))
+    except OSError:
+        # Read-only deployments still work; they just recompute on startup.
+        pass
+    return positions
+
+
+def cached_layout_arrays(
+    node_names: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    params: LayoutParams,
+    cache_dir: Path | None,
+    warm_start: bool = True,
+) -> np.ndarray:
+    """`cached_layout_graph` for a directed graph given as node names and integer edge arrays.
+
+    Returns an `(n_nodes, 2)` array in `node_names` order. Uses the same cache
+    entries as the equivalent `nx.DiGraph` (nodes in `node_names` order, edges
+    in array order), which is only built on a cache miss.
+    """
+    names = np.asarray(node_names).astype(str)
+    if cache_dir is not None:
+        edge_keys = np.char.add(np.char.add(names[src], "\x1f"), names[dst])
+        key = _layout_key(True, names, edge_keys, params)
+        cached = load_cached_layout(layout_cache_path(cache_dir, key, params), key)
+        if cached is not None and len(cached) == len(names):
+            return np.array([cached[name] for name in names.tolist()], dtype=float).reshape(-1, 2)
+
+    graph = nx.DiGraph()
+    graph.add_nodes_from(node_names)
+    graph.add_edges_from(zip(np.asarray(node_names)[src], np.asarray(node_names)[dst]))
+    positions = cached_layout_graph(graph, params, cache_dir, warm_start=warm_start)
+    return np.array([positions[name] for name in node_names], dtype=float).reshape(-1, 2)
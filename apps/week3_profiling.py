@@ -0,0 +1,87 @@
+"""Opt-in cProfile dumps for Week 3 Dash callbacks and runtime loading.
+
+`DELTA_PROFILE=1` profiles every call of the wrapped functions, `DELTA_PROFILE=N`
+every Nth call per function. Each profile is written to
+`<dir>/<name>-<inputs hash>-<pid>-<seq>.prof`, with the inputs for that hash in
+`<name>-<inputs hash>.json`, so slow filter combinations can be found and
+replayed offline (`python -m pstats`, snakeviz).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import hashlib
+import itertools
+import json
+import os
+import sys
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def inputs_digest(args: tuple, kwargs: dict) -> tuple[str, str]:
+    """Canonical JSON of the call inputs and its short hash."""
+    payload = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12], payload
+
+
+class Profiler:
+    """Wraps calls in cProfile when enabled (`every` > 0); a no-op otherwise."""
+
+    def __init__(self, out_dir: Path, every: int) -> None:
+        self.out_dir = out_dir
+        self.every = max(int(every), 0)
+        self._calls: defaultdict[str, itertools.count] = defaultdict(itertools.count)
+        self._seq = itertools.count(1)
+        # Only one cProfile can be active per process on Python 3.12+; overlapping calls run unprofiled.
+        self._active = threading.Lock()
+
+    @classmethod
+    def from_env(cls, default_dir: Path) -> "Profiler":
+        setting = os.getenv("DELTA_PROFILE", "0").strip()
+        every = int(setting) if setting.isdigit() else 0
+        out_dir = os.getenv("DELTA_PROFILE_DIR", "").strip()
+        return cls(Path(out_dir).expanduser().resolve() if out_dir else default_dir, every)
+
+    def wants(self, name: str) -> bool:
+        # `next` on a shared count is atomic under the GIL.
+        return self.every > 0 and next(self._calls[name]) % self.every == 0
+
+    def call(self, name: str, func: Callable[..., T], *args, **kwargs) -> T:
+        if not self.wants(name) or not self._active.acquire(blocking=False):
+            return func(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func, *args, **kwargs)
+        finally:
+            self._active.release()
+            self.dump(name, profile, args, kwargs)
+
+    def profile(self, name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+        def decorate(func: Callable[..., T]) -> Callable[..., T]:
+            if self.every == 0:
+                return func
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return self.call(name, func, *args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    def dump(self, name: str, profile: cProfile.Profile, args: tuple, kwargs: dict) -> None:
+        digest, payload = inputs_digest(args, kwargs)
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            inputs_path = self.out_dir / f"{name}-{digest}.json"
+            if not inputs_path.exists():
+                inputs_path.write_text(payload, encoding="utf-8")
+            profile.dump_stats(self.out_dir / f"{name}-{digest}-{os.getpid()}-{next(self._seq):06d}.prof")
+        except OSError as exc:
+            print(f"profile dump for {name} failed: {exc}", file=sys.stderr)
@@ -0,0 +1,227 @@
+"""Precomputed runtime bundle for the Week 3 attack-target Dash app.
+
+A bundle is a directory of `.npy` arrays plus `manifest.json`, written by
+`scripts/week3_build_runtime_bundle_v1_1.py`. Loading memory-maps the arrays,
+so app startup skips CSV parsing, graph assembly and layout entirely.
+
+Layout:
+- `node_name`, `node_pos`, `node__<attr>`: one row per graph node (node id = row).
+- `edge_src`, `edge_dst`, `edge__<column>`: one row per annotated edge, endpoints as node ids.
+- `search__<array>`: the entity search index (`week3_entity_search`), stored as is.
+- String columns are stored as int32 codes; their categories live in the manifest.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, reloads there run in a single process.
+    fcntl = None
+
+try:
+    from .week3_graph_layout import layout_params_dict
+    from .week3_runtime_data import build_runtime_from_sources
+    from .week3_runtime_paths import RuntimePaths
+except ImportError:
+    from week3_graph_layout import layout_params_dict
+    from week3_runtime_data import build_runtime_from_sources
+    from week3_runtime_paths import RuntimePaths
+
+# Bump when the array layout or the meaning of a stored column changes.
+BUNDLE_VERSION = 4
+MANIFEST_NAME = "manifest.json"
+SOURCE_FIELDS = ("edges_path", "nodes_path", "sponsors_path", "target_spend_path", "edge_spend_path", "edge_days_path")
+EDGE_KEY_COLUMNS = ("sponsor_name", "canonical_entity_v1_1")
+
+
+def source_signature(paths: RuntimePaths) -> dict[str, dict[str, object]]:
+    signature: dict[str, dict[str, object]] = {}
+    for field in SOURCE_FIELDS:
+        path: Path = getattr(paths, field)
+        stat = path.stat()
+        signature[field] = {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return signature
+
+
+def read_manifest(bundle_dir: Path) -> dict[str, object] | None:
+    try:
+        return json.loads((bundle_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def runtime_bundle_problem(bundle_dir: Path, paths: RuntimePaths) -> str | None:
+    """Why the bundle cannot serve `paths` (None when it is usable)."""
+    manifest = read_manifest(bundle_dir)
+    if manifest is None:
+        return f"no readable manifest in {bundle_dir}"
+    if manifest.get("version") != BUNDLE_VERSION:
+        return f"bundle version {manifest.get('version')} != {BUNDLE_VERSION}"
+    if manifest.get("layout") != layout_params_dict(paths.layout_params):
+        return "layout parameters differ"
+    current = source_signature(paths)
+    for field, stored in manifest.get("sources", {}).items():
+        now = current.get(field)
+        if now is None or (now["size"], now["mtime_ns"]) != (stored["size"], stored["mtime_ns"]):
+            return f"{field} changed since the bundle was built"
+    return None
+
+
+def _encode(values: pd.Series) -> tuple[np.ndarray, list[str] | None]:
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(), None
+    as_text = values.where(values.isna(), values.astype(str))
+    codes, categories = pd.factorize(as_text, sort=True)
+    return codes.astype(np.int32), [str(c) for c in categories]
+
+
+def _decode(values: np.ndarray, categories: list[str] | None) -> np.ndarray | pd.Categorical:
+    if categories is None:
+        return values
+    return pd.Categorical.from_codes(values, categories=categories)
+
+
+def write_runtime_bundle(bundle_dir: Path, runtime: dict[str, object], paths: RuntimePaths) -> dict[str, object]:
+    """Serialize a `build_runtime_from_sources` result; returns the manifest.
+
+    The bundle is written to a sibling temp directory and swapped in, so a
+    running app never sees a half-written bundle.
+    """
+    edges: pd.DataFrame = runtime["edges"]  # type: ignore[assignment]
+    node_table: pd.DataFrame = runtime["node_table"]  # type: ignore[assignment]
+    positions: np.ndarray = runtime["positions"]  # type: ignore[assignment]
+
+    node_names = node_table["node_name"].tolist()
+    node_index = pd.Index(node_names)
+    node_attrs = node_table.drop(columns="node_name")
+
+    arrays: dict[str, np.ndarray] = {
+        "node_name": np.array([str(n) for n in node_names], dtype=str),
+        "node_pos": np.asarray(positions, dtype=np.float64).reshape(-1, 2),
+        "edge_src": node_index.get_indexer(edges["sponsor_name"]).astype(np.int32),
+        "edge_dst": node_index.get_indexer(edges["canonical_entity_v1_1"]).astype(np.int32),
+        **{f"search__{name}": arr for name, arr in runtime["search_index"].items()},  # type: ignore[union-attr]
+    }
+    edge_days: pd.DataFrame = runtime["edge_days"]  # type: ignore[assignment]
+    categories: dict[str, list[str]] = {}
+    for prefix, frame in (
+        ("node__", node_attrs),
+        ("edge__", edges.drop(columns=list(EDGE_KEY_COLUMNS))),
+        ("edge_day__", edge_days),
+    ):
+        for column in frame.columns:
+            name = f"{prefix}{column}"
+            arrays[name], cats = _encode(frame[column])
+            if cats is not None:
+                categories[name] = cats
+
+    manifest: dict[str, object] = {
+        "version": BUNDLE_VERSION,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sources": source_signature(paths),
+        "layout": layout_params_dict(paths.layout_params),
+        "n_nodes": len(node_names),
+        "n_edges": len(edges),
+        "sponsor_parties": [str(p) for p in runtime["sponsor_parties"]],  # type: ignore[union-attr]
+        "target_parties": [str(p) for p in runtime["target_parties"]],  # type: ignore[union-attr]
+        "categories": categories,
+        "arrays": {name: {"dtype": arr.dtype.str, "shape": list(arr.shape)} for name, arr in arrays.items()},
+    }
+
+    bundle_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = bundle_dir.with_name(f"{bundle_dir.name}.tmp-{os.getpid()}")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir()
+    for name, arr in arrays.items():
+        np.save(staging / f"{name}.npy", arr, allow_pickle=False)
+    (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    retired = bundle_dir.with_name(f"{bundle_dir.name}.old-{os.getpid()}")
+    if bundle_dir.exists():
+        os.replace(bundle_dir, retired)
+    os.replace(staging, bundle_dir)
+    # Open memory maps keep the retired files alive until their readers close them.
+    shutil.rmtree(retired, ignore_errors=True)
+    return manifest
+
+
+def refresh_runtime_bundle(bundle_dir: Path, paths: RuntimePaths) -> bool:
+    """Rebuild a stale bundle from the CSV inputs; True if this call wrote it.
+
+    Only a bundle that was already built is refreshed: without a manifest there
+    is nothing to keep current, and the app reads the CSVs as usual. Processes
+    serialize on `<bundle>.lock` (POSIX only): when several workers reload at
+    once, the first rebuilds and the others find the bundle current and only map it.
+    """
+    if not (bundle_dir / MANIFEST_NAME).exists() or runtime_bundle_problem(bundle_dir, paths) is None:
+        return False
+    with open(bundle_dir.with_name(f"{bundle_dir.name}.lock"), "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if runtime_bundle_problem(bundle_dir, paths) is None:
+                return False
+            write_runtime_bundle(bundle_dir, build_runtime_from_sources(paths), paths)
+            return True
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def load_runtime_bundle(bundle_dir: Path) -> dict[str, object]:
+    """Memory-map a bundle into the runtime dict shape used by the Dash app.
+
+    Numeric node columns stay memory-mapped; string columns come back as categoricals.
+    """
+    manifest = read_manifest(bundle_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"Runtime bundle manifest not found: {bundle_dir / MANIFEST_NAME}")
+    arrays = {name: np.load(bundle_dir / f"{name}.npy", mmap_mode="r") for name in manifest["arrays"]}  # type: ignore[union-attr]
+    categories: dict[str, list[str]] = manifest["categories"]  # type: ignore[assignment]
+
+    names = np.array(arrays["node_name"].tolist(), dtype=object)
+    edges = pd.DataFrame(
+        {
+            "sponsor_name": names[arrays["edge_src"]],
+            "canonical_entity_v1_1": names[arrays["edge_dst"]],
+            **{
+                name.removeprefix("edge__"): _decode(arr, categories.get(name))
+                for name, arr in arrays.items()
+                if name.startswith("edge__")
+            },
+        }
+    )
+    node_table = pd.DataFrame(
+        {
+            "node_name": names,
+            **{
+                name.removeprefix("node__"): _decode(arr, categories.get(name))
+                for name, arr in arrays.items()
+                if name.startswith("node__")
+            },
+        }
+    )
+
+    edge_days = pd.DataFrame(
+        {name.removeprefix("edge_day__"): arr for name, arr in arrays.items() if name.startswith("edge_day__")}
+    )
+
+    return {
+        "edges": edges,
+        "node_table": node_table,
+        "positions": arrays["node_pos"],
+        "edge_days": edge_days,
+        "search_index": {name.removeprefix("search__"): arr for name, arr in arrays.items() if name.startswith("search__")},
+        "sponsor_parties": manifest["sponsor_parties"],
+        "target_parties": manifest["target_parties"],
+        "bundle_manifest": manifest,
+    }
@@ -0,0 +1,198 @@
+"""Runtime data assembly for the Week 3 attack-target Dash app from pipeline CSVs."""
+
+from __future__ import annotations
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+try:
+    from .week3_entity_search import build_search_index
+    from .week3_graph_layout import cached_layout_arrays
+    from .week3_runtime_paths import RuntimePaths
+except ImportError:
+    from week3_entity_search import build_search_index
+    from week3_graph_layout import cached_layout_arrays
+    from week3_runtime_paths import RuntimePaths
+
+# Edge frame columns carried onto `runtime_graph` edges.
+EDGE_ATTRIBUTES = (
+    "mention_count",
+    "ad_count",
+    "party_mode",
+    "tone_mode",
+    "sponsor_party",
+    "target_party_inferred",
+    "edge_attack_spend",
+)
+
+
+def mode(series: pd.Series, default: str = "UNKNOWN") -> str:
+    s = series.dropna().astype(str)
+    if s.empty:
+        return default
+    m = s.mode()
+    if m.empty:
+        return default
+    return str(m.iloc[0]).strip() or default
+
+
+def infer_target_party(edges: pd.DataFrame) -> pd.Series:
+    grouped = (
+        edges.groupby(["canonical_entity_v1_1", "sponsor_party"], as_index=False)["mention_count"]
+        .sum()
+        .sort_values(["canonical_entity_v1_1", "mention_count"], ascending=[True, False])
+    )
+    out: dict[str, str] = {}
+    for target, g in grouped.groupby("canonical_entity_v1_1"):
+        top_count = g["mention_count"].max()
+        winners = g[g["mention_count"] == top_count]["sponsor_party"].tolist()
+        out[target] = winners[0] if len(winners) == 1 else "UNKNOWN"
+    return pd.Series(out, name="target_party_inferred")
+
+
+def build_runtime_from_sources(paths: RuntimePaths) -> dict[str, object]:
+    edges = pd.read_csv(paths.edges_path).copy()
+    nodes = pd.read_csv(paths.nodes_path).copy()
+    # Party and spend rollups are precomputed by the cleaning pipeline (`build_spend_tables_v1_1`).
+    sponsor_party = pd.read_csv(paths.sponsors_path, usecols=["sponsor_name", "sponsor_party", "sponsor_attack_spend"])
+    target_received_spend = pd.read_csv(paths.target_spend_path).set_index("canonical_entity_v1_1")["target_received_spend"]
+    edge_attack_spend = pd.read_csv(paths.edge_spend_path)
+
+    sponsor_attack_spend = sponsor_party.set_index("sponsor_name")["sponsor_attack_spend"]
+    sponsor_party = sponsor_party[["sponsor_name", "sponsor_party"]]
+    edges = edges.merge(sponsor_party, on="sponsor_name", how="left")
+    edges["sponsor_party"] = edges["sponsor_party"].fillna("UNKNOWN")
+
+    target_party = infer_target_party(edges)
+    edges["target_party_inferred"] = edges["canonical_entity_v1_1"].map(target_party).fillna("UNKNOWN")
+
+    edges = edges.merge(edge_attack_spend, on=["sponsor_name", "canonical_entity_v1_1"], how="left")
+    edges["edge_attack_spend"] = edges["edge_attack_spend"].fillna(0.0)
+
+    edge_days = load_edge_days(paths, edges)
+
+    target_node_meta = (
+        nodes.groupby("canonical_entity_v1_1", as_index=False)
+        .agg(
+            target_label=("label_mode", lambda s: mode(s, default="UNKNOWN")),
+            target_mentions=("mention_count", "max"),
+            target_ads=("ad_count", "max"),
+            target_sponsors=("sponsor_count", "max"),
+            target_platforms=("platform_count", "max"),
+        )
+        .set_index("canonical_entity_v1_1")
+    )
+
+    # Node id = order of first appearance over (sponsor, target) edge endpoints, as in a graph built edge by edge.
+    node_names = pd.unique(edges[["sponsor_name", "canonical_entity_v1_1"]].to_numpy().ravel())
+    node_index = pd.Index(node_names)
+    src = node_index.get_indexer(edges["sponsor_name"])
+    dst = node_index.get_indexer(edges["canonical_entity_v1_1"])
+    node_table = build_node_table(
+        node_names,
+        target_node_meta,
+        target_party,
+        sponsor_party.set_index("sponsor_name")["sponsor_party"],
+        sponsor_attack_spend,
+        target_received_spend,
+    )
+    # Search ranks equally good name matches by the node's total edge mentions.
+    mentions = edges["mention_count"].to_numpy(dtype=np.float64)
+    node_mentions = np.bincount(src, mentions, len(node_names)) + np.bincount(dst, mentions, len(node_names))
+    search_index = build_search_index(node_names, node_mentions)
+
+    positions = cached_layout_arrays(
+        node_names,
+        src,
+        dst,
+        paths.layout_params,
+        paths.layout_cache_dir,
+        warm_start=paths.layout_warm_start,
+    )
+
+    return {
+        "edges": edges,
+        "node_table": node_table,
+        "positions": positions,
+        "edge_days": edge_days,
+        "search_index": search_index,
+        "sponsor_parties": sorted(edges["sponsor_party"].dropna().unique().tolist()),
+        "target_parties": sorted(edges["target_party_inferred"].dropna().unique().tolist()),
+    }
+
+
+def load_edge_days(paths: RuntimePaths, edges: pd.DataFrame) -> pd.DataFrame:
+    """The (edge, day) cube with edges as row numbers in `edges` and days since 1970-01-01."""
+    cube = pd.read_csv(paths.edge_days_path)
+    edge_keys = pd.MultiIndex.from_frame(edges[["sponsor_name", "canonical_entity_v1_1"]])
+    edge = edge_keys.get_indexer(pd.MultiIndex.from_frame(cube[["sponsor_name", "canonical_entity_v1_1"]]))
+    day = pd.to_datetime(cube["date"]).to_numpy(dtype="datetime64[D]").astype(np.int64)
+    known = edge >= 0
+    return pd.DataFrame(
+        {
+            "edge": edge[known].astype(np.int32),
+            "day": day[known].astype(np.int32),
+            "mention_count": cube["mention_count"].to_numpy(dtype=np.int64)[known],
+            "ad_count": cube["ad_count"].to_numpy(dtype=np.int64)[known],
+            "edge_attack_spend": cube["edge_attack_spend"].to_numpy(dtype=np.float64)[known],
+        }
+    )
+
+
+def build_node_table(
+    node_names: np.ndarray,
+    target_node_meta: pd.DataFrame,
+    target_party: pd.Series,
+    sponsor_party: pd.Series,
+    sponsor_attack_spend: pd.Series,
+    target_received_spend: pd.Series,
+) -> pd.DataFrame:
+    """One row per node (row number = node id): name plus the attributes the app reads.
+
+    Names present in the target node table are targets; every other endpoint is a sponsor.
+    """
+    names = pd.Index(node_names)
+    is_target = names.isin(target_node_meta.index)
+    meta = target_node_meta.reindex(names)
+
+    def per_role(target_values, sponsor_values) -> np.ndarray:
+        return np.where(is_target, target_values, sponsor_values)
+
+    def lookup(series: pd.Series, default: object) -> np.ndarray:
+        return series[~series.index.duplicated()].reindex(names).fillna(default).to_numpy()
+
+    return pd.DataFrame(
+        {
+            "node_name": node_names,
+            "node_type": per_role("target", "sponsor"),
+            "label_mode": per_role(meta["target_label"].astype(str), "SPONSOR"),
+            "party": per_role(lookup(target_party, "UNKNOWN").astype(str), lookup(sponsor_party, "UNKNOWN").astype(str)),
+            "mention_count": per_role(meta["target_mentions"].fillna(0), 0).astype(np.int64),
+            "ad_count": per_role(meta["target_ads"].fillna(0), 0).astype(np.int64),
+            "sponsor_count": per_role(meta["target_sponsors"].fillna(0), 0).astype(np.int64),
+            "platform_count": per_role(meta["target_platforms"].fillna(0), 0).astype(np.int64),
+            "target_received_spend": per_role(lookup(target_received_spend, 0.0).astype(float), 0.0),
+            "sponsor_attack_spend": per_role(0.0, lookup(sponsor_attack_spend, 0.0).astype(float)),
+        }
+    )
+
+
+def runtime_graph(runtime: dict[str, object]) -> nx.DiGraph:
+    """NetworkX view of the runtime (node and edge attributes), built on first use.
+
+    The app's callbacks run on `GraphArrays`; this is for ad hoc analytics only.
+    """
+    graph = runtime.get("graph")
+    if graph is None:
+        node_table: pd.DataFrame = runtime["node_table"]  # type: ignore[assignment]
+        edges: pd.DataFrame = runtime["edges"]  # type: ignore[assignment]
+        attrs = node_table.drop(columns="node_name")
+        graph = nx.DiGraph()
+        graph.add_nodes_from(zip(node_table["node_name"], attrs.to_dict("records")))
+        edge_columns = [c for c in EDGE_ATTRIBUTES if c in edges.columns]
+        graph.add_edges_from(
+            zip(edges["sponsor_name"], edges["canonical_entity_v1_1"], edges[edge_columns].to_dict("records"))
+        )
+        runtime["graph"] = graph
+    return graph  # type: ignore[return-value]
@@ -6,6 +6,11 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    from .week3_graph_layout import LayoutParams
+except ImportError:
+    from week3_graph_layout import LayoutParams
+
 
 @dataclass(frozen=True)
 class RuntimePaths:
@@ -13,9 +18,17 @@ class RuntimePaths:
     analysis_root: Path
     edges_path: Path
     nodes_path: Path
-    mentions_path: Path
-    harmonized_path: Path
+    sponsors_path: Path
+    target_spend_path: Path
+    edge_spend_path: Path
+    edge_days_path: Path
     base_path: str
+    layout_params: LayoutParams
+    layout_cache_dir: Path | None
+    layout_warm_start: bool
+    runtime_bundle_dir: Path | None
+    evidence_path: Path | None = None
+    evidence_index_path: Path | None = None
 
 
 def normalize_base_path(path: str) -> str:
@@ -101,6 +114,44 @@ def build_input_candidates(
     return candidates
 
 
+def resolve_layout_params() -> LayoutParams:
+    return LayoutParams(
+        algorithm=os.getenv("DELTA_LAYOUT_ALGORITHM", "auto").strip() or "auto",
+        k=float(os.getenv("DELTA_LAYOUT_K", "0.42")),
+        seed=int(os.getenv("DELTA_LAYOUT_SEED", "42")),
+        iterations=int(os.getenv("DELTA_LAYOUT_ITERATIONS", "50")),
+    )
+
+
+def resolve_layout_cache_dir(edges_path: Path) -> Path | None:
+    # Default sits next to the edge CSV, matching the static renderer's `outputs/week3/layout_cache`.
+    cache_env = os.getenv("DELTA_LAYOUT_CACHE_DIR", "").strip()
+    if cache_env.lower() == "off":
+        return None
+    if cache_env:
+        return Path(cache_env).expanduser().resolve()
+    return edges_path.parent / "layout_cache"
+
+
+def resolve_runtime_bundle_dir(edges_path: Path) -> Path | None:
+    # Default matches `scripts/week3_build_runtime_bundle_v1_1.py --out-dir`.
+    bundle_env = os.getenv("DELTA_RUNTIME_BUNDLE", "").strip()
+    if bundle_env.lower() == "off":
+        return None
+    if bundle_env:
+        return Path(bundle_env).expanduser().resolve()
+    return edges_path.parent / "runtime_bundle_v1_1"
+
+
+def resolve_evidence_paths(edges_path: Path) -> tuple[Path | None, Path | None]:
+    # Written next to the edge CSV by `scripts/week3_clean_attack_target_v1_1.py`; optional.
+    evidence_env = os.getenv("DELTA_EVIDENCE_DIR", "").strip()
+    if evidence_env.lower() == "off":
+        return None, None
+    evidence_dir = Path(evidence_env).expanduser().resolve() if evidence_env else edges_path.parent
+    return evidence_dir / "attack_target_evidence_v1_1.arrow", evidence_dir / "attack_target_evidence_index_v1_1.csv"
+
+
 def resolve_runtime_paths() -> RuntimePaths:
     project_dir = Path(__file__).resolve().parent
     analysis_root = detect_analysis_root(project_dir)
@@ -122,29 +173,57 @@ def resolve_runtime_paths() -> RuntimePaths:
             project_dir=project_dir,
         )
     )
-    mentions_path = resolve_first_existing_path(
+    # Rollups written by `scripts/week3_clean_attack_target_v1_1.py`; mention-level data is never read here.
+    sponsors_path = resolve_first_existing_path(
         build_input_candidates(
-            outputs_rel="outputs/week3/entity_mentions_week3_cleaned_v1_1.csv.gz",
-            data_inputs_rel="data_inputs/entity_mentions_week3_cleaned_v1_1.csv.gz",
+            outputs_rel="outputs/week3/attack_target_sponsors_v1_1.csv",
+            data_inputs_rel="data_inputs/attack_target_sponsors_v1_1.csv",
             analysis_root=analysis_root,
             project_dir=project_dir,
         )
     )
-    harmonized_path = resolve_first_existing_path(
+    target_spend_path = resolve_first_existing_path(
         build_input_candidates(
-            outputs_rel="outputs/week1/harmonized_sample_week1.csv.gz",
-            data_inputs_rel="data_inputs/harmonized_sample_week1.csv.gz",
+            outputs_rel="outputs/week3/attack_target_target_spend_v1_1.csv",
+            data_inputs_rel="data_inputs/attack_target_target_spend_v1_1.csv",
             analysis_root=analysis_root,
             project_dir=project_dir,
         )
     )
+    edge_spend_path = resolve_first_existing_path(
+        build_input_candidates(
+            outputs_rel="outputs/week3/attack_target_edge_spend_v1_1.csv",
+            data_inputs_rel="data_inputs/attack_target_edge_spend_v1_1.csv",
+            analysis_root=analysis_root,
+            project_dir=project_dir,
+        )
+    )
+    # Sparse (edge, day) cube behind the date-window slider.
+    edge_days_path = resolve_first_existing_path(
+        build_input_candidates(
+            outputs_rel="outputs/week3/attack_target_edge_days_v1_1.csv",
+            data_inputs_rel="data_inputs/attack_target_edge_days_v1_1.csv",
+            analysis_root=analysis_root,
+            project_dir=project_dir,
+        )
+    )
+
+    evidence_path, evidence_index_path = resolve_evidence_paths(edges_path)
 
     return RuntimePaths(
         project_dir=project_dir,
         analysis_root=analysis_root,
         edges_path=edges_path,
         nodes_path=nodes_path,
-        mentions_path=mentions_path,
-        harmonized_path=harmonized_path,
+        sponsors_path=sponsors_path,
+        target_spend_path=target_spend_path,
+        edge_spend_path=edge_spend_path,
+        edge_days_path=edge_days_path,
         base_path=base_path,
+        layout_params=resolve_layout_params(),
+        layout_cache_dir=resolve_layout_cache_dir(edges_path),
+        layout_warm_start=os.getenv("DELTA_LAYOUT_WARM_START", "1").strip() != "0",
+        runtime_bundle_dir=resolve_runtime_bundle_dir(edges_path),
+        evidence_path=evidence_path,
+        evidence_index_path=evidence_index_path,
     )
@@ -3,17 +3,39 @@
 
 Default usage:
     poetry run python scripts/week3_build_attack_target_graph_interactive_v1_1.py
+
+Batch usage (one load and one master layout, variants rendered in parallel):
+    poetry run python scripts/week3_build_attack_target_graph_interactive_v1_1.py --variants variants.json
+
+`variants.json` is a list (or `{"variants": [...]}`) of specs such as:
+    {"name": "dem_tiktok", "filters": {"party_mode": ["DEM"]}, "platforms": ["tiktok"],
+     "min_edge_mentions": 3, "top_n_edges": 500, "keep_largest_component": false}
+Omitted keys fall back to the CLI values; `out_html` defaults to
+`<--variants-out-dir>/attack_target_graph_interactive_v1_1_<name>.html`.
 """
 
 from __future__ import annotations
 
 import argparse
+import base64
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+# Layout engines are shared with the Dash app in `apps/`.
+APPS_DIR = Path(__file__).resolve().parent.parent / "apps"
+if str(APPS_DIR) not in sys.path:
+    sys.path.insert(0, str(APPS_DIR))
+
+from week3_graph_layout import LAYOUT_ALGORITHMS, LayoutParams, cached_layout_graph  # noqa: E402
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Render Week 3 v1.1 interactive attack-target graph.")
@@ -50,17 +72,94 @@ def parse_args() -> argparse.Namespace:
         default=True,
         help="Keep only the largest weakly-connected component (use --no-keep-largest-component to disable).",
     )
+    parser.add_argument(
+        "--layout-algorithm",
+        choices=LAYOUT_ALGORITHMS,
+        default="auto",
+        help="Layout engine (auto: spring for small graphs, barnes_hut for large ones).",
+    )
     parser.add_argument(
         "--layout-k",
         type=float,
         default=0.42,
-        help="Spring layout k parameter.",
+        help="Force layout k parameter (optimal node spacing).",
     )
     parser.add_argument(
         "--layout-seed",
         type=int,
         default=42,
-        help="Spring layout seed.",
+        help="Layout seed.",
+    )
+    parser.add_argument(
+        "--layout-iterations",
+        type=int,
+        default=50,
+        help="Force layout iterations.",
+    )
+    parser.add_argument(
+        "--layout-cache-dir",
+        default="outputs/week3/layout_cache",
+        help="Directory for cached layout positions (shared with the Dash app).",
+    )
+    parser.add_argument(
+        "--layout-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse cached positions when the edge set and layout parameters match (use --no-layout-cache to disable).",
+    )
+    parser.add_argument(
+        "--layout-warm-start",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="On a cache miss, refine the newest cached layout instead of starting from random positions.",
+    )
+    parser.add_argument(
+        "--webgl-threshold",
+        type=int,
+        default=3000,
+        help="Render with WebGL (Scattergl) when plotted nodes + edges exceed this count.",
+    )
+    parser.add_argument(
+        "--export-mode",
+        choices=EXPORT_MODES,
+        default="standard",
+        help="standard: full-precision arrays; compact: precision-trimmed, narrow typed arrays for offline review.",
+    )
+    parser.add_argument(
+        "--plotlyjs",
+        choices=PLOTLYJS_MODES,
+        default=None,
+        help=(
+            "How the page loads plotly.js: cdn, inline (self-contained page), or directory "
+            "(one shared plotly.min.js next to the HTML). Defaults to cdn (standard) or inline (compact)."
+        ),
+    )
+    parser.add_argument(
+        "--coord-decimals",
+        type=int,
+        default=4,
+        help="Decimal places kept for layout coordinates in compact export (stored as integer grid units).",
+    )
+    parser.add_argument(
+        "--variants",
+        default=None,
+        help="JSON file of variant specs; renders every variant from one shared master layout.",
+    )
+    parser.add_argument(
+        "--variants-out-dir",
+        default="outputs/week3/graph_variants",
+        help="Output directory for variant HTML files without an explicit out_html.",
+    )
+    parser.add_argument(
+        "--mentions",
+        default="outputs/week3/entity_mentions_week3_cleaned_v1_1.csv.gz",
+        help="Cleaned mention CSV, read only when a variant filters by platforms.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch rendering (default: CPU count, at most one per variant).",
     )
     return parser.parse_args()
 
@@ -85,10 +184,449 @@ def resolve_path(path_str: str, analysis_root: Path) -> Path:
     return path if path.is_absolute() else (analysis_root / path).resolve()
 
 
-def scale_size(value: float, min_value: float, max_value: float, lo: float = 8, hi: float = 42) -> float:
+LABEL_COLORS = {
+    "PERSON": "#1f77b4",
+    "ORG": "#d62728",
+    "GPE": "#2ca02c",
+    "SPONSOR_OR_UNMAPPED": "#7f7f7f",
+}
+DEFAULT_LABEL = "SPONSOR_OR_UNMAPPED"
+NODE_METRICS = ["mention_count", "ad_count", "sponsor_count", "platform_count"]
+EDGE_ATTRS = ["mention_count", "ad_count", "platform_count", "party_mode", "tone_mode"]
+EXPORT_MODES = ("standard", "compact")
+VARIANT_KEYS = {
+    "name",
+    "out_html",
+    "filters",
+    "platforms",
+    "min_edge_mentions",
+    "top_n_edges",
+    "keep_largest_component",
+}
+PLOTLYJS_MODES = ("cdn", "inline", "directory")
+
+
+def scale_sizes(values: np.ndarray, lo: float = 8, hi: float = 42) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return values
+    min_value = float(values.min())
+    max_value = float(values.max())
     if max_value == min_value:
-        return (lo + hi) / 2
-    return lo + (value - min_value) * (hi - lo) / (max_value - min_value)
+        return np.full(values.shape, (lo + hi) / 2)
+    return lo + (values - min_value) * (hi - lo) / (max_value - min_value)
+
+
+def filter_edges(edges: pd.DataFrame, min_edge_mentions: int, top_n_edges: int | None) -> pd.DataFrame:
+    edges_f = edges[edges["mention_count"] >= min_edge_mentions]
+    edges_f = edges_f.sort_values("mention_count", ascending=False)
+    if top_n_edges is not None:
+        edges_f = edges_f.head(top_n_edges)
+    return edges_f
+
+
+def build_graph(edges_f: pd.DataFrame, keep_largest_component: bool) -> nx.DiGraph:
+    graph = nx.from_pandas_edgelist(
+        edges_f,
+        source="sponsor_name",
+        target="canonical_entity_v1_1",
+        edge_attr=[c for c in EDGE_ATTRS if c in edges_f.columns],
+        create_using=nx.DiGraph,
+    )
+    if keep_largest_component and graph.number_of_nodes() > 0:
+        largest = max(nx.weakly_connected_components(graph), key=len)
+        graph = graph.subgraph(largest).copy()
+    return graph
+
+
+def build_node_lookup(nodes: pd.DataFrame) -> pd.DataFrame:
+    return nodes.groupby("canonical_entity_v1_1").agg(
+        mention_count=("mention_count", "max"),
+        ad_count=("ad_count", "max"),
+        sponsor_count=("sponsor_count", "max"),
+        platform_count=("platform_count", "max"),
+        label_mode=("label_mode", lambda s: s.mode().iloc[0] if not s.mode().empty else DEFAULT_LABEL),
+    )
+
+
+def build_node_table(node_names: list[str], node_lookup: pd.DataFrame, pos: dict) -> pd.DataFrame:
+    """Per-node plotting attributes, one row per graph node in graph order."""
+    table = node_lookup.reindex(node_names)
+    table[NODE_METRICS] = table[NODE_METRICS].fillna(1).astype(np.int64)
+    table["label_mode"] = table["label_mode"].fillna(DEFAULT_LABEL)
+    xy = np.array([pos[n] for n in node_names], dtype=float).reshape(-1, 2)
+    table["x"] = xy[:, 0]
+    table["y"] = xy[:, 1]
+    table["size"] = scale_sizes(table["mention_count"].to_numpy())
+    return table
+
+
+def edge_index(graph: nx.DiGraph, node_table: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Edge endpoints as row positions into `node_table`."""
+    if graph.number_of_edges() == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    ends = np.array(list(graph.edges()), dtype=object)
+    return node_table.index.get_indexer(ends[:, 0]), node_table.index.get_indexer(ends[:, 1])
+
+
+def edge_segments(graph: nx.DiGraph, node_table: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Edge polyline coordinates: `x0, x1, NaN` per edge so one trace draws every edge."""
+    if graph.number_of_edges() == 0:
+        return np.array([]), np.array([])
+    src, dst = edge_index(graph, node_table)
+    xy = node_table[["x", "y"]].to_numpy()
+    seg = np.full((len(src), 3, 2), np.nan)
+    seg[:, 0] = xy[src]
+    seg[:, 1] = xy[dst]
+    return seg[:, :, 0].ravel(), seg[:, :, 1].ravel()
+
+
+def build_figure(graph: nx.DiGraph, node_table: pd.DataFrame, webgl_threshold: int) -> go.Figure:
+    # SVG scatter stalls the browser beyond a few thousand elements; switch to WebGL there.
+    use_webgl = graph.number_of_edges() + graph.number_of_nodes() > webgl_threshold
+    scatter = go.Scattergl if use_webgl else go.Scatter
+
+    edge_x, edge_y = edge_segments(graph, node_table)
+    traces = [
+        scatter(
+            x=edge_x,
+            y=edge_y,
+            mode="lines",
+            name="edges",
+            hoverinfo="none",
+            showlegend=False,
+            line=dict(width=0.7, color="rgba(120,120,120,0.35)"),
+        )
+    ]
+
+    # One trace per label: color and label are constant per trace, so hover text comes
+    # from a template over numeric customdata instead of one formatted string per node.
+    for label, group in node_table.groupby("label_mode", sort=True):
+        traces.append(
+            scatter(
+                x=group["x"].to_numpy(),
+                y=group["y"].to_numpy(),
+                mode="markers",
+                name=str(label),
+                text=group.index.to_numpy(dtype=str),
+                customdata=group[NODE_METRICS].to_numpy(),
+                hovertemplate=(
+                    "node=%{text}<br>"
+                    f"label={label}<br>"
+                    "mentions=%{customdata[0]:,}<br>"
+                    "ads=%{customdata[1]:,}<br>"
+                    "sponsors=%{customdata[2]:,}<br>"
+                    "platforms=%{customdata[3]:,}"
+                    "<extra></extra>"
+                ),
+                showlegend=False,
+                marker=dict(
+                    size=group["size"].to_numpy(),
+                    color=LABEL_COLORS.get(str(label), "#7f7f7f"),
+                    opacity=0.95,
+                    line=dict(width=0.8, color="rgba(255,255,255,0.85)"),
+                ),
+            )
+        )
+
+    fig = go.Figure(data=traces)
+    fig.update_layout(
+        title=(
+            f"Week 3 Attack-Target Graph v1.1: "
+            f"{graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges"
+        ),
+        template="plotly_white",
+        hovermode="closest",
+        margin=dict(l=20, r=20, t=60, b=20),
+        xaxis=dict(showgrid=False, zeroline=False, visible=False),
+        yaxis=dict(showgrid=False, zeroline=False, visible=False),
+    )
+    return fig
+
+
+def narrow_numeric(values: np.ndarray) -> np.ndarray:
+    """Smallest plotly typed-array dtype that holds `values` exactly (ints) or as float32."""
+    arr = np.asarray(values)
+    if arr.size == 0 or not np.issubdtype(arr.dtype, np.number):
+        return arr
+    if np.issubdtype(arr.dtype, np.integer):
+        lo, hi = int(arr.min()), int(arr.max())
+        for dtype in (np.uint8, np.uint16, np.uint32) if lo >= 0 else (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= lo and hi <= info.max:
+                return arr.astype(dtype)
+        return arr
+    return arr.astype(np.float32)
+
+
+def b64_array(values: np.ndarray) -> str:
+    return base64.b64encode(np.ascontiguousarray(values).tobytes()).decode("ascii")
+
+
+JS_TYPED_ARRAYS = {"uint8": "Uint8Array", "uint16": "Uint16Array", "uint32": "Uint32Array"}
+
+# Rebuilds the edge polyline trace in the browser from node coordinates and edge endpoint ids,
+# so the page carries two small int arrays instead of 6 coordinates per edge.
+EDGE_EXPANSION_JS = """
+(function () {
+  var gd = document.getElementById("{plot_id}");
+  function decode(b64, Type) {
+    var raw = atob(b64), bytes = new Uint8Array(raw.length);
+    for (var i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+    return new Type(bytes.buffer);
+  }
+  var nodeX = decode("__NODE_X__", __COORD_TYPE__), nodeY = decode("__NODE_Y__", __COORD_TYPE__);
+  var src = decode("__SRC__", __INDEX_TYPE__), dst = decode("__DST__", __INDEX_TYPE__);
+  var n = src.length, ex = new Float32Array(3 * n), ey = new Float32Array(3 * n);
+  for (var i = 0; i < n; i++) {
+    ex[3 * i] = nodeX[src[i]]; ex[3 * i + 1] = nodeX[dst[i]]; ex[3 * i + 2] = NaN;
+    ey[3 * i] = nodeY[src[i]]; ey[3 * i + 1] = nodeY[dst[i]]; ey[3 * i + 2] = NaN;
+  }
+  var idx = gd.data.findIndex(function (t) { return t.name === "edges"; });
+  if (idx >= 0) Plotly.restyle(gd, {x: [ex], y: [ey]}, [idx]);
+})();
+"""
+
+
+def compact_figure(
+    fig: go.Figure,
+    coord_decimals: int,
+    edge_ids: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> tuple[go.Figure, str | None]:
+    """Trim array payloads so plotly serializes them as small base64 typed arrays.
+
+    Coordinates are shifted to a non-negative origin and rounded to
+    `coord_decimals` as integer grid units (axes are hidden, so units are
+    free); marker sizes become uint8 pixels and numeric customdata the
+    narrowest int type. With `edge_ids` (node xy, src ids, dst ids) the
+    edge trace is emptied and a post-script rebuilding it is returned.
+    """
+    all_x = [np.asarray(t.x, dtype=float) for t in fig.data if t.x is not None]
+    all_y = [np.asarray(t.y, dtype=float) for t in fig.data if t.y is not None]
+    origin_x = float(np.nanmin(np.concatenate(all_x))) if all_x else 0.0
+    origin_y = float(np.nanmin(np.concatenate(all_y))) if all_y else 0.0
+    unit = 10.0**coord_decimals
+
+    def quantize(values: np.ndarray, origin: float) -> np.ndarray:
+        grid = np.rint((np.asarray(values, dtype=float) - origin) * unit)
+        if np.isnan(grid).any():
+            return grid.astype(np.float32)
+        return narrow_numeric(grid.astype(np.int64))
+
+    post_script = None
+    for trace in fig.data:
+        if edge_ids is not None and trace.name == "edges":
+            node_xy, src, dst = edge_ids
+            node_x = quantize(node_xy[:, 0], origin_x)
+            node_y = quantize(node_xy[:, 1], origin_y)
+            ids = narrow_numeric(np.concatenate([src, dst]).astype(np.int64))
+            if node_x.dtype.name in JS_TYPED_ARRAYS and node_y.dtype == node_x.dtype and ids.dtype.name in JS_TYPED_ARRAYS:
+                trace.x, trace.y = [], []
+                replacements = {
+                    "__NODE_X__": b64_array(node_x),
+                    "__NODE_Y__": b64_array(node_y),
+                    "__SRC__": b64_array(ids[: len(src)]),
+                    "__DST__": b64_array(ids[len(src) :]),
+                    "__COORD_TYPE__": JS_TYPED_ARRAYS[node_x.dtype.name],
+                    "__INDEX_TYPE__": JS_TYPED_ARRAYS[ids.dtype.name],
+                }
+                post_script = EDGE_EXPANSION_JS
+                for token, value in replacements.items():
+                    post_script = post_script.replace(token, value)
+                continue
+        if trace.x is not None:
+            trace.x = quantize(trace.x, origin_x)
+        if trace.y is not None:
+            trace.y = quantize(trace.y, origin_y)
+        marker = getattr(trace, "marker", None)
+        if marker is not None and marker.size is not None and np.ndim(marker.size) > 0:
+            sizes = np.rint(np.asarray(marker.size, dtype=float))
+            marker.size = sizes.astype(np.uint8) if sizes.size and sizes.max() <= 255 else sizes.astype(np.float32)
+        customdata = getattr(trace, "customdata", None)
+        if customdata is not None:
+            trace.customdata = narrow_numeric(np.asarray(customdata))
+    return fig, post_script
+
+
+def write_figure_html(
+    fig: go.Figure,
+    out_html: Path,
+    export_mode: str = "standard",
+    plotlyjs: str | None = None,
+    coord_decimals: int = 4,
+    edge_ids: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> None:
+    """Write the figure page.
+
+    `directory` writes `plotly.min.js` once next to the page, so a folder of
+    exports shares one bundle and still works without network access.
+    """
+    post_script = None
+    if export_mode == "compact":
+        fig, post_script = compact_figure(fig, coord_decimals, edge_ids)
+    plotlyjs = plotlyjs or ("inline" if export_mode == "compact" else "cdn")
+    include_plotlyjs: bool | str = {"cdn": "cdn", "inline": True, "directory": "directory"}[plotlyjs]
+    fig.write_html(
+        str(out_html),
+        include_plotlyjs=include_plotlyjs,
+        config={"displaylogo": False},
+        post_script=post_script,
+    )
+
+
+def load_variant_specs(path: Path, edge_columns: pd.Index) -> list[dict]:
+    if not path.exists():
+        raise FileNotFoundError(f"Variants file not found: {path}")
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    specs = payload.get("variants") if isinstance(payload, dict) else payload
+    if not isinstance(specs, list) or not specs:
+        raise ValueError(f"Variants file must contain a non-empty list of specs: {path}")
+
+    names = set()
+    for spec in specs:
+        if not isinstance(spec, dict) or not spec.get("name"):
+            raise ValueError(f"Every variant spec needs a name: {spec!r}")
+        unknown = set(spec) - VARIANT_KEYS
+        if unknown:
+            raise ValueError(f"Variant {spec['name']!r} has unknown keys: {sorted(unknown)}")
+        missing = set(spec.get("filters", {})) - set(edge_columns)
+        if missing:
+            raise ValueError(f"Variant {spec['name']!r} filters on missing edge columns: {sorted(missing)}")
+        if spec["name"] in names:
+            raise ValueError(f"Duplicate variant name: {spec['name']!r}")
+        names.add(spec["name"])
+    return specs
+
+
+def platform_edge_keys(mentions_path: Path, platforms: set[str]) -> dict[str, pd.MultiIndex]:
+    """Edge keys `(sponsor_name, canonical_entity_v1_1)` with target mentions on each platform."""
+    if not mentions_path.exists():
+        raise FileNotFoundError(f"Mentions file not found: {mentions_path}")
+    mentions = pd.read_csv(
+        mentions_path,
+        usecols=["sponsor_name", "canonical_entity_v1_1", "platform", "is_target_v1_1"],
+        low_memory=False,
+    )
+    is_target = mentions["is_target_v1_1"].astype(str).str.lower().isin({"true", "1"})
+    mentions = mentions[is_target & mentions["platform"].astype(str).isin(platforms)]
+    pairs = mentions[["platform", "sponsor_name", "canonical_entity_v1_1"]].drop_duplicates()
+    return {
+        str(platform): pd.MultiIndex.from_frame(group[["sponsor_name", "canonical_entity_v1_1"]])
+        for platform, group in pairs.groupby("platform")
+    }
+
+
+def variant_mask(edges: pd.DataFrame, spec: dict, platform_keys: dict[str, pd.MultiIndex]) -> np.ndarray:
+    """Rows of `edges` passing a variant's column filters and platform filter."""
+    mask = np.ones(len(edges), dtype=bool)
+    for column, allowed in spec.get("filters", {}).items():
+        allowed = allowed if isinstance(allowed, list) else [allowed]
+        mask &= edges[column].isin(allowed).to_numpy()
+    platforms = spec.get("platforms")
+    if platforms:
+        edge_keys = pd.MultiIndex.from_frame(edges[["sponsor_name", "canonical_entity_v1_1"]])
+        on_platform = np.zeros(len(edges), dtype=bool)
+        for platform in platforms:
+            if str(platform) in platform_keys:
+                on_platform |= edge_keys.isin(platform_keys[str(platform)])
+        mask &= on_platform
+    return mask
+
+
+# Per-process state for batch workers, set once by `init_variant_worker`
+# so edges and master positions are not re-sent with every variant.
+_VARIANT_STATE: dict[str, object] = {}
+
+
+def init_variant_worker(edges: pd.DataFrame, node_lookup: pd.DataFrame, pos: dict, options: dict) -> None:
+    _VARIANT_STATE.update(edges=edges, node_lookup=node_lookup, pos=pos, options=options)
+
+
+def render_variant(task: tuple[dict, np.ndarray, str]) -> tuple[str, str, int, int]:
+    """Render one variant with master-layout positions; returns `(name, out_html, nodes, edges)`."""
+    spec, mask, out_html = task
+    edges = _VARIANT_STATE["edges"]
+    options = _VARIANT_STATE["options"]
+    edges_f = filter_edges(
+        edges[mask],
+        spec.get("min_edge_mentions", options["min_edge_mentions"]),
+        spec.get("top_n_edges", options["top_n_edges"]),
+    )
+    graph = build_graph(edges_f, spec.get("keep_largest_component", options["keep_largest_component"]))
+    if graph.number_of_nodes() == 0:
+        return spec["name"], out_html, 0, 0
+
+    node_table = build_node_table(list(graph.nodes()), _VARIANT_STATE["node_lookup"], _VARIANT_STATE["pos"])
+    fig = build_figure(graph, node_table, options["webgl_threshold"])
+    fig.update_layout(title=f"{fig.layout.title.text} [{spec['name']}]")
+    write_figure_html(
+        fig,
+        Path(out_html),
+        options["export_mode"],
+        options["plotlyjs"],
+        options["coord_decimals"],
+        edge_ids=(node_table[["x", "y"]].to_numpy(), *edge_index(graph, node_table)),
+    )
+    return spec["name"], out_html, graph.number_of_nodes(), graph.number_of_edges()
+
+
+def run_variants(
+    args: argparse.Namespace,
+    analysis_root: Path,
+    edges: pd.DataFrame,
+    nodes: pd.DataFrame,
+    layout_params: LayoutParams,
+    layout_cache_dir: Path | None,
+) -> int:
+    specs = load_variant_specs(resolve_path(args.variants, analysis_root), edges.columns)
+    out_dir = resolve_path(args.variants_out_dir, analysis_root)
+
+    platforms = {str(p) for spec in specs for p in spec.get("platforms", [])}
+    platform_keys = platform_edge_keys(resolve_path(args.mentions, analysis_root), platforms) if platforms else {}
+
+    # Master layout over the loosest threshold, so every variant shares coordinates.
+    min_mentions = min(spec.get("min_edge_mentions", args.min_edge_mentions) for spec in specs)
+    master_graph = build_graph(filter_edges(edges, min_mentions, None), keep_largest_component=False)
+    if master_graph.number_of_nodes() == 0:
+        raise ValueError("Master graph is empty after filtering. Lower min_edge_mentions.")
+    pos = cached_layout_graph(master_graph, layout_params, layout_cache_dir, warm_start=args.layout_warm_start)
+    print(f"master layout: {master_graph.number_of_nodes():,} nodes, {master_graph.number_of_edges():,} edges")
+
+    tasks = []
+    for spec in specs:
+        out_html = resolve_path(spec["out_html"], analysis_root) if spec.get("out_html") else (
+            out_dir / f"attack_target_graph_interactive_v1_1_{spec['name']}.html"
+        )
+        out_html.parent.mkdir(parents=True, exist_ok=True)
+        tasks.append((spec, variant_mask(edges, spec, platform_keys), str(out_html)))
+
+    options = {
+        "min_edge_mentions": args.min_edge_mentions,
+        "top_n_edges": args.top_n_edges,
+        "keep_largest_component": args.keep_largest_component,
+        "webgl_threshold": args.webgl_threshold,
+        "export_mode": args.export_mode,
+        "plotlyjs": args.plotlyjs,
+        "coord_decimals": args.coord_decimals,
+    }
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(tasks)))
+    node_lookup = build_node_lookup(nodes)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_variant_worker,
+        initargs=(edges, node_lookup, pos, options),
+    ) as pool:
+        results = list(pool.map(render_variant, tasks))
+
+    empty = 0
+    for name, out_html, n_nodes, n_edges in results:
+        if n_nodes == 0:
+            empty += 1
+            print(f"skipped (empty after filtering): {name}")
+        else:
+            print(f"wrote: {out_html} ({n_nodes:,} nodes, {n_edges:,} edges)")
+    print(f"variants rendered: {len(results) - empty:,}/{len(results):,} with {workers} workers")
+    return 1 if empty else 0
 
 
 def main() -> int:
@@ -108,135 +646,34 @@ def main() -> int:
     edges = pd.read_csv(edge_path)
     nodes = pd.read_csv(node_path)
 
-    edges_f = edges.copy()
-    edges_f = edges_f[edges_f["mention_count"] >= args.min_edge_mentions]
-    edges_f = edges_f.sort_values("mention_count", ascending=False)
-    if args.top_n_edges is not None:
-        edges_f = edges_f.head(args.top_n_edges)
-
-    graph = nx.DiGraph()
-    for row in edges_f.itertuples(index=False):
-        graph.add_edge(
-            row.sponsor_name,
-            row.canonical_entity_v1_1,
-            mention_count=int(row.mention_count),
-            ad_count=int(row.ad_count),
-            platform_count=int(getattr(row, "platform_count", 0)),
-            party_mode=getattr(row, "party_mode", "UNKNOWN"),
-            tone_mode=getattr(row, "tone_mode", "UNKNOWN"),
-        )
-
-    node_lookup = (
-        nodes.groupby("canonical_entity_v1_1", as_index=False)
-        .agg(
-            mention_count=("mention_count", "max"),
-            ad_count=("ad_count", "max"),
-            sponsor_count=("sponsor_count", "max"),
-            platform_count=("platform_count", "max"),
-            label_mode=("label_mode", lambda s: s.mode().iloc[0] if not s.mode().empty else "SPONSOR_OR_UNMAPPED"),
-        )
-        .set_index("canonical_entity_v1_1")
-        .to_dict("index")
+    layout_params = LayoutParams(
+        algorithm=args.layout_algorithm,
+        k=args.layout_k,
+        seed=args.layout_seed,
+        iterations=args.layout_iterations,
     )
+    layout_cache_dir = resolve_path(args.layout_cache_dir, analysis_root) if args.layout_cache else None
+    if args.variants:
+        return run_variants(args, analysis_root, edges, nodes, layout_params, layout_cache_dir)
 
-    for node in list(graph.nodes()):
-        meta = node_lookup.get(node, {})
-        graph.nodes[node]["mention_count"] = int(meta.get("mention_count", 1))
-        graph.nodes[node]["ad_count"] = int(meta.get("ad_count", 1))
-        graph.nodes[node]["sponsor_count"] = int(meta.get("sponsor_count", 1))
-        graph.nodes[node]["platform_count"] = int(meta.get("platform_count", 1))
-        graph.nodes[node]["label_mode"] = meta.get("label_mode", "SPONSOR_OR_UNMAPPED")
-
-    if args.keep_largest_component and graph.number_of_nodes() > 0:
-        components = list(nx.weakly_connected_components(graph))
-        largest = max(components, key=len)
-        graph = graph.subgraph(largest).copy()
-
+    edges_f = filter_edges(edges, args.min_edge_mentions, args.top_n_edges)
+    graph = build_graph(edges_f, args.keep_largest_component)
     if graph.number_of_nodes() == 0:
         raise ValueError("Graph is empty after filtering. Lower --min-edge-mentions or increase --top-n-edges.")
 
-    pos = nx.spring_layout(graph, k=args.layout_k, seed=args.layout_seed)
-
-    label_colors = {
-        "PERSON": "#1f77b4",
-        "ORG": "#d62728",
-        "GPE": "#2ca02c",
-        "SPONSOR_OR_UNMAPPED": "#7f7f7f",
-    }
+    pos = cached_layout_graph(graph, layout_params, layout_cache_dir, warm_start=args.layout_warm_start)
 
-    edge_x: list[float | None] = []
-    edge_y: list[float | None] = []
-    for u, v in graph.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-
-    edge_trace = go.Scatter(
-        x=edge_x,
-        y=edge_y,
-        mode="lines",
-        hoverinfo="none",
-        showlegend=False,
-        line=dict(width=0.7, color="rgba(120,120,120,0.35)"),
-    )
-
-    node_mentions = pd.Series({n: graph.nodes[n].get("mention_count", 1) for n in graph.nodes()})
-    min_m = float(node_mentions.min())
-    max_m = float(node_mentions.max())
-
-    node_x: list[float] = []
-    node_y: list[float] = []
-    node_size: list[float] = []
-    node_color: list[str] = []
-    node_text: list[str] = []
-
-    for n in graph.nodes():
-        x, y = pos[n]
-        meta = graph.nodes[n]
-        label = meta.get("label_mode", "SPONSOR_OR_UNMAPPED")
-        node_x.append(x)
-        node_y.append(y)
-        node_size.append(scale_size(float(meta.get("mention_count", 1)), min_m, max_m))
-        node_color.append(label_colors.get(label, "#7f7f7f"))
-        node_text.append(
-            f"node={n}<br>"
-            f"label={label}<br>"
-            f"mentions={meta.get('mention_count', 0):,}<br>"
-            f"ads={meta.get('ad_count', 0):,}<br>"
-            f"sponsors={meta.get('sponsor_count', 0):,}<br>"
-            f"platforms={meta.get('platform_count', 0):,}"
-        )
+    node_table = build_node_table(list(graph.nodes()), build_node_lookup(nodes), pos)
+    fig = build_figure(graph, node_table, args.webgl_threshold)
 
-    node_trace = go.Scatter(
-        x=node_x,
-        y=node_y,
-        mode="markers",
-        hoverinfo="text",
-        text=node_text,
-        showlegend=False,
-        marker=dict(
-            size=node_size,
-            color=node_color,
-            opacity=0.95,
-            line=dict(width=0.8, color="rgba(255,255,255,0.85)"),
-        ),
+    write_figure_html(
+        fig,
+        out_html,
+        args.export_mode,
+        args.plotlyjs,
+        args.coord_decimals,
+        edge_ids=(node_table[["x", "y"]].to_numpy(), *edge_index(graph, node_table)),
     )
-
-    fig = go.Figure(data=[edge_trace, node_trace])
-    fig.update_layout(
-        title=(
-            f"Week 3 Attack-Target Graph v1.1: "
-            f"{graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges"
-        ),
-        template="plotly_white",
-        hovermode="closest",
-        margin=dict(l=20, r=20, t=60, b=20),
-        xaxis=dict(showgrid=False, zeroline=False, visible=False),
-        yaxis=dict(showgrid=False, zeroline=False, visible=False),
-    )
-
-    fig.write_html(str(out_html), include_plotlyjs="cdn")
     print(f"wrote: {out_html}")
     print(f"nodes plotted: {graph.number_of_nodes():,}")
     print(f"edges plotted: {graph.number_of_edges():,}")
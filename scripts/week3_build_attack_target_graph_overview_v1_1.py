@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""Render a rasterized overview of the full Week 3 attack-target graph.
+
+Edges are binned into a density image with NumPy (datashader-style line
+aggregation), so cost is bounded by the image size and a per-chunk sample
+budget rather than by how many SVG/WebGL primitives a browser can draw. Only
+the top-k nodes are overlaid as markers (interactive in HTML output).
+
+Default usage:
+    poetry run python scripts/week3_build_attack_target_graph_overview_v1_1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Layout engines are shared with the Dash app in `apps/`; graph filtering and node
+# attributes with the vector renderer next to this script.
+APPS_DIR = Path(__file__).resolve().parent.parent / "apps"
+if str(APPS_DIR) not in sys.path:
+    sys.path.insert(0, str(APPS_DIR))
+
+from week3_build_attack_target_graph_interactive_v1_1 import (  # noqa: E402
+    LABEL_COLORS,
+    NODE_METRICS,
+    build_graph,
+    build_node_lookup,
+    build_node_table,
+    detect_analysis_root,
+    edge_index,
+    filter_edges,
+    resolve_path,
+)
+from week3_graph_layout import LAYOUT_ALGORITHMS, LayoutParams, cached_layout_graph  # noqa: E402
+
+SHADE_MODES = ("log", "eq_hist")
+EDGE_WEIGHTS = ("count", "mention_count")
+OVERVIEW_PADDING = 0.03
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render a rasterized Week 3 v1.1 attack-target graph overview.")
+    parser.add_argument(
+        "--edges",
+        default="outputs/week3/attack_target_edges_v1_1.csv",
+        help="Path to Week 3 edge CSV.",
+    )
+    parser.add_argument(
+        "--nodes",
+        default="outputs/week3/attack_target_nodes_v1_1.csv",
+        help="Path to Week 3 node CSV.",
+    )
+    parser.add_argument(
+        "--out",
+        default="outputs/week3/attack_target_graph_overview_v1_1.html",
+        help="Output path; .png writes a static image, .html an image with interactive top-k nodes.",
+    )
+    parser.add_argument(
+        "--min-edge-mentions",
+        type=int,
+        default=2,
+        help="Minimum mention_count edge threshold.",
+    )
+    parser.add_argument(
+        "--top-n-edges",
+        type=int,
+        default=None,
+        help="Optional cap on edges after filtering (default: all edges).",
+    )
+    parser.add_argument(
+        "--keep-largest-component",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Keep only the largest weakly-connected component.",
+    )
+    parser.add_argument(
+        "--top-k-nodes",
+        type=int,
+        default=300,
+        help="Number of highest-mention nodes drawn as markers.",
+    )
+    parser.add_argument("--width", type=int, default=1600, help="Raster width in pixels.")
+    parser.add_argument("--height", type=int, default=1200, help="Raster height in pixels.")
+    parser.add_argument(
+        "--shade",
+        choices=SHADE_MODES,
+        default="eq_hist",
+        help="Density-to-color mapping: log scaling or histogram equalization.",
+    )
+    parser.add_argument(
+        "--edge-weight",
+        choices=EDGE_WEIGHTS,
+        default="count",
+        help="Pixel aggregate: number of edges crossing a pixel, or their summed mention_count.",
+    )
+    parser.add_argument("--colormap", default="Greys", help="Matplotlib colormap for edge density.")
+    parser.add_argument(
+        "--max-chunk-samples",
+        type=int,
+        default=2_000_000,
+        help="Upper bound on edge pixel samples held in memory at once.",
+    )
+    parser.add_argument(
+        "--layout-algorithm",
+        choices=LAYOUT_ALGORITHMS,
+        default="auto",
+        help="Layout engine (auto: spring for small graphs, barnes_hut for large ones).",
+    )
+    parser.add_argument("--layout-k", type=float, default=0.42, help="Force layout k parameter.")
+    parser.add_argument("--layout-seed", type=int, default=42, help="Layout seed.")
+    parser.add_argument("--layout-iterations", type=int, default=50, help="Force layout iterations.")
+    parser.add_argument(
+        "--layout-gravity",
+        type=float,
+        default=0.05,
+        help=(
+            "Pull toward the centroid, so small components stay in frame when every edge is drawn "
+            "(0 reuses the Dash app's layouts)."
+        ),
+    )
+    parser.add_argument(
+        "--layout-cache-dir",
+        default="outputs/week3/layout_cache",
+        help="Directory for cached layout positions (shared with the Dash app).",
+    )
+    parser.add_argument(
+        "--layout-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse cached positions when the edge set and layout parameters match.",
+    )
+    parser.add_argument(
+        "--layout-warm-start",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="On a cache miss, refine the newest cached layout instead of starting from random positions.",
+    )
+    return parser.parse_args()
+
+
+def require_matplotlib():
+    """matplotlib on the Agg backend, for shading and image output.
+
+    Imported on first use: the project does not declare it (seaborn installs it
+    in the Poetry environment).
+    """
+    try:
+        import matplotlib
+    except ImportError as exc:  # pragma: no cover
+        raise SystemExit("The overview renderer requires matplotlib (`pip install matplotlib`).") from exc
+    matplotlib.use("Agg")
+    return matplotlib
+
+
+def raster_extent(xy: np.ndarray, padding: float = OVERVIEW_PADDING) -> tuple[float, float, float, float]:
+    """`(x0, x1, y0, y1)` covering every node with a small margin."""
+    if xy.size == 0:
+        return -1.0, 1.0, -1.0, 1.0
+    lo = xy.min(axis=0)
+    hi = xy.max(axis=0)
+    pad = np.maximum(hi - lo, 1e-9) * padding
+    return float(lo[0] - pad[0]), float(hi[0] + pad[0]), float(lo[1] - pad[1]), float(hi[1] + pad[1])
+
+
+def rasterize_edges(
+    xy: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    extent: tuple[float, float, float, float],
+    width: int,
+    height: int,
+    weights: np.ndarray | None = None,
+    max_chunk_samples: int = 2_000_000,
+) -> np.ndarray:
+    """Aggregate straight edges into a `(height, width)` float image, row 0 at the top.
+
+    Each edge is sampled once per pixel step along its major axis, so it adds
+    its weight (1 by default) to every pixel it crosses. Edges are processed
+    in chunks of at most `max_chunk_samples` samples (one edge minimum), which
+    bounds peak memory independently of the edge count.
+    """
+    image = np.zeros(width * height, dtype=np.float64)
+    if len(src) == 0:
+        return image.reshape(height, width)
+
+    x0, x1, y0, y1 = extent
+    px = (xy[:, 0] - x0) / (x1 - x0) * (width - 1)
+    py = (y1 - xy[:, 1]) / (y1 - y0) * (height - 1)
+    sx, sy = px[src], py[src]
+    dx, dy = px[dst] - sx, py[dst] - sy
+    steps = np.ceil(np.maximum(np.abs(dx), np.abs(dy))).astype(np.int64) + 1
+    weights = np.ones(len(src)) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    ends = np.cumsum(steps)
+    start = 0
+    while start < len(src):
+        budget = (ends[start - 1] if start else 0) + max_chunk_samples
+        stop = max(int(np.searchsorted(ends, budget, side="right")), start + 1)
+        reps = steps[start:stop]
+        edge_ids = np.repeat(np.arange(start, stop), reps)
+        first = np.repeat(np.cumsum(reps) - reps, reps)
+        t = (np.arange(len(edge_ids)) - first) / np.maximum(reps - 1, 1).repeat(reps)
+        cols = np.clip(np.rint(sx[edge_ids] + t * dx[edge_ids]), 0, width - 1).astype(np.int64)
+        rows = np.clip(np.rint(sy[edge_ids] + t * dy[edge_ids]), 0, height - 1).astype(np.int64)
+        image += np.bincount(rows * width + cols, weights=weights[edge_ids], minlength=width * height)
+        start = stop
+    return image.reshape(height, width)
+
+
+def shade(image: np.ndarray, how: str, colormap: str) -> np.ndarray:
+    """Map aggregated density to RGBA uint8; empty pixels stay transparent."""
+    filled = image > 0
+    level = np.zeros(image.shape, dtype=np.float64)
+    if filled.any():
+        values = image[filled]
+        if how == "eq_hist":
+            # Histogram equalization: a pixel's level is the share of filled pixels at or below it.
+            distinct, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+            cdf = np.cumsum(counts) / values.size
+            level[filled] = cdf[inverse] if len(distinct) > 1 else 1.0
+        else:
+            level[filled] = np.log1p(values) / np.log1p(values.max())
+    # Keep the faintest edges visible against a white background.
+    level[filled] = 0.25 + 0.75 * level[filled]
+    rgba = require_matplotlib().colormaps[colormap](level)
+    rgba[..., 3] = filled
+    return (rgba * 255).round().astype(np.uint8)
+
+
+def top_nodes(node_table: pd.DataFrame, k: int) -> pd.DataFrame:
+    return node_table.nlargest(k, "mention_count", keep="first") if k > 0 else node_table.iloc[:0]
+
+
+def write_png(
+    rgba: np.ndarray,
+    extent: tuple[float, float, float, float],
+    markers: pd.DataFrame,
+    out_path: Path,
+) -> None:
+    require_matplotlib()
+    import matplotlib.pyplot as plt
+
+    height, width = rgba.shape[:2]
+    fig = plt.figure(figsize=(width / 100, height / 100), dpi=100)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.imshow(rgba, extent=extent, interpolation="nearest", aspect="auto")
+    ax.scatter(
+        markers["x"],
+        markers["y"],
+        s=markers["size"].to_numpy() ** 2 / 4,
+        c=[LABEL_COLORS.get(str(label), "#7f7f7f") for label in markers["label_mode"]],
+        edgecolors="white",
+        linewidths=0.6,
+        zorder=2,
+    )
+    ax.set_xlim(extent[0], extent[1])
+    ax.set_ylim(extent[2], extent[3])
+    ax.set_axis_off()
+    fig.savefig(out_path, dpi=100, facecolor="white")
+    plt.close(fig)
+
+
+def build_overview_figure(
+    rgba: np.ndarray,
+    extent: tuple[float, float, float, float],
+    markers: pd.DataFrame,
+    title: str,
+) -> go.Figure:
+    require_matplotlib()
+    import matplotlib.image as mpimg
+
+    buffer = io.BytesIO()
+    mpimg.imsave(buffer, rgba, format="png")
+    source = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    x0, x1, y0, y1 = extent
+
+    traces = []
+    for label, group in markers.groupby("label_mode", sort=True):
+        traces.append(
+            go.Scattergl(
+                x=group["x"].to_numpy(),
+                y=group["y"].to_numpy(),
+                mode="markers",
+                name=str(label),
+                text=group.index.to_numpy(dtype=str),
+                customdata=group[NODE_METRICS].to_numpy(),
+                hovertemplate=(
+                    "node=%{text}<br>"
+                    f"label={label}<br>"
+                    "mentions=%{customdata[0]:,}<br>"
+                    "ads=%{customdata[1]:,}<br>"
+                    "sponsors=%{customdata[2]:,}<br>"
+                    "platforms=%{customdata[3]:,}"
+                    "<extra></extra>"
+                ),
+                marker=dict(
+                    size=group["size"].to_numpy(),
+                    color=LABEL_COLORS.get(str(label), "#7f7f7f"),
+                    opacity=0.9,
+                    line=dict(width=0.8, color="rgba(255,255,255,0.85)"),
+                ),
+            )
+        )
+
+    fig = go.Figure(data=traces)
+    fig.add_layout_image(
+        source=source,
+        xref="x",
+        yref="y",
+        x=x0,
+        y=y1,
+        sizex=x1 - x0,
+        sizey=y1 - y0,
+        sizing="stretch",
+        layer="below",
+    )
+    fig.update_layout(
+        title=title,
+        template="plotly_white",
+        hovermode="closest",
+        margin=dict(l=20, r=20, t=60, b=20),
+        xaxis=dict(range=[x0, x1], showgrid=False, zeroline=False, visible=False),
+        yaxis=dict(range=[y0, y1], showgrid=False, zeroline=False, visible=False),
+    )
+    return fig
+
+
+def main() -> int:
+    args = parse_args()
+    # Fail before the layout rather than after it.
+    require_matplotlib()
+    analysis_root = detect_analysis_root()
+
+    edge_path = resolve_path(args.edges, analysis_root)
+    node_path = resolve_path(args.nodes, analysis_root)
+    out_path = resolve_path(args.out, analysis_root)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not edge_path.exists():
+        raise FileNotFoundError(f"Edges file not found: {edge_path}")
+    if not node_path.exists():
+        raise FileNotFoundError(f"Nodes file not found: {node_path}")
+    if out_path.suffix.lower() not in {".png", ".html"}:
+        raise ValueError(f"Unsupported output type (use .png or .html): {out_path}")
+
+    edges = pd.read_csv(edge_path)
+    nodes = pd.read_csv(node_path)
+
+    edges_f = filter_edges(edges, args.min_edge_mentions, args.top_n_edges)
+    graph = build_graph(edges_f, args.keep_largest_component)
+    if graph.number_of_nodes() == 0:
+        raise ValueError("Graph is empty after filtering. Lower --min-edge-mentions.")
+
+    layout_params = LayoutParams(
+        algorithm=args.layout_algorithm,
+        k=args.layout_k,
+        seed=args.layout_seed,
+        iterations=args.layout_iterations,
+        gravity=args.layout_gravity,
+    )
+    layout_cache_dir = resolve_path(args.layout_cache_dir, analysis_root) if args.layout_cache else None
+    pos = cached_layout_graph(graph, layout_params, layout_cache_dir, warm_start=args.layout_warm_start)
+
+    node_table = build_node_table(list(graph.nodes()), build_node_lookup(nodes), pos)
+    xy = node_table[["x", "y"]].to_numpy()
+    src, dst = edge_index(graph, node_table)
+    weights = None
+    if args.edge_weight == "mention_count":
+        weights = np.fromiter(
+            (data.get("mention_count", 1) for _, _, data in graph.edges(data=True)),
+            dtype=np.float64,
+            count=graph.number_of_edges(),
+        )
+
+    extent = raster_extent(xy)
+    image = rasterize_edges(
+        xy,
+        src,
+        dst,
+        extent,
+        args.width,
+        args.height,
+        weights=weights,
+        max_chunk_samples=args.max_chunk_samples,
+    )
+    rgba = shade(image, args.shade, args.colormap)
+    markers = top_nodes(node_table, args.top_k_nodes)
+
+    if out_path.suffix.lower() == ".png":
+        write_png(rgba, extent, markers, out_path)
+    else:
+        title = (
+            f"Week 3 Attack-Target Graph v1.1 overview: "
+            f"{graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges "
+            f"(top {len(markers):,} nodes shown)"
+        )
+        build_overview_figure(rgba, extent, markers, title).write_html(
+            str(out_path),
+            include_plotlyjs="cdn",
+            config={"displaylogo": False},
+        )
+    print(f"wrote: {out_path}")
+    print(f"nodes in layout: {graph.number_of_nodes():,}")
+    print(f"edges rasterized: {graph.number_of_edges():,}")
+    print(f"nodes drawn: {len(markers):,}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
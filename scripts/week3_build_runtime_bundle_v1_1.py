@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Build the Week 3 Dash app runtime bundle (memory-mapped arrays + manifest).
+
+Runs the app's CSV loading, graph assembly and layout once, so app workers start
+by memory-mapping the result instead of repeating that work.
+
+Default usage:
+    poetry run python scripts/week3_build_runtime_bundle_v1_1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Runtime assembly and the bundle format live with the Dash app in `apps/`.
+APPS_DIR = Path(__file__).resolve().parent.parent / "apps"
+if str(APPS_DIR) not in sys.path:
+    sys.path.insert(0, str(APPS_DIR))
+
+from week3_graph_layout import LAYOUT_ALGORITHMS, LayoutParams  # noqa: E402
+from week3_runtime_bundle import load_runtime_bundle, write_runtime_bundle  # noqa: E402
+from week3_runtime_data import build_runtime_from_sources  # noqa: E402
+from week3_runtime_paths import RuntimePaths  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the Week 3 v1.1 Dash app runtime bundle.")
+    parser.add_argument(
+        "--edges",
+        default="outputs/week3/attack_target_edges_v1_1.csv",
+        help="Path to Week 3 edge CSV.",
+    )
+    parser.add_argument(
+        "--nodes",
+        default="outputs/week3/attack_target_nodes_v1_1.csv",
+        help="Path to Week 3 node CSV.",
+    )
+    parser.add_argument(
+        "--sponsors",
+        default="outputs/week3/attack_target_sponsors_v1_1.csv",
+        help="Path to Week 3 sponsor party/spend rollup.",
+    )
+    parser.add_argument(
+        "--target-spend",
+        default="outputs/week3/attack_target_target_spend_v1_1.csv",
+        help="Path to Week 3 target received-spend rollup.",
+    )
+    parser.add_argument(
+        "--edge-spend",
+        default="outputs/week3/attack_target_edge_spend_v1_1.csv",
+        help="Path to Week 3 edge attack-spend rollup.",
+    )
+    parser.add_argument(
+        "--edge-days",
+        default="outputs/week3/attack_target_edge_days_v1_1.csv",
+        help="Path to Week 3 per-(edge, day) cube.",
+    )
+    parser.add_argument(
+        "--out-dir",
+        default="outputs/week3/runtime_bundle_v1_1",
+        help="Bundle directory (the app's default DELTA_RUNTIME_BUNDLE location).",
+    )
+    parser.add_argument(
+        "--layout-algorithm",
+        choices=LAYOUT_ALGORITHMS,
+        default="auto",
+        help="Layout engine; must match the app's DELTA_LAYOUT_ALGORITHM for the bundle to be used.",
+    )
+    parser.add_argument("--layout-k", type=float, default=0.42, help="Force layout k parameter.")
+    parser.add_argument("--layout-seed", type=int, default=42, help="Layout seed.")
+    parser.add_argument("--layout-iterations", type=int, default=50, help="Force layout iterations.")
+    parser.add_argument(
+        "--layout-cache-dir",
+        default="outputs/week3/layout_cache",
+        help="Directory for cached layout positions (shared with the Dash app).",
+    )
+    parser.add_argument(
+        "--layout-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse cached positions when the edge set and layout parameters match.",
+    )
+    parser.add_argument(
+        "--layout-warm-start",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="On a cache miss, refine the newest cached layout instead of starting from random positions.",
+    )
+    return parser.parse_args()
+
+
+def detect_analysis_root() -> Path:
+    cwd = Path.cwd().resolve()
+    script_dir = Path(__file__).resolve().parent
+    candidates = [cwd, script_dir, script_dir.parent, cwd.parent]
+
+    seen = set()
+    for candidate in candidates:
+        if candidate in seen:
+            continue
+        seen.add(candidate)
+        if (candidate / "data").exists() and (candidate / "outputs").exists():
+            return candidate
+    return cwd
+
+
+def resolve_path(path_str: str, analysis_root: Path) -> Path:
+    path = Path(path_str).expanduser()
+    return path if path.is_absolute() else (analysis_root / path).resolve()
+
+
+def main() -> int:
+    args = parse_args()
+    analysis_root = detect_analysis_root()
+
+    inputs = {
+        "edges_path": resolve_path(args.edges, analysis_root),
+        "nodes_path": resolve_path(args.nodes, analysis_root),
+        "sponsors_path": resolve_path(args.sponsors, analysis_root),
+        "target_spend_path": resolve_path(args.target_spend, analysis_root),
+        "edge_spend_path": resolve_path(args.edge_spend, analysis_root),
+        "edge_days_path": resolve_path(args.edge_days, analysis_root),
+    }
+    for name, path in inputs.items():
+        if not path.exists():
+            raise FileNotFoundError(f"{name.removesuffix('_path').replace('_', ' ').capitalize()} file not found: {path}")
+    bundle_dir = resolve_path(args.out_dir, analysis_root)
+
+    paths = RuntimePaths(
+        project_dir=APPS_DIR,
+        analysis_root=analysis_root,
+        base_path="/",
+        layout_params=LayoutParams(
+            algorithm=args.layout_algorithm,
+            k=args.layout_k,
+            seed=args.layout_seed,
+            iterations=args.layout_iterations,
+        ),
+        layout_cache_dir=resolve_path(args.layout_cache_dir, analysis_root) if args.layout_cache else None,
+        layout_warm_start=args.layout_warm_start,
+        runtime_bundle_dir=bundle_dir,
+        **inputs,
+    )
+
+    started = time.perf_counter()
+    runtime = build_runtime_from_sources(paths)
+    built = time.perf_counter()
+    manifest = write_runtime_bundle(bundle_dir, runtime, paths)
+    written = time.perf_counter()
+    load_runtime_bundle(bundle_dir)
+    loaded = time.perf_counter()
+
+    print(f"wrote: {bundle_dir}")
+    print(f"nodes: {manifest['n_nodes']:,}")
+    print(f"edges: {manifest['n_edges']:,}")
+    print(f"build from CSV: {built - started:.2f}s")
+    print(f"write bundle: {written - built:.2f}s")
+    print(f"load bundle: {loaded - written:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,10 +6,12 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError as exc:  # pragma: no cover
     raise SystemExit("This script requires pandas. Run from the analysis Poetry environment.") from exc
@@ -35,6 +37,9 @@ ORG_SUFFIX_ONLY = {"pac", "inc", "llc", "committee"}
 TARGET_TONES = {"NEGATIVE", "CONTRAST"}
 TARGET_LABELS = {"PERSON", "ORG"}
 BUILD_VERSION = "v1.1_conservative"
+VALIDATION_MODES = ("full", "sample", "off")
+VALIDATION_EXAMPLE_KEYS = 5
+VALIDATION_SEED = 42
 
 
 def parse_args() -> argparse.Namespace:
@@ -49,11 +54,28 @@ def parse_args() -> argparse.Namespace:
         default="outputs/week1/entity_alias_map_v1.csv",
         help="Path to reviewed alias map.",
     )
+    parser.add_argument(
+        "--harmonized-in",
+        default="outputs/week1/harmonized_sample_week1.csv.gz",
+        help="Path to Week 1 harmonized ad table (spend_proxy for the spend rollups).",
+    )
     parser.add_argument(
         "--out-dir",
         default="outputs/week3",
         help="Output directory for Week 3 cleaned artifacts.",
     )
+    parser.add_argument(
+        "--validate",
+        choices=VALIDATION_MODES,
+        default="full",
+        help="Output validation: full (exhaustive, for releases), sample (row-sampled mention checks), or off.",
+    )
+    parser.add_argument(
+        "--validate-sample-size",
+        type=int,
+        default=50_000,
+        help="Mention rows checked per row-level check when --validate=sample.",
+    )
     return parser.parse_args()
 
 
@@ -243,8 +265,203 @@ def build_nodes_v1_1(df: pd.DataFrame, edges: pd.DataFrame) -> pd.DataFrame:
     return grouped
 
 
-def run_validation(mentions: pd.DataFrame, edges: pd.DataFrame, nodes: pd.DataFrame) -> list[str]:
-    warnings: list[str] = []
+def load_spend_ads(path: Path) -> pd.DataFrame:
+    if not path.exists():
+        raise FileNotFoundError(f"Harmonized ad table not found: {path}")
+    spend_ads = pd.read_csv(path, compression="gzip" if path.suffix == ".gz" else None, usecols=["platform", "ad_id", "spend_proxy"])
+    spend_ads["spend_proxy"] = pd.to_numeric(spend_ads["spend_proxy"], errors="coerce").fillna(0.0)
+    return spend_ads
+
+
+def modal_sponsor_party(df: pd.DataFrame) -> pd.Series:
+    """Most frequent non-empty `party_std` per sponsor (ties: alphabetically first), UNKNOWN when none."""
+    rows = df[["sponsor_name", "party_std"]].dropna()
+    rows = rows.assign(party_std=rows["party_std"].astype(str))
+    rows = rows[rows["party_std"] != ""]
+    counts = rows.value_counts().rename("n").reset_index()
+    counts = counts.sort_values(["sponsor_name", "n", "party_std"], ascending=[True, False, True])
+    winner = counts.drop_duplicates("sponsor_name").set_index("sponsor_name")["party_std"].str.strip()
+    sponsors = pd.Index(df["sponsor_name"].dropna().unique(), name="sponsor_name")
+    return winner.replace("", "UNKNOWN").reindex(sponsors, fill_value="UNKNOWN").rename("sponsor_party")
+
+
+def build_spend_tables_v1_1(
+    df: pd.DataFrame, edges: pd.DataFrame, spend_ads: pd.DataFrame
+) -> dict[str, pd.DataFrame]:
+    """Sponsor party and spend rollups read by the Dash app instead of mention-level data.
+
+    Spend is `spend_proxy` joined on `(platform, ad_id)` and counted once per
+    ad within each sponsor, target, or sponsor-target pair. Pair spend is kept
+    only for pairs in `edges`, like the evidence tables.
+    """
+    target_mentions = df.loc[
+        df["is_target_v1_1"], ["platform", "ad_id", "sponsor_name", "canonical_entity_v1_1", "party_std"]
+    ].drop_duplicates()
+    target_mentions = target_mentions.merge(spend_ads, on=["platform", "ad_id"], how="left")
+    target_mentions["spend_proxy"] = target_mentions["spend_proxy"].fillna(0.0)
+
+    sponsor_attack_spend = (
+        target_mentions.drop_duplicates(subset=["sponsor_name", "platform", "ad_id"])
+        .groupby("sponsor_name")["spend_proxy"]
+        .sum()
+        .rename("sponsor_attack_spend")
+    )
+    sponsor_summary = modal_sponsor_party(df).to_frame()
+    sponsor_summary["sponsor_attack_spend"] = sponsor_attack_spend.reindex(sponsor_summary.index, fill_value=0.0)
+
+    target_spend = (
+        target_mentions.drop_duplicates(subset=["canonical_entity_v1_1", "platform", "ad_id"])
+        .groupby("canonical_entity_v1_1")["spend_proxy"]
+        .sum()
+        .rename("target_received_spend")
+    )
+    edge_spend = (
+        target_mentions.drop_duplicates(subset=["sponsor_name", "canonical_entity_v1_1", "platform", "ad_id"])
+        .groupby(["sponsor_name", "canonical_entity_v1_1"])["spend_proxy"]
+        .sum()
+        .rename("edge_attack_spend")
+        .reset_index()
+    )
+    keys = edges[["sponsor_name", "canonical_entity_v1_1"]]
+    edge_spend = edge_spend.merge(keys, on=["sponsor_name", "canonical_entity_v1_1"], how="inner")
+    return {
+        "sponsors": sponsor_summary.reset_index(),
+        "target_spend": target_spend.reset_index(),
+        "edge_spend": edge_spend,
+    }
+
+
+EVIDENCE_COLUMNS = [
+    "sponsor_name",
+    "canonical_entity_v1_1",
+    "ad_id",
+    "platform",
+    "date",
+    "tone_std",
+    "spend_proxy",
+    "context_window",
+]
+
+
+def build_evidence_v1_1(
+    df: pd.DataFrame, edges: pd.DataFrame, spend_ads: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Target mentions behind each edge, sorted by edge key, and each edge's row range.
+
+    Rows of one edge are contiguous (newest first), so the Dash drill-down reads
+    a page as a slice of `[row_start, row_stop)`. `spend_proxy` is the ad's
+    spend, repeated on every mention from that ad.
+    """
+    keys = edges[["sponsor_name", "canonical_entity_v1_1"]]
+    evidence = df[df["is_target_v1_1"]].merge(keys, on=["sponsor_name", "canonical_entity_v1_1"], how="inner")
+    evidence = evidence.merge(spend_ads.drop_duplicates(subset=["platform", "ad_id"]), on=["platform", "ad_id"], how="left")
+    evidence["spend_proxy"] = evidence["spend_proxy"].fillna(0.0)
+    text_columns = ["ad_id", "platform", "date", "tone_std", "context_window"]
+    evidence = evidence[EVIDENCE_COLUMNS].fillna({c: "" for c in text_columns}).astype({c: str for c in text_columns})
+    evidence = evidence.sort_values(
+        ["sponsor_name", "canonical_entity_v1_1", "date", "ad_id"],
+        ascending=[True, True, False, True],
+        kind="stable",
+    ).reset_index(drop=True)
+
+    starts = evidence.groupby(["sponsor_name", "canonical_entity_v1_1"], sort=False).size().rename("row_count").reset_index()
+    starts["row_stop"] = starts["row_count"].cumsum()
+    starts["row_start"] = starts["row_stop"] - starts["row_count"]
+    index = starts[["sponsor_name", "canonical_entity_v1_1", "row_start", "row_stop"]]
+    return evidence, index
+
+
+def build_edge_days_v1_1(evidence: pd.DataFrame) -> pd.DataFrame:
+    """Sparse per-(edge, day) mentions, distinct ads and spend for the Dash app's date window.
+
+    Only days with mentions get a row. Mentions without a parseable `date` are
+    left out, so day totals can fall short of the edge's `mention_count`.
+    Spend is counted once per ad within the edge and day; summed over days it
+    matches `edge_attack_spend` as long as each ad carries a single date.
+    """
+    keys = ["sponsor_name", "canonical_entity_v1_1", "date"]
+    dated = evidence.assign(date=pd.to_datetime(evidence["date"], errors="coerce").dt.strftime("%Y-%m-%d"))
+    dated = dated.dropna(subset=["date"])
+    mentions = dated.groupby(keys).size().rename("mention_count")
+    ads = dated.drop_duplicates(subset=[*keys, "platform", "ad_id"]).groupby(keys)
+    edge_days = pd.concat(
+        [mentions, ads.size().rename("ad_count"), ads["spend_proxy"].sum().rename("edge_attack_spend")],
+        axis=1,
+    )
+    return edge_days.reset_index()
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    check: str
+    severity: str
+    failing_rows: int
+    rows_checked: int
+    example_keys: tuple[str, ...] = ()
+    message: str = ""
+
+    @property
+    def failed(self) -> bool:
+        return self.failing_rows > 0
+
+
+def normalize_series_for_match(series: pd.Series) -> pd.Series:
+    """Vectorized equivalent of `normalize_for_match` for a whole column."""
+    s = series.fillna("").astype(str).str.strip().str.lower()
+    s = s.str.replace(r"[^a-z0-9\s]", "", regex=True)
+    return s.str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def edge_keys(df: pd.DataFrame) -> pd.Series:
+    return df["sponsor_name"].astype(str) + " -> " + df["canonical_entity_v1_1"].astype(str)
+
+
+def make_result(
+    check: str,
+    severity: str,
+    failing: pd.Series,
+    keys: pd.Series,
+    message: str,
+    row_counts: pd.Series | None = None,
+) -> ValidationResult:
+    """Summarize a boolean failure mask into a structured validation result.
+
+    `row_counts` weights each checked key when the mask was evaluated on
+    deduplicated keys rather than on individual rows.
+    """
+    failing_keys = keys[failing.to_numpy()]
+    examples = tuple(failing_keys.astype(str).drop_duplicates().head(VALIDATION_EXAMPLE_KEYS))
+    counts = pd.Series(1, index=failing.index) if row_counts is None else row_counts
+    return ValidationResult(
+        check=check,
+        severity=severity,
+        failing_rows=int(counts[failing.to_numpy()].sum()),
+        rows_checked=int(counts.sum()),
+        example_keys=examples,
+        message=message,
+    )
+
+
+def sample_rows(df: pd.DataFrame, max_rows: int) -> pd.DataFrame:
+    if len(df) <= max_rows:
+        return df
+    return df.sample(n=max_rows, random_state=VALIDATION_SEED)
+
+
+def run_validation(
+    mentions: pd.DataFrame,
+    edges: pd.DataFrame,
+    nodes: pd.DataFrame,
+    mode: str = "full",
+    sample_size: int = 50_000,
+) -> list[ValidationResult]:
+    """Run vectorized output checks.
+
+    In `sample` mode the mention-level checks run on a uniform row sample;
+    edge, node and per-platform checks are table-level and always run in full.
+    """
+    if mode == "off":
+        return []
 
     required_cols = {
         "canonical_entity_v1_1",
@@ -257,41 +474,141 @@ def run_validation(mentions: pd.DataFrame, edges: pd.DataFrame, nodes: pd.DataFr
     if missing:
         raise ValueError(f"Mentions output missing required columns: {sorted(missing)}")
 
-    if edges.duplicated(subset=["sponsor_name", "canonical_entity_v1_1"]).any():
-        raise ValueError("Duplicate edge keys found in v1.1 edges.")
+    results: list[ValidationResult] = []
+    rows = sample_rows(mentions, sample_size) if mode == "sample" else mentions
+    row_keys = rows["platform"].astype(str) + ":" + rows["ad_id"].astype(str)
+
+    edge_key = edge_keys(edges)
+    results.append(
+        make_result(
+            "edge_key_unique",
+            "error",
+            edges.duplicated(subset=["sponsor_name", "canonical_entity_v1_1"]),
+            edge_key,
+            "Duplicate edge keys found in v1.1 edges.",
+        )
+    )
+    results.append(
+        make_result(
+            "edge_retention_threshold",
+            "error",
+            (edges["mention_count"] < 2) | (edges["ad_count"] < 2),
+            edge_key,
+            "Edge retention threshold violated (mention_count/ad_count >= 2).",
+        )
+    )
+
+    kept = rows["entity_quality_flag"].eq("keep")
+    results.append(
+        make_result(
+            "kept_canonical_not_blank",
+            "error",
+            kept & rows["canonical_entity_v1_1"].fillna("").eq(""),
+            row_keys,
+            "Kept rows contain null/blank canonical_entity_v1_1.",
+        )
+    )
 
-    kept = mentions[mentions["entity_quality_flag"] == "keep"]
-    if kept["canonical_entity_v1_1"].fillna("").eq("").any():
-        raise ValueError("Kept rows contain null/blank canonical_entity_v1_1.")
+    is_target = mentions["is_target_v1_1"].fillna(False).astype(bool)
+    platform_targets = is_target.groupby(mentions["platform"]).sum()
+    zero_platforms = pd.Series(platform_targets.index.astype(str), index=platform_targets.index)
+    results.append(
+        make_result(
+            "platform_has_targets",
+            "warning",
+            platform_targets.eq(0),
+            zero_platforms,
+            "Zero targets retained for platform.",
+        )
+    )
+
+    node_entities = nodes["canonical_entity_v1_1"].astype(str)
+    results.append(
+        make_result(
+            "node_not_generic",
+            "error",
+            node_entities.isin(GENERIC_STOPLIST),
+            node_entities,
+            "Generic stoplist token found in final nodes.",
+        )
+    )
+    results.append(
+        make_result(
+            "node_not_numeric",
+            "error",
+            node_entities.str.fullmatch(r"\d+").fillna(False).astype(bool),
+            node_entities,
+            "Numeric-only entity found in final nodes.",
+        )
+    )
+    results.append(
+        make_result(
+            "node_not_too_short",
+            "error",
+            node_entities.str.len().le(2),
+            node_entities,
+            "Too-short entity found in final nodes.",
+        )
+    )
 
-    if not edges.empty:
-        if (edges["mention_count"] < 2).any() or (edges["ad_count"] < 2).any():
-            raise ValueError("Edge retention threshold violated (mention_count/ad_count >= 2).")
+    # Self-mention: compare each distinct (sponsor, target) pair once, elementwise in numpy.
+    target_pairs = (
+        rows.loc[rows["is_target_v1_1"].fillna(False).astype(bool), ["sponsor_name", "canonical_entity_v1_1"]]
+        .groupby(["sponsor_name", "canonical_entity_v1_1"], as_index=False, dropna=False)
+        .size()
+    )
+    sponsor_norm = normalize_series_for_match(target_pairs["sponsor_name"]).to_numpy(dtype=str)
+    canon_norm = normalize_series_for_match(target_pairs["canonical_entity_v1_1"]).to_numpy(dtype=str)
+    bad_self = (np.strings.str_len(canon_norm) > 0) & (np.strings.find(sponsor_norm, canon_norm) >= 0)
+    results.append(
+        make_result(
+            "target_not_self_mention",
+            "error",
+            pd.Series(bad_self, index=target_pairs.index, dtype=bool),
+            edge_keys(target_pairs),
+            "Found target row where canonical target is substring of normalized sponsor.",
+            row_counts=target_pairs["size"],
+        )
+    )
+    return results
 
-    target_rows = mentions[mentions["is_target_v1_1"]]
-    for platform, platform_df in mentions.groupby("platform"):
-        if platform_df["is_target_v1_1"].sum() == 0:
-            warnings.append(f"warning: zero targets retained for platform={platform}")
 
-    if not nodes.empty:
-        node_entities = set(nodes["canonical_entity_v1_1"].astype(str))
-        if node_entities & GENERIC_STOPLIST:
-            raise ValueError("Generic stoplist token found in final nodes.")
-        if any(re.fullmatch(r"\d+", x) for x in node_entities):
-            raise ValueError("Numeric-only entity found in final nodes.")
-        if any(len(x) <= 2 for x in node_entities):
-            raise ValueError("Too-short entity found in final nodes.")
+def raise_on_validation_errors(results: list[ValidationResult]) -> None:
+    errors = [r for r in results if r.severity == "error" and r.failed]
+    if not errors:
+        return
+    details = "; ".join(
+        f"{r.check}: {r.message} failing={r.failing_rows:,} examples={list(r.example_keys)}" for r in errors
+    )
+    raise ValueError(f"Validation failed: {details}")
 
-    sponsor_norm = target_rows["sponsor_name"].map(normalize_for_match)
-    canon_norm = target_rows["canonical_entity_v1_1"].map(normalize_for_match)
-    bad_self = [
-        bool(canon) and (canon in sponsor)
-        for sponsor, canon in zip(sponsor_norm, canon_norm)
-    ]
-    if any(bad_self):
-        raise ValueError("Found target row where canonical target is substring of normalized sponsor.")
 
-    return warnings
+def validation_frame(results: list[ValidationResult], mode: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "check": r.check,
+                "severity": r.severity,
+                "passed": not r.failed,
+                "failing_rows": r.failing_rows,
+                "rows_checked": r.rows_checked,
+                "example_keys": "|".join(r.example_keys),
+                "validate_mode": mode,
+                "build_version": BUILD_VERSION,
+            }
+            for r in results
+        ],
+        columns=[
+            "check",
+            "severity",
+            "passed",
+            "failing_rows",
+            "rows_checked",
+            "example_keys",
+            "validate_mode",
+            "build_version",
+        ],
+    )
 
 
 def main() -> int:
@@ -299,16 +616,19 @@ def main() -> int:
     analysis_root = detect_analysis_root()
     mentions_in = resolve_path(args.mentions_in, analysis_root)
     aliases_in = resolve_path(args.aliases_in, analysis_root)
+    harmonized_in = resolve_path(args.harmonized_in, analysis_root)
     out_dir = resolve_path(args.out_dir, analysis_root)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"analysis_root: {analysis_root}")
     print(f"mentions_in: {mentions_in}")
     print(f"aliases_in: {aliases_in}")
+    print(f"harmonized_in: {harmonized_in}")
     print(f"out_dir: {out_dir}")
 
     mentions = load_mentions(mentions_in)
     alias = load_alias_map(aliases_in)
+    spend_ads = load_spend_ads(harmonized_in)
     metrics: list[dict[str, object]] = []
 
     # Baseline metrics from Week 2 table.
@@ -369,6 +689,9 @@ def main() -> int:
     # Edge/node build.
     edges = build_edges_v1_1(df)
     nodes = build_nodes_v1_1(df, edges)
+    spend_tables = build_spend_tables_v1_1(df, edges, spend_ads)
+    evidence, evidence_index = build_evidence_v1_1(df, edges, spend_ads)
+    edge_days = build_edge_days_v1_1(evidence)
 
     add_metric(metrics, "final_edges_nodes", "edge_count_v1_1", len(edges))
     add_metric(metrics, "final_edges_nodes", "node_count_v1_1", len(nodes))
@@ -389,25 +712,54 @@ def main() -> int:
         int(edges.duplicated(subset=["sponsor_name", "canonical_entity_v1_1"]).sum()) if not edges.empty else 0,
     )
 
-    warnings = run_validation(df, edges, nodes)
-    for warning in warnings:
-        add_metric(metrics, "final_edges_nodes", "warning", warning)
-        print(warning)
+    validation = run_validation(df, edges, nodes, mode=args.validate, sample_size=args.validate_sample_size)
+    add_metric(metrics, "validation", "validate_mode", args.validate)
+    for result in validation:
+        add_metric(metrics, "validation", f"failing_rows::{result.check}", result.failing_rows)
+        if result.severity == "warning" and result.failed:
+            for key in result.example_keys:
+                warning = f"warning: {result.message} ({result.check}: {key})"
+                add_metric(metrics, "final_edges_nodes", "warning", warning)
+                print(warning)
+
+    validation_out = out_dir / "validation_results_v1_1.csv"
+    validation_frame(validation, args.validate).to_csv(validation_out, index=False)
+    print(f"Validation ({args.validate}): {validation_out}")
+    raise_on_validation_errors(validation)
 
     mentions_out = out_dir / "entity_mentions_week3_cleaned_v1_1.csv.gz"
     edges_out = out_dir / "attack_target_edges_v1_1.csv"
     nodes_out = out_dir / "attack_target_nodes_v1_1.csv"
     metrics_out = out_dir / "cleaning_metrics_v1_1.csv"
+    # Small rollups so the Dash app never reads mention-level data at startup.
+    spend_outs = {
+        "sponsors": out_dir / "attack_target_sponsors_v1_1.csv",
+        "target_spend": out_dir / "attack_target_target_spend_v1_1.csv",
+        "edge_spend": out_dir / "attack_target_edge_spend_v1_1.csv",
+    }
+    edge_days_out = out_dir / "attack_target_edge_days_v1_1.csv"
+    # Uncompressed Arrow IPC so the app can memory-map it and slice pages without decoding.
+    evidence_out = out_dir / "attack_target_evidence_v1_1.arrow"
+    evidence_index_out = out_dir / "attack_target_evidence_index_v1_1.csv"
 
     df = df.drop(columns=["review_status_alias", "canonical_final_norm"], errors="ignore")
     df.to_csv(mentions_out, index=False, compression="gzip")
     edges.to_csv(edges_out, index=False)
     nodes.to_csv(nodes_out, index=False)
+    for name, table_out in spend_outs.items():
+        spend_tables[name].to_csv(table_out, index=False)
+    edge_days.to_csv(edge_days_out, index=False)
+    evidence.to_feather(evidence_out, compression="uncompressed")
+    evidence_index.to_csv(evidence_index_out, index=False)
     pd.DataFrame(metrics).to_csv(metrics_out, index=False)
 
     print(f"Mentions out: {mentions_out} ({len(df):,} rows)")
     print(f"Edges out: {edges_out} ({len(edges):,} rows)")
     print(f"Nodes out: {nodes_out} ({len(nodes):,} rows)")
+    for name, table_out in spend_outs.items():
+        print(f"Rollup out: {table_out} ({len(spend_tables[name]):,} rows)")
+    print(f"Edge days out: {edge_days_out} ({len(edge_days):,} rows)")
+    print(f"Evidence out: {evidence_out} ({len(evidence):,} rows, {len(evidence_index):,} edges)")
     print(f"Metrics out: {metrics_out}")
     return 0
 
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""Replay simulated analyst sessions against the Week 3 Dash app and report latency.
+
+Starts the app's Flask `server` in a subprocess (or targets `--url`), then runs
+`--sessions` sessions on `--concurrency` threads. Each session loads the page
+and performs random actions that POST to `_dash-update-component`: party and
+node-type filter changes, slider drags, color/size mode switches,
+interaction-mode switches, zoom in level-of-detail mode, date-window
+changes, evidence-table paging, and typing into the entity search box.
+
+Node clicks and Clear Selection run in the browser (no request), so sessions
+apply them to their own `selected-seeds` state. Later requests carry that state,
+which exercises the server's selection overlay in both interaction modes. A
+click also moves the evidence panel to the clicked node, which is a request.
+Picking a search result is applied the same way, to the first option returned.
+Callback specs and defaults come from `_dash-dependencies` and `_dash-layout`,
+so requests match whatever the app currently declares.
+
+Default usage:
+    poetry run python scripts/week3_load_test_dash_app_v1_1.py --concurrency 8 --sessions 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+
+APPS_DIR = Path(__file__).resolve().parent.parent / "apps"
+
+SERVER_SNIPPET = """
+import logging
+import sys
+sys.path.insert(0, {apps_dir!r})
+from week3_attack_target_graph_dash import server
+logging.getLogger("werkzeug").setLevel(logging.WARNING)  # one access-log line per request otherwise
+server.run(host="127.0.0.1", port={port}, threaded=True, use_reloader=False)
+"""
+
+# Relative frequency of each session action.
+ACTION_WEIGHTS = {
+    "filter": 3,
+    "slider": 3,
+    "mode": 2,
+    "click": 4,
+    "interaction": 2,
+    "clear": 1,
+    "zoom": 1,
+    "evidence": 2,
+    "window": 2,
+    "search": 2,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the Week 3 v1.1 Dash app callbacks.")
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="Base URL of a running app (e.g. http://127.0.0.1:8050/); default starts one locally.",
+    )
+    parser.add_argument("--port", type=int, default=0, help="Port for the locally started app (0 = any free port).")
+    parser.add_argument("--concurrency", type=int, default=4, help="Sessions running at the same time.")
+    parser.add_argument("--sessions", type=int, default=20, help="Total sessions to run.")
+    parser.add_argument("--actions", type=int, default=15, help="Actions per session after the initial page load.")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Pause between a session's actions.")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for session actions.")
+    parser.add_argument("--startup-timeout", type=float, default=600.0, help="Seconds to wait for the local app.")
+    parser.add_argument("--json-out", default=None, help="Also write the report as JSON to this path.")
+    return parser.parse_args()
+
+
+class DashClient:
+    """Keep-alive HTTP client for one session (connections are not shared between threads)."""
+
+    def __init__(self, base_url: str) -> None:
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.base_path = parts.path if parts.path.endswith("/") else f"{parts.path}/"
+        self.conn = http.client.HTTPConnection(self.host, self.port, timeout=300)
+
+    def request(self, method: str, path: str, body: dict | None = None) -> tuple[int, bytes]:
+        payload = None if body is None else json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        try:
+            self.conn.request(method, self.base_path + path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            # Reconnect for the next request; the caller records this one as an error.
+            self.conn.close()
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=300)
+            raise
+
+    def get_json(self, path: str):
+        status, data = self.request("GET", path)
+        if status != 200:
+            raise RuntimeError(f"GET {path} returned {status}")
+        return json.loads(data)
+
+
+def layout_values(node, values: dict[str, dict[str, object]]) -> dict[str, dict[str, object]]:
+    """Props of every component with an id in a `_dash-layout` tree."""
+    if isinstance(node, list):
+        for child in node:
+            layout_values(child, values)
+    elif isinstance(node, dict) and "props" in node:
+        props = node["props"]
+        if isinstance(props.get("id"), str):
+            values[props["id"]] = props
+        layout_values(props.get("children"), values)
+    return values
+
+
+class AppSpec:
+    """Server-side callbacks and initial component props of the running app."""
+
+    def __init__(self, client: DashClient) -> None:
+        self.callbacks = [cb for cb in client.get_json("_dash-dependencies") if not cb.get("clientside_function")]
+        self.initial = layout_values(client.get_json("_dash-layout"), {})
+        if not self.callbacks:
+            raise RuntimeError("app declares no server-side callbacks")
+
+    def callback_for(self, prop_id: str) -> dict:
+        for cb in self.callbacks:
+            if any(f"{dep['id']}.{dep['property']}" == prop_id for dep in cb["inputs"]):
+                return cb
+        raise KeyError(prop_id)
+
+
+def callback_name(callback: dict) -> str:
+    # Outputs identify a Dash callback; the first one is enough to tell them apart here.
+    return callback["output"].strip(".").split("...")[0]
+
+
+def callback_body(callback: dict, state: dict[str, object], changed: list[str]) -> dict:
+    def deps(items: list[dict]) -> list[dict]:
+        return [{"id": d["id"], "property": d["property"], "value": state.get(f"{d['id']}.{d['property']}")} for d in items]
+
+    outputs = [
+        {"id": spec.split(".")[0], "property": spec.split(".", 1)[1].split("@")[0]}
+        for spec in callback["output"].strip(".").split("...")
+    ]
+    return {
+        "output": callback["output"],
+        "outputs": outputs if len(outputs) > 1 else outputs[0],
+        "inputs": deps(callback["inputs"]),
+        "state": deps(callback["state"]),
+        "changedPropIds": changed,
+    }
+
+
+class Results:
+    def __init__(self) -> None:
+        self.latency: defaultdict[str, list[float]] = defaultdict(list)
+        self.payload: defaultdict[str, list[int]] = defaultdict(list)
+        self.errors: defaultdict[str, list[str]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def add(self, label: str, seconds: float, payload: int, error: str | None) -> None:
+        with self._lock:
+            self.latency[label].append(seconds)
+            self.payload[label].append(payload)
+            if error is not None:
+                self.errors[label].append(error)
+
+
+class Session:
+    def __init__(self, base_url: str, spec: AppSpec, rng: random.Random, results: Results) -> None:
+        self.client = DashClient(base_url)
+        self.spec = spec
+        self.rng = rng
+        self.results = results
+        self.state = {
+            f"{cid}.{prop}": props.get(prop)
+            for cid, props in spec.initial.items()
+            for prop in ("value", "data")
+            if prop in props
+        }
+        self.state.setdefault("selected-seeds.data", [])
+        self.nodes: list[dict[str, str]] = []
+        self.options: list[dict[str, str]] = []
+        self.extent: tuple[float, float, float, float] | None = None
+
+    def send(self, action: str, changed: list[str]) -> None:
+        callback = self.spec.callback_for(changed[0]) if changed else self.spec.callbacks[0]
+        label = f"{callback_name(callback)}[{action}]"
+        started = time.perf_counter()
+        error = None
+        payload = 0
+        try:
+            status, data = self.client.request("POST", "_dash-update-component", callback_body(callback, self.state, changed))
+            payload = len(data)
+            if status == 200:
+                self.observe(json.loads(data).get("response", {}))
+            elif status != 204:  # 204 = PreventUpdate
+                error = f"HTTP {status}"
+        except (OSError, http.client.HTTPException, ValueError) as exc:
+            error = type(exc).__name__
+        self.results.add(label, time.perf_counter() - started, payload, error)
+
+    def observe(self, response: dict) -> None:
+        """Remember visible nodes and extent from a returned figure, for clicks and zooms."""
+        if "evidence-table" in response:
+            # The server resets or clamps the page.
+            self.state["evidence-table.page_current"] = response["evidence-table"].get("page_current")
+        if "entity-search" in response:
+            self.options = response["entity-search"].get("options") or []
+        figure = response.get("attack-target-graph", {}).get("figure")
+        if not figure:
+            return
+        nodes, xs, ys = [], [], []
+        for trace in figure.get("data", []):
+            # Node traces carry [name, type]; edge hover points [sponsor, target, "edge"].
+            if trace.get("customdata") and trace.get("mode") == "markers" and len(trace["customdata"][0]) == 2:
+                nodes += [{"name": cd[0], "type": cd[1]} for cd in trace["customdata"]]
+                xs += trace.get("x", [])
+                ys += trace.get("y", [])
+        self.nodes = nodes
+        self.extent = (min(xs), max(xs), min(ys), max(ys)) if xs else None
+
+    def set(self, prop_id: str, value: object) -> list[str]:
+        self.state[prop_id] = value
+        return [prop_id]
+
+    def act(self, action: str) -> None:
+        rng, initial = self.rng, self.spec.initial
+        if action == "filter":
+            prop = rng.choice(["sponsor-party-filter", "target-party-filter", "node-type-visible"])
+            options = [o["value"] for o in initial[prop].get("options", [])]
+            picked = rng.sample(options, rng.randint(1, len(options))) if options else []
+            self.send(action, self.set(f"{prop}.value", picked))
+        elif action == "slider":
+            slider = initial["min-edge-mentions"]
+            current = int(self.state["min-edge-mentions.value"] or slider["min"])
+            goal = rng.randint(int(slider["min"]), int(slider["max"]))
+            # A drag can be released and re-grabbed on the way to its goal.
+            for value in dict.fromkeys(current + round((goal - current) * k / 3) for k in range(1, 4)):
+                if value != current:
+                    self.send(action, self.set("min-edge-mentions.value", value))
+        elif action == "mode":
+            prop = rng.choice(["color-mode", "size-mode"])
+            options = [o["value"] for o in initial[prop]["options"] if o["value"] != self.state[f"{prop}.value"]]
+            self.send(action, self.set(f"{prop}.value", rng.choice(options)))
+        elif action == "click":
+            # Clientside: only the seeds state changes, as `selectClickedNode` would do.
+            if self.nodes:
+                node, seeds = rng.choice(self.nodes), list(self.state["selected-seeds.data"] or [])
+                if self.state["interaction-mode.value"] == "accumulate":
+                    seeds = [s for s in seeds if s != node] if node in seeds else seeds + [node]
+                else:
+                    seeds = [] if seeds[:1] == [node] else [node]
+                self.state["selected-seeds.data"] = seeds
+                focus = node if node in seeds else (seeds[-1] if seeds else None)
+                self.send(action, self.set("evidence-focus.data", focus))
+        elif action == "search":
+            if self.nodes:
+                # One request per keystroke of a name's first few characters, then pick the top option.
+                name = rng.choice(self.nodes)["name"]
+                self.options = []
+                for length in range(1, min(len(name), rng.randint(3, 8)) + 1):
+                    self.send(action, self.set("entity-search.search_value", name[:length]))
+                if self.options:
+                    node_type, _, node_name = self.options[0]["value"].partition(":")
+                    node, seeds = {"name": node_name, "type": node_type}, list(self.state["selected-seeds.data"] or [])
+                    if node not in seeds:
+                        seeds = seeds + [node] if self.state["interaction-mode.value"] == "accumulate" else [node]
+                    self.state["selected-seeds.data"] = seeds
+                    self.send(action, self.set("evidence-focus.data", node))
+        elif action == "clear":
+            self.state["selected-seeds.data"] = []
+            self.send(action, self.set("evidence-focus.data", None))
+        elif action == "window":
+            slider = initial["date-window"]
+            if not slider.get("disabled"):
+                lo, hi = int(slider["min"]), int(slider["max"])
+                first, last = sorted(rng.randint(lo, hi) for _ in range(2))
+                # Sometimes back to the whole cycle, which uses the unwindowed weights.
+                self.send(action, self.set("date-window.value", [lo, hi] if rng.random() < 0.2 else [first, last]))
+        elif action == "evidence":
+            if self.state.get("evidence-focus.data"):
+                # Mostly the next pages, sometimes a jump; the server clamps past the last page.
+                page = int(self.state.get("evidence-table.page_current") or 0)
+                page = page + 1 if rng.random() < 0.7 else rng.randint(0, page + 20)
+                self.send(action, self.set("evidence-table.page_current", page))
+        elif action == "interaction":
+            mode = "accumulate" if self.state["interaction-mode.value"] == "highlight" else "highlight"
+            self.send(action, self.set("interaction-mode.value", mode))
+        elif action == "zoom":
+            if self.state.get("level-of-detail.value") != ["on"]:
+                self.send("detail", self.set("level-of-detail.value", ["on"]))
+            if self.extent is not None and rng.random() < 0.8:
+                x0, x1, y0, y1 = self.extent
+                fx, fy = sorted(rng.random() for _ in range(2)), sorted(rng.random() for _ in range(2))
+                viewport = {
+                    "x": [x0 + (x1 - x0) * fx[0], x0 + (x1 - x0) * fx[1]],
+                    "y": [y0 + (y1 - y0) * fy[0], y0 + (y1 - y0) * fy[1]],
+                }
+            else:
+                viewport = None  # double-click back to the overview
+            self.send(action, self.set("viewport.data", viewport))
+
+    def run(self, actions: int, think_s: float) -> None:
+        self.send("initial", [])
+        names, weights = zip(*ACTION_WEIGHTS.items())
+        for action in self.rng.choices(names, weights=weights, k=actions):
+            if think_s > 0:
+                time.sleep(think_s)
+            self.act(action)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_local_app(port: int, timeout: float) -> tuple[subprocess.Popen, str]:
+    port = port or free_port()
+    process = subprocess.Popen([sys.executable, "-c", SERVER_SNIPPET.format(apps_dir=str(APPS_DIR), port=port)])
+    base_url = f"http://127.0.0.1:{port}/"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"app exited with code {process.returncode} during startup")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return process, base_url
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise TimeoutError(f"app did not listen on port {port} within {timeout:.0f}s")
+
+
+def report(results: Results, elapsed: float) -> dict[str, dict[str, float]]:
+    rows = {}
+    everything = []
+    for label in sorted(results.latency):
+        latency = np.asarray(results.latency[label]) * 1000
+        everything.append(latency)
+        p50, p95, p99 = np.percentile(latency, [50, 95, 99])
+        rows[label] = {
+            "requests": len(latency),
+            "errors": len(results.errors[label]),
+            "rps": len(latency) / elapsed,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
+            "mean_kb": float(np.mean(results.payload[label])) / 1024,
+        }
+    if everything:
+        latency = np.concatenate(everything)
+        p50, p95, p99 = np.percentile(latency, [50, 95, 99])
+        rows["all"] = {
+            "requests": len(latency),
+            "errors": sum(len(errors) for errors in results.errors.values()),
+            "rps": len(latency) / elapsed,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
+            "mean_kb": float(np.mean(np.concatenate([results.payload[k] for k in results.payload]))) / 1024,
+        }
+
+    width = max(len(label) for label in rows) if rows else 10
+    print(f"{'callback[action]':<{width}}  {'reqs':>6} {'errs':>5} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'KB':>7}")
+    for label, row in rows.items():
+        print(
+            f"{label:<{width}}  {row['requests']:>6} {row['errors']:>5} {row['rps']:>7.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['mean_kb']:>7.0f}"
+        )
+    for label, errors in sorted(results.errors.items()):
+        if errors:
+            kinds = {kind: errors.count(kind) for kind in sorted(set(errors))}
+            print(f"errors {label}: {kinds}")
+    return rows
+
+
+def main() -> int:
+    args = parse_args()
+    process = None
+    base_url = args.url
+    if base_url is None:
+        process, base_url = start_local_app(args.port, args.startup_timeout)
+    try:
+        spec = AppSpec(DashClient(base_url))
+        results = Results()
+        seeds = random.Random(args.seed)
+        sessions = [Session(base_url, spec, random.Random(seeds.random()), results) for _ in range(args.sessions)]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(args.concurrency, 1)) as pool:
+            for future in [pool.submit(s.run, args.actions, args.think_ms / 1000) for s in sessions]:
+                future.result()
+        elapsed = time.perf_counter() - started
+
+        print(f"target: {base_url}")
+        print(f"sessions: {args.sessions} x {args.actions} actions at concurrency {args.concurrency}, {elapsed:.1f}s")
+        rows = report(results, elapsed)
+        if args.json_out:
+            Path(args.json_out).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())